@@ -1,12 +1,12 @@
 """
 Alert Service - Servicio de background para gestión de alertas
 
-Este servicio corre en background usando QTimer y revisa periódicamente
-si hay alertas que deben dispararse.
+Este servicio corre en background usando un QTimer de un solo disparo
+programado para la próxima alerta pendiente.
 
 Versión SIMPLIFICADA:
-- QTimer cada 60 segundos (no QThread)
-- Revisa alertas pendientes próximas (5 minutos adelante)
+- QTimer single-shot hasta la alerta más próxima (no QThread, sin polling)
+- reschedule() recalcula el timer cuando se crean/editan/eliminan alertas
 - Emite señal cuando hay alertas para disparar
 - Marca alertas como 'triggered' después de disparar
 - Registra en historial
@@ -23,46 +23,47 @@ class AlertService(QObject):
     """
     Servicio simple de alertas con QTimer
 
-    Revisa cada 60 segundos si hay alertas pendientes que deben dispararse.
+    Duerme hasta la hora de la próxima alerta pendiente y entonces la dispara.
     Cuando encuentra una, emite la señal alert_triggered.
     """
 
+    # Espera máxima entre recálculos (por si cambia el reloj del sistema)
+    MAX_WAIT_MS = 24 * 60 * 60 * 1000
+
     # Señal emitida cuando se dispara una alerta
     # Parámetros: (alerta: Dict, item: Dict)
     alert_triggered = pyqtSignal(dict, dict)
 
-    def __init__(self, db_manager, check_interval: int = 60000):
+    def __init__(self, db_manager):
         """
         Inicializar servicio de alertas
 
         Args:
             db_manager: Instancia de DBManager
-            check_interval: Intervalo de chequeo en milisegundos (default: 60000 = 1 minuto)
         """
         super().__init__()
         self.db = db_manager
-        self.check_interval = check_interval
 
-        # QTimer para chequeos periódicos
+        # QTimer de un solo disparo hasta la próxima alerta
         self.timer = QTimer()
-        self.timer.timeout.connect(self.check_alerts)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._fire_due)
 
         # Estado
         self.is_running = False
         self.alerts_checked = 0
         self.alerts_triggered = 0
 
-        logger.info(f"AlertService inicializado (intervalo: {check_interval}ms)")
+        logger.info("AlertService inicializado")
 
     def start(self):
         """Iniciar el servicio de alertas"""
         if not self.is_running:
-            self.timer.start(self.check_interval)
             self.is_running = True
             logger.info("AlertService iniciado")
 
-            # Chequear inmediatamente al iniciar
-            self.check_alerts()
+            # Chequear inmediatamente al iniciar y programar la próxima alerta
+            self._fire_due()
         else:
             logger.warning("AlertService ya está corriendo")
 
@@ -79,8 +80,8 @@ class AlertService(QObject):
         """
         Revisar alertas pendientes y disparar las que correspondan
 
-        Este método se ejecuta periódicamente cada vez que el timer expira.
-        Busca alertas activas cuya hora de disparo esté en los próximos 5 minutos.
+        Este método se ejecuta cada vez que el timer expira.
+        Busca alertas activas cuya hora de disparo ya llegó (o llega en el próximo minuto).
         """
         try:
             self.alerts_checked += 1
@@ -125,18 +126,29 @@ class AlertService(QObject):
         except Exception as e:
             logger.error(f"Error en check_alerts: {e}", exc_info=True)
 
-    def set_check_interval(self, interval_ms: int):
+    def reschedule(self):
         """
-        Cambiar el intervalo de chequeo
+        Reprogramar el timer para la próxima alerta pendiente
 
-        Args:
-            interval_ms: Nuevo intervalo en milisegundos
+        Debe llamarse cuando se crean, editan, descartan o eliminan alertas.
         """
-        self.check_interval = interval_ms
+        if not self.is_running:
+            return
 
-        if self.is_running:
-            self.timer.setInterval(interval_ms)
-            logger.info(f"Intervalo de chequeo actualizado a {interval_ms}ms")
+        delay_ms = self.db.get_next_alert_delay()
+        if delay_ms is None:
+            self.timer.stop()
+            logger.debug("No hay alertas futuras, timer detenido")
+            return
+
+        delay_ms = min(max(0, delay_ms), self.MAX_WAIT_MS)
+        self.timer.start(delay_ms)
+        logger.debug(f"Próximo chequeo de alertas en {delay_ms}ms")
+
+    def _fire_due(self):
+        """Disparar las alertas vencidas y programar la siguiente"""
+        self.check_alerts()
+        self.reschedule()
 
     def get_stats(self) -> Dict:
         """
@@ -147,7 +159,7 @@ class AlertService(QObject):
         """
         return {
             'is_running': self.is_running,
-            'check_interval_ms': self.check_interval,
+            'next_check_ms': self.timer.remainingTime() if self.timer.isActive() else None,
             'alerts_checked': self.alerts_checked,
             'alerts_triggered': self.alerts_triggered
         }
@@ -155,4 +167,4 @@ class AlertService(QObject):
     def force_check(self):
         """Forzar chequeo inmediato de alertas (útil para testing)"""
         logger.debug("Forzando chequeo de alertas...")
-        self.check_alerts()
+        self._fire_due()
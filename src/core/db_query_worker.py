@@ -0,0 +1,44 @@
+"""
+DB Query Worker - Ejecuta consultas de solo lectura en un hilo de background
+
+Usa la conexión secundaria de DBManager (reutilizada entre consultas)
+para no bloquear el hilo de la GUI ni compartir la conexión principal.
+"""
+
+import logging
+from PyQt6.QtCore import QThread, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class DBQueryWorker(QThread):
+    """Worker thread que ejecuta query_fn(conn) y emite su resultado"""
+
+    result_ready = pyqtSignal(int, object)  # (request_id, result)
+    error = pyqtSignal(int, str)  # (request_id, message)
+
+    def __init__(self, db_manager, query_fn, request_id: int = 0, parent=None):
+        """
+        Inicializar worker
+
+        Args:
+            db_manager: Instancia de DBManager
+            query_fn: Callable que recibe una conexión y devuelve el resultado
+                (no debe tocar widgets, se ejecuta fuera del hilo de la GUI)
+            request_id: Identificador para descartar resultados obsoletos
+            parent: QObject padre
+        """
+        super().__init__(parent)
+        self.db = db_manager
+        self.query_fn = query_fn
+        self.request_id = request_id
+
+    def run(self):
+        """Ejecuta la consulta"""
+        try:
+            with self.db.background_connection() as conn:
+                result = self.query_fn(conn)
+            self.result_ready.emit(self.request_id, result)
+        except Exception as e:
+            logger.error(f"Error in query worker: {e}", exc_info=True)
+            self.error.emit(self.request_id, str(e))
@@ -15,14 +15,19 @@ class GlobalTagManager:
     Adapts DBManager's tag methods to return ProjectElementTag objects.
     """
 
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, cache_lookups: bool = False):
         """
         Initialize with a DBManager instance.
         
         Args:
             db_manager: Instance of DBManager
+            cache_lookups: Memoize get_tag_by_name() for the lifetime of this
+                manager. Only for short-lived owners (e.g. a dialog): tags
+                changed elsewhere are not seen while the cache lives.
         """
         self.db = db_manager
+        # Cache of name lookups (None when caching is disabled)
+        self._tags_by_name: Optional[Dict[str, ProjectElementTag]] = {} if cache_lookups else None
 
     def search_tags(self, query: str) -> List[ProjectElementTag]:
         """
@@ -102,7 +107,10 @@ class GlobalTagManager:
                 # Update color if provided and different from default?
                 # Or just ensure it has the color.
                 self.db.update_tag(tag_id, color=color, description=description)
-                return self.get_tag(tag_id)
+                tag = self.get_tag(tag_id)
+                if tag and self._tags_by_name is not None:
+                    self._tags_by_name[tag.name] = tag
+                return tag
             return None
 
         except Exception as e:
@@ -139,10 +147,18 @@ class GlobalTagManager:
         Returns:
             ProjectElementTag object or None
         """
+        if self._tags_by_name is not None:
+            tag = self._tags_by_name.get(name)
+            if tag is not None:
+                return tag
+
         try:
             row = self.db.get_tag_by_name(name)
             if row:
-                return self._dict_to_tag(row)
+                tag = self._dict_to_tag(row)
+                if self._tags_by_name is not None:
+                    self._tags_by_name[name] = tag
+                return tag
             return None
         except Exception as e:
             logger.error(f"Error getting global tag by name {name}: {e}")
@@ -5,11 +5,12 @@ Manages SQLite database operations for settings, categories, items, and clipboar
 
 import sqlite3
 import json
+import threading
 import logging
 import uuid
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from contextlib import contextmanager
 
 
@@ -17,6 +18,11 @@ from contextlib import contextmanager
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Item picker queries (constant SQL text so the statement cache reuses them)
+_ITEM_LABELS_SQL = "SELECT id, label FROM items ORDER BY label"
+_ITEM_LABEL_SQL = "SELECT label FROM items WHERE id = ?"
+_ITEMS_SIGNATURE_SQL = "SELECT COUNT(*), MAX(id) FROM items"
+
 
 class DBManager:
     """Gestor de base de datos SQLite para Widget Sidebar"""
@@ -30,7 +36,10 @@ class DBManager:
         """
         self.db_path = Path(db_path)
         self.connection = None
+        self._background_connection = None  # Shared by worker threads
+        self._background_lock = threading.Lock()
         self._fts5_available = None  # Caché para verificación de FTS5
+        self.items_version = 0  # Se incrementa al crear/renombrar/eliminar items
         self._ensure_database()
         logger.info(f"Database initialized at: {self.db_path}")
 
@@ -43,6 +52,19 @@ class DBManager:
             self._create_database()
         else:
             logger.info("Database already exists")
+            self._ensure_alert_indexes()
+
+    def _ensure_alert_indexes(self):
+        """Create item_alerts indexes on databases created before they were added"""
+        try:
+            conn = self.connect()
+            conn.executescript("""
+                CREATE INDEX IF NOT EXISTS idx_item_alerts_item ON item_alerts(item_id);
+                CREATE INDEX IF NOT EXISTS idx_item_alerts_status_datetime ON item_alerts(status, is_enabled, alert_datetime);
+            """)
+        except sqlite3.OperationalError as e:
+            # item_alerts does not exist yet (migration 006 pending)
+            logger.debug("Skipping item_alerts indexes: %s", e)
 
     def connect(self) -> sqlite3.Connection:
         """
@@ -52,17 +74,56 @@ class DBManager:
             sqlite3.Connection: Database connection
         """
         if self.connection is None:
-            self.connection = sqlite3.connect(
-                self.db_path,
-                check_same_thread=False
-            )
-            self.connection.row_factory = sqlite3.Row
-            # Enable foreign keys
-            self.connection.execute("PRAGMA foreign_keys = ON")
+            self.connection = self._open_connection()
         return self.connection
 
+    @contextmanager
+    def background_connection(self):
+        """
+        Context manager giving worker threads a long-lived secondary connection
+
+        The connection (and its prepared statement cache) is reused across
+        background queries; the lock lets only one worker use it at a time.
+        In-memory databases cannot be shared between connections, so the
+        main connection is used for them instead.
+
+        Usage:
+            with db.background_connection() as conn:
+                conn.execute(...)
+        """
+        with self._background_lock:
+            if self._background_connection is None:
+                if str(self.db_path) == ":memory:":
+                    self._background_connection = self.connect()
+                else:
+                    self._background_connection = self._open_connection()
+            yield self._background_connection
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open and configure a new SQLite connection"""
+        connection = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=128
+        )
+        connection.row_factory = sqlite3.Row
+        # Enable foreign keys
+        connection.execute("PRAGMA foreign_keys = ON")
+        # ~16 MB page cache and in-memory temp tables for sorts/joins
+        connection.execute("PRAGMA cache_size = -16000")
+        connection.execute("PRAGMA temp_store = MEMORY")
+        # WAL: background readers don't block (nor are blocked by) main-thread writes
+        if str(self.db_path) != ":memory:":
+            connection.execute("PRAGMA journal_mode = WAL")
+        return connection
+
     def close(self):
         """Close database connection"""
+        with self._background_lock:
+            if self._background_connection is not None:
+                if self._background_connection is not self.connection:
+                    self._background_connection.close()
+                self._background_connection = None
         if self.connection:
             self.connection.close()
             self.connection = None
@@ -958,6 +1019,8 @@ class DBManager:
                 CREATE INDEX IF NOT EXISTS idx_calendar_events_status ON calendar_events(status);
 
                 -- Índices para alertas
+                CREATE INDEX IF NOT EXISTS idx_item_alerts_item ON item_alerts(item_id);
+                CREATE INDEX IF NOT EXISTS idx_item_alerts_status_datetime ON item_alerts(status, is_enabled, alert_datetime);
                 CREATE INDEX IF NOT EXISTS idx_alert_history_item ON alert_history(item_id);
                 CREATE INDEX IF NOT EXISTS idx_alert_history_triggered ON alert_history(triggered_at DESC);
 
@@ -2084,6 +2147,48 @@ class DBManager:
             return item
         return None
 
+    def get_item_labels(self) -> List[Tuple[int, str]]:
+        """
+        Get (id, label) pairs of all items ordered by label (for item pickers)
+
+        The SQL text is a constant, so the connection's statement cache
+        reuses the compiled statement on every call.
+
+        Returns:
+            List[Tuple[int, str]]: (id, label) pairs
+        """
+        cursor = self.connect().execute(_ITEM_LABELS_SQL)
+        return [tuple(row) for row in cursor.fetchall()]
+
+    def get_items_cache_key(self) -> Tuple:
+        """
+        Get a key that changes whenever the item list may have changed
+
+        Combines items_version (bumped by add_item/update_item/delete_item)
+        with a cheap count/max query, so writes that bypass those methods
+        (delete_list, add_table_items, category cascades, other connections)
+        also invalidate caches built from get_item_labels(). Item ids are
+        AUTOINCREMENT, so any insert or delete changes the count or max id.
+
+        Returns:
+            Tuple: (items_version, count, max id)
+        """
+        row = self.connect().execute(_ITEMS_SIGNATURE_SQL).fetchone()
+        return (self.items_version, *tuple(row))
+
+    def get_item_label(self, item_id: int) -> Optional[str]:
+        """
+        Get the label of a single item
+
+        Args:
+            item_id: Item ID
+
+        Returns:
+            Optional[str]: Item label or None if the item does not exist
+        """
+        row = self.connect().execute(_ITEM_LABEL_SQL, (item_id,)).fetchone()
+        return row[0] if row else None
+
     def get_all_items(self, active_only: bool = False, include_archived: bool = True) -> List[Dict]:
         """
         Get all items from all categories
@@ -2268,6 +2373,7 @@ class DBManager:
              file_size, file_type, file_extension, original_filename, file_hash, preview_url,
              table_id, orden_table, created_at_value)
         )
+        self.items_version += 1
 
         # Create tag relationships using relational structure
         if tags_to_create:
@@ -2324,6 +2430,8 @@ class DBManager:
             params.append(item_id)
             query = f"UPDATE items SET {', '.join(updates)} WHERE id = ?"
             self.execute_update(query, tuple(params))
+            if 'label' in kwargs:
+                self.items_version += 1
             logger.info(f"Item updated: ID {item_id}")
 
         # Update tags using relational structure
@@ -2352,6 +2460,7 @@ class DBManager:
         # Delete item (CASCADE will remove item_tags relationships)
         query = "DELETE FROM items WHERE id = ?"
         self.execute_update(query, (item_id,))
+        self.items_version += 1
         logger.info(f"Item deleted: ID {item_id}")
 
     # ==================== Table CRUD Operations ====================
@@ -9989,19 +10098,21 @@ class DBManager:
             logger.error(f"Error al obtener eventos del item {item_id}: {e}")
             return []
 
-    def get_events_by_month(self, year: int, month: int) -> List[Dict]:
+    def get_events_by_month(self, year: int, month: int,
+                            conn: Optional[sqlite3.Connection] = None) -> List[Dict]:
         """
         Obtener eventos de un mes específico
 
         Args:
             year: Año (ej: 2025)
             month: Mes (1-12)
+            conn: Conexión a usar (por defecto la conexión principal)
 
         Returns:
             Lista de eventos del mes
         """
         try:
-            conn = self.connect()
+            conn = conn or self.connect()
             cursor = conn.cursor()
 
             # Crear rango de fechas para el mes
@@ -10236,7 +10347,8 @@ class DBManager:
         alert_title: Optional[str] = None,
         alert_message: Optional[str] = None,
         calendar_event_id: Optional[int] = None,
-        priority: str = 'medium'
+        priority: str = 'medium',
+        is_enabled: int = 1
     ) -> int:
         """
         Crear una nueva alerta para un item
@@ -10248,6 +10360,7 @@ class DBManager:
             alert_message: Mensaje de la alerta (opcional)
             calendar_event_id: ID del evento asociado (opcional)
             priority: Prioridad (low/medium/high/critical)
+            is_enabled: 1 si la alerta está habilitada, 0 si no
 
         Returns:
             int: ID de la alerta creada
@@ -10259,10 +10372,10 @@ class DBManager:
                 cursor.execute("""
                     INSERT INTO item_alerts (
                         item_id, calendar_event_id, alert_datetime,
-                        alert_title, alert_message, priority
-                    ) VALUES (?, ?, ?, ?, ?, ?)
+                        alert_title, alert_message, priority, is_enabled
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
                 """, (item_id, calendar_event_id, alert_datetime,
-                      alert_title, alert_message, priority))
+                      alert_title, alert_message, priority, is_enabled))
 
                 alert_id = cursor.lastrowid
                 logger.info(f"Alerta creada: ID={alert_id}, item_id={item_id}")
@@ -10363,6 +10476,33 @@ class DBManager:
             logger.error(f"Error al obtener alertas pendientes: {e}")
             return []
 
+    def get_next_alert_delay(self) -> Optional[int]:
+        """
+        Obtener los milisegundos que faltan para la próxima alerta pendiente
+
+        Solo considera alertas activas y habilitadas cuya hora aún no ha llegado;
+        las vencidas las recoge get_pending_alerts().
+
+        Returns:
+            Milisegundos hasta la próxima alerta, o None si no hay ninguna
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT (julianday(MIN(alert_datetime)) - julianday('now')) * 86400000
+                FROM item_alerts
+                WHERE status = 'active'
+                  AND is_enabled = 1
+                  AND alert_datetime > datetime('now')
+            """)
+            delay_ms = cursor.fetchone()[0]
+            return int(delay_ms) if delay_ms is not None else None
+
+        except Exception as e:
+            logger.error(f"Error al obtener la próxima alerta: {e}")
+            return None
+
     def update_item_alert(self, alert_id: int, **kwargs) -> bool:
         """
         Actualizar una alerta
@@ -18,6 +18,19 @@ class ItemType(Enum):
 class Item:
     """Model representing a clipboard item"""
 
+    # Fixed attribute layout: smaller instances and faster attribute access.
+    # The category_*/use_count slots are filled in by views that decorate
+    # items with search/category metadata after construction.
+    __slots__ = (
+        'id', 'label', 'content', 'type', 'icon', 'is_sensitive', 'is_favorite',
+        'tags', 'description', 'working_dir', 'color', 'is_active', 'is_archived',
+        'list_id', 'orden_lista', 'is_list', 'list_group',
+        'is_component', 'name_component', 'component_config',
+        'file_size', 'file_type', 'file_extension', 'original_filename', 'file_hash',
+        'table_id', 'orden_table', 'created_at', 'last_used',
+        'use_count', 'category_id', 'category_name', 'category_icon', 'category_color'
+    )
+
     def __init__(
         self,
         item_id: str,
@@ -0,0 +1,36 @@
+"""
+App Stylesheet - Hojas de estilo instaladas una sola vez en la QApplication
+
+Los diálogos que se abren a menudo acotan sus reglas a su objectName
+(p. ej. "#eventEditorDialog QLineEdit") y las añaden a la hoja global la
+primera vez que se construyen, en lugar de llamar a setStyleSheet en cada
+instancia (Qt vuelve a parsear la hoja en cada llamada).
+"""
+from PyQt6.QtWidgets import QApplication
+
+
+def install_app_stylesheet(name: str, qss: str) -> bool:
+    """
+    Añadir qss a la hoja de estilo de la aplicación si aún no se añadió
+
+    La marca se guarda como propiedad dinámica de la QApplication, así
+    sobrevive aunque el módulo se importe por dos rutas distintas.
+
+    Args:
+        name: Identificador de la hoja (normalmente el objectName del diálogo)
+        qss: Reglas QSS acotadas al objectName
+
+    Returns:
+        True si se instaló ahora, False si ya estaba instalada o no hay app
+    """
+    app = QApplication.instance()
+    if app is None:
+        return False
+
+    installed_flag = f"qssInstalled_{name}"
+    if app.property(installed_flag):
+        return False
+
+    app.setStyleSheet(app.styleSheet() + qss)
+    app.setProperty(installed_flag, True)
+    return True
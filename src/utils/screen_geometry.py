@@ -0,0 +1,64 @@
+"""
+Screen Geometry - Cached available geometry of the primary screen
+
+Windows and popups that position themselves on every show read the
+geometry from here instead of querying the platform plugin each time.
+The cache is dropped when screens are added/removed, the primary screen
+changes, or its available area changes (resolution, taskbar).
+"""
+from PyQt6.QtCore import QRect
+from PyQt6.QtGui import QGuiApplication
+
+_available_geometry = None
+_watched_screen = None
+_app_signals_connected = False
+
+
+def invalidate_available_geometry(*args):
+    """Forget the cached screen geometry"""
+    global _available_geometry
+    _available_geometry = None
+
+
+def _watch_primary_screen(screen):
+    """Invalidate the cache when the given primary screen's area changes"""
+    global _watched_screen
+    if screen is None or screen is _watched_screen:
+        return
+    if _watched_screen is not None:
+        try:
+            _watched_screen.availableGeometryChanged.disconnect(invalidate_available_geometry)
+        except (TypeError, RuntimeError):
+            pass  # Screen already gone
+    screen.availableGeometryChanged.connect(invalidate_available_geometry)
+    _watched_screen = screen
+
+
+def _on_primary_screen_changed(screen):
+    """Follow the new primary screen"""
+    invalidate_available_geometry()
+    _watch_primary_screen(screen)
+
+
+def get_available_geometry() -> QRect:
+    """
+    Get the primary screen's available geometry (cached)
+
+    Returns:
+        QRect: Available geometry, empty if there is no screen
+    """
+    global _available_geometry, _app_signals_connected
+    if not _app_signals_connected:
+        app = QGuiApplication.instance()
+        app.screenAdded.connect(invalidate_available_geometry)
+        app.screenRemoved.connect(invalidate_available_geometry)
+        app.primaryScreenChanged.connect(_on_primary_screen_changed)
+        _app_signals_connected = True
+
+    if _available_geometry is None:
+        screen = QGuiApplication.primaryScreen()
+        if screen is None:
+            return QRect()
+        _watch_primary_screen(screen)
+        _available_geometry = screen.availableGeometry()
+    return _available_geometry
@@ -10,6 +10,7 @@ from PyQt6.QtGui import QFont, QColor
 import sys
 from pathlib import Path
 from collections import defaultdict
+from types import SimpleNamespace
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.models.item import Item, ItemType
@@ -17,6 +18,40 @@ from src.models.item import Item, ItemType
 import logging
 logger = logging.getLogger(__name__)
 
+# Role holding the result id on item nodes. Reading it avoids copying the
+# whole result dict out of the UserRole QVariant on every double-click.
+RESULT_ID_ROLE = Qt.ItemDataRole.UserRole + 1
+
+# (label prefix, type suffix) indexed by is_favorite | is_sensitive << 1
+_FLAG_DECOR = {0: ('', ''), 1: ('⭐ ', ''), 2: ('', ' 🔒'), 3: ('⭐ ', ' 🔒')}
+
+_TYPE_COLORS = {
+    'CODE': '#4ec9b0',  # Teal
+    'URL': '#569cd6',   # Blue
+    'PATH': '#dcdcaa',  # Yellow
+    'TEXT': '#d4d4d4',  # White
+    'IMAGE': '#c586c0', # Purple
+    'PDF': '#ce9178',   # Orange
+}
+
+# Shared QColor instances so rows don't build a new one per setForeground
+_TYPE_QCOLORS = {item_type: QColor(color) for item_type, color in _TYPE_COLORS.items()}
+_TAGS_QCOLOR = QColor('#f093fb')
+
+
+def _normalize_tags(tags):
+    """
+    Return a result's tags as a new list of stripped, non-empty names
+
+    Accepts the relational list format and the legacy CSV string. The
+    result dict itself is never modified: it is shared with other views.
+    """
+    if not tags:
+        return []
+    if isinstance(tags, str):
+        tags = tags.split(',')
+    return [tag.strip() for tag in tags if tag and tag.strip()]
+
 
 class ResultsTreeView(QWidget):
     """
@@ -36,10 +71,16 @@ class ResultsTreeView(QWidget):
     # Signal emitted when an item is clicked
     item_clicked = pyqtSignal(object)
 
+    # Max share of changed rows (vs. total) still applied in place
+    INCREMENTAL_UPDATE_RATIO = 0.1
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.results = []
         self.category_items = {}  # category_id -> QTreeWidgetItem
+        self._results_by_id = {}  # result id -> result dict
+        self._item_nodes = {}  # result id -> QTreeWidgetItem
+        self._collapsed_categories = set()  # category ids the user collapsed
 
         self.init_ui()
 
@@ -130,15 +171,52 @@ class ResultsTreeView(QWidget):
         """
         Update the tree with new results
 
+        Small changes (a few rows added/removed/modified) are applied in
+        place; anything larger falls back to a full rebuild. Collapsed
+        categories stay collapsed across both paths.
+
         Args:
             results: List of result dictionaries from AdvancedSearchEngine
         """
-        logger.info(f"Updating tree view with {len(results)} results")
+        logger.info("Updating tree view with %d results", len(results))
+
+        self._remember_expansion()
+
+        old_results = self.results
+        old_by_id = self._results_by_id
+        self.results = results
+        self._results_by_id = {result.get('id'): result for result in results}
+
+        try:
+            if self._apply_results_diff(old_results, old_by_id, results):
+                return
+        except Exception as e:
+            logger.error("Error updating tree in place, rebuilding: %s", e, exc_info=True)
+
+        self._rebuild_tree(results)
 
-        # Clear tree
+    def _remember_expansion(self):
+        """Record which categories the user left collapsed"""
+        collapsed = {
+            category_id for category_id, category_item in self.category_items.items()
+            if not category_item.isExpanded()
+        }
+        self._collapsed_categories = (
+            self._collapsed_categories - self.category_items.keys()
+        ) | collapsed
+
+    def _group_by_category(self, results):
+        """Group results by category id, keeping result order within each group"""
+        category_groups = defaultdict(list)
+        for result in results:
+            category_groups[result.get('category_id', 0)].append(result)
+        return category_groups
+
+    def _rebuild_tree(self, results):
+        """Clear the tree and rebuild every category and item node"""
         self.tree.clear()
         self.category_items.clear()
-        self.results = results
+        self._item_nodes.clear()
 
         if not results:
             # Show empty state
@@ -147,147 +225,278 @@ class ResultsTreeView(QWidget):
             empty_item.setForeground(0, QColor('#888888'))
             return
 
-        # Group results by category
-        category_groups = defaultdict(list)
-        for result in results:
-            category_id = result.get('category_id', 0)
-            category_groups[category_id].append(result)
+        category_groups = self._group_by_category(results)
 
         # Create category nodes
         for category_id, category_results in sorted(category_groups.items()):
             try:
-                # Get category info from first item
-                first_result = category_results[0]
-                category_name = first_result.get('category_name', 'Sin categoría')
-                category_icon = first_result.get('category_icon', '📁')
-
-                # Create category item
-                category_item = QTreeWidgetItem(self.tree)
-                category_item.setText(0, f"{category_icon} {category_name}")
+                category_item = self._create_category_item(category_id, category_results[0])
+
+                # Add items to category (column-wise storage, built once)
+                columns = self._build_category_columns(category_results)
+                self._add_category_rows(category_item, columns)
                 category_item.setText(3, f"{len(category_results)} items")
 
-                # Style category item
-                font = QFont('Segoe UI', 11, QFont.Weight.Bold)
-                category_item.setFont(0, font)
-                category_item.setForeground(0, QColor('#f093fb'))
-                category_item.setForeground(3, QColor('#888888'))
+                # Expand category by default
+                category_item.setExpanded(category_id not in self._collapsed_categories)
 
-                # Mark as category (not selectable for item click)
-                category_item.setData(0, Qt.ItemDataRole.UserRole, {'is_category': True})
+            except Exception as e:
+                logger.error("Error creating category node: %s", e, exc_info=True)
 
-                # Store reference
-                self.category_items[category_id] = category_item
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Tree populated with %d categories", len(category_groups))
 
-                # Add items to category
-                for result in category_results:
-                    self._add_item_to_category(category_item, result)
+    def _apply_results_diff(self, old_results, old_by_id, results):
+        """
+        Apply a small change set to the existing tree in place
 
-                # Expand category by default
-                category_item.setExpanded(True)
+        Rows are matched by result id; a row whose data changed is removed
+        and re-inserted. Rows that survive must keep their relative order
+        within each category, otherwise a full rebuild is requested.
 
-            except Exception as e:
-                logger.error(f"Error creating category node: {e}", exc_info=True)
+        Returns:
+            True if the tree was updated, False if a full rebuild is needed
+        """
+        new_by_id = self._results_by_id
+        if (not old_by_id or not results
+                or len(old_by_id) != len(old_results)
+                or len(new_by_id) != len(results)
+                or len(old_by_id) != len(self._item_nodes)):
+            return False
+
+        removed_ids = {rid for rid, old in old_by_id.items() if new_by_id.get(rid) != old}
+        added_ids = {
+            result.get('id') for result in results
+            if old_by_id.get(result.get('id')) != result
+        }
+        if len(removed_ids) + len(added_ids) > max(len(old_by_id), len(results)) * self.INCREMENTAL_UPDATE_RATIO:
+            return False
+
+        # Same rows in a different order (e.g. a new sort) need a rebuild
+        old_groups = self._group_by_category(old_results)
+        new_groups = self._group_by_category(results)
+        for category_id in old_groups.keys() | new_groups.keys():
+            kept_old = [r.get('id') for r in old_groups.get(category_id, ()) if r.get('id') not in removed_ids]
+            kept_new = [r.get('id') for r in new_groups.get(category_id, ()) if r.get('id') not in added_ids]
+            if kept_old != kept_new:
+                return False
+
+        if not removed_ids and not added_ids:
+            return True
+
+        touched = set()
+        for rid in removed_ids:
+            item_node = self._item_nodes.pop(rid)
+            item_node.parent().removeChild(item_node)
+            touched.add(old_by_id[rid].get('category_id', 0))
+
+        # Drop categories left empty before computing insert positions
+        for category_id in list(touched):
+            category_item = self.category_items[category_id]
+            if category_item.childCount() == 0:
+                self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(category_item))
+                del self.category_items[category_id]
+                touched.discard(category_id)
+
+        for category_id, category_results in sorted(new_groups.items()):
+            positions = [
+                position for position, result in enumerate(category_results)
+                if result.get('id') in added_ids
+            ]
+            if not positions:
+                continue
+
+            category_item = self.category_items.get(category_id)
+            is_new_category = category_item is None
+            if is_new_category:
+                index = sum(1 for other_id in self.category_items if other_id < category_id)
+                category_item = self._create_category_item(category_id, category_results[0], index)
+
+            columns = self._build_category_columns([category_results[p] for p in positions])
+            self._add_category_rows(category_item, columns, positions)
+            touched.add(category_id)
+
+            if is_new_category:
+                category_item.setExpanded(category_id not in self._collapsed_categories)
+
+        for category_id in touched:
+            category_item = self.category_items[category_id]
+            category_item.setText(0, self._category_title(new_groups[category_id][0]))
+            category_item.setText(3, f"{category_item.childCount()} items")
+
+        logger.debug("Tree updated in place: -%d +%d rows", len(removed_ids), len(added_ids))
+        return True
+
+    def _create_category_item(self, category_id, first_result, index=None):
+        """Create a top-level category node (appended, or inserted at `index`)"""
+        # Create category item
+        category_item = QTreeWidgetItem()
+        category_item.setText(0, self._category_title(first_result))
+
+        # Style category item
+        font = QFont('Segoe UI', 11, QFont.Weight.Bold)
+        category_item.setFont(0, font)
+        category_item.setForeground(0, QColor('#f093fb'))
+        category_item.setForeground(3, QColor('#888888'))
+
+        # Mark as category (not selectable for item click)
+        category_item.setData(0, Qt.ItemDataRole.UserRole, {'is_category': True})
+
+        if index is None:
+            self.tree.addTopLevelItem(category_item)
+        else:
+            self.tree.insertTopLevelItem(index, category_item)
+
+        # Store reference
+        self.category_items[category_id] = category_item
+        return category_item
+
+    def _category_title(self, first_result):
+        """Category node text, taken from the first result of the category"""
+        category_name = first_result.get('category_name', 'Sin categoría')
+        category_icon = first_result.get('category_icon', '📁')
+        return f"{category_icon} {category_name}"
+
+    def _build_category_columns(self, category_results):
+        """
+        Transpose a category's results into parallel per-column lists
 
-        logger.debug(f"Tree populated with {len(category_groups)} categories")
+        Display strings are built once here so populating the tree only
+        indexes lists instead of re-reading every result dict. Missing or
+        None fields fall back to empty values, so a malformed row can't
+        abort the whole category.
 
-    def _add_item_to_category(self, category_item, result):
-        """Add an item to a category node"""
-        try:
-            # Create item node
-            item_node = QTreeWidgetItem(category_item)
-
-            # Label
-            label = result.get('label', '')
-            item_node.setText(0, label)
-
-            # Type with icon
-            item_type = result.get('type', 'TEXT')
-            type_icon = self._get_type_icon(item_type)
-            item_node.setText(1, f"{type_icon} {item_type}")
-
-            # Tags
-            tags = result.get('tags', [])
-            if isinstance(tags, list):
-                tags_str = ', '.join(tags) if tags else ''
-            else:
-                # Legacy format (CSV string)
-                tags_str = tags if tags else ''
-
-            if tags_str:
-                # Truncate long tags
-                if len(tags_str) > 30:
-                    tags_str = tags_str[:27] + '...'
-                item_node.setText(2, tags_str)
-                item_node.setForeground(2, QColor('#f093fb'))
-
-            # Use count
-            use_count = result.get('use_count', 0)
-            item_node.setText(3, str(use_count))
-            item_node.setTextAlignment(3, Qt.AlignmentFlag.AlignCenter)
-
-            # Store result data
-            item_node.setData(0, Qt.ItemDataRole.UserRole, result)
-
-            # Color code by type
-            color = self._get_type_color(item_type)
-            if color:
-                item_node.setForeground(0, QColor(color))
-
-            # Mark as sensitive if applicable
-            if result.get('is_sensitive'):
-                item_node.setText(1, f"{type_icon} {item_type} 🔒")
-
-            # Mark as favorite if applicable
-            if result.get('is_favorite'):
-                item_node.setText(0, f"⭐ {label}")
+        Returns:
+            SimpleNamespace with labels, types, tags, use_counts, colors (QColor
+            or None) and raw
+        """
+        columns = SimpleNamespace(
+            labels=[], types=[], tags=[], use_counts=[], colors=[],
+            raw=category_results
+        )
 
-        except Exception as e:
-            logger.error(f"Error adding item to category: {e}", exc_info=True)
+        for result in category_results:
+            flag = (1 if result.get('is_favorite') else 0) | (2 if result.get('is_sensitive') else 0)
+            label_prefix, type_suffix = _FLAG_DECOR[flag]
+
+            item_type = result.get('type') or 'TEXT'
+            label = label_prefix + str(result.get('label') or '')
+            type_str = f"{self._get_type_icon(item_type)} {item_type}{type_suffix}"
+
+            tags_str = ', '.join(_normalize_tags(result.get('tags')))
+
+            # Truncate long tags
+            tags_str = (tags_str[:27] + '…') if tags_str[30:] else tags_str
+
+            columns.labels.append(label)
+            columns.types.append(type_str)
+            columns.tags.append(tags_str)
+            columns.use_counts.append(str(result.get('use_count') or 0))
+            columns.colors.append(_TYPE_QCOLORS.get(item_type))
+
+        return columns
+
+    def _add_category_rows(self, category_item, columns, positions=None):
+        """
+        Add every row of a category's column storage to its node
+
+        A single try block guards the whole loop; when a row fails it is
+        logged and the loop resumes from the next row, so the success path
+        doesn't pay for a try/except per item.
+
+        Args:
+            positions: Optional child index per row (ascending); rows are
+                appended when omitted
+        """
+        row = 0
+        total = len(columns.raw)
+        while row < total:
+            try:
+                for row in range(row, total):
+                    position = positions[row] if positions else None
+                    self._add_item_to_category(category_item, columns, row, position)
+                break
+            except Exception as e:
+                logger.error("Error adding item to category: %s", e, exc_info=True)
+                row += 1
+
+    def _add_item_to_category(self, category_item, columns, row, position=None):
+        """Add row `row` of a category's column storage to its category node"""
+        # Create item node with all columns at once
+        tags_str = columns.tags[row]
+        item_node = QTreeWidgetItem([
+            columns.labels[row], columns.types[row],
+            tags_str, columns.use_counts[row]
+        ])
+        if position is None:
+            category_item.addChild(item_node)
+        else:
+            category_item.insertChild(position, item_node)
+
+        # Tags
+        if tags_str:
+            item_node.setForeground(2, _TAGS_QCOLOR)
+
+        # Use count
+        item_node.setTextAlignment(3, Qt.AlignmentFlag.AlignCenter)
+
+        # Store result data
+        result = columns.raw[row]
+        item_node.setData(0, Qt.ItemDataRole.UserRole, result)
+        item_node.setData(0, RESULT_ID_ROLE, result.get('id'))
+        self._item_nodes[result.get('id')] = item_node
+
+        # Color code by type
+        color = columns.colors[row]
+        if color is not None:
+            item_node.setForeground(0, color)
 
     def clear_results(self):
         """Clear all results"""
         self.tree.clear()
         self.category_items.clear()
+        self._item_nodes.clear()
+        self._results_by_id.clear()
         self.results.clear()
 
     def _on_item_double_clicked(self, item, column):
         """Handle item double click"""
         try:
             # Check if it's a category or item
-            data = item.data(0, Qt.ItemDataRole.UserRole)
-            if not data or data.get('is_category'):
+            result_id = item.data(0, RESULT_ID_ROLE)
+            if result_id is None or result_id not in self._results_by_id:
                 # It's a category, just toggle expand
                 item.setExpanded(not item.isExpanded())
                 return
 
             # It's an item, emit signal
-            result = data
-
-            # Handle tags (already a list from relational structure)
-            tags_data = result.get('tags', [])
-            if isinstance(tags_data, str):
-                tags_list = tags_data.split(',') if tags_data else []
-            else:
-                tags_list = tags_data if tags_data else []
-
-            # Convert to Item object
-            item_obj = Item(
-                item_id=str(result.get('id', '')),
-                label=result.get('label', ''),
-                content=result.get('content', ''),
-                item_type=result.get('type', 'TEXT').lower(),  # Convert to lowercase for ItemType enum
-                description=result.get('description'),
-                tags=tags_list,
-                is_favorite=bool(result.get('is_favorite', 0)),
-                is_sensitive=bool(result.get('is_sensitive', 0)),
-                is_active=True
-            )
-
-            logger.debug(f"Item double-clicked in tree: {item_obj.label}")
+            item_obj = self._as_item(result_id)
+
+            logger.debug("Item double-clicked in tree: %s", item_obj.label)
             self.item_clicked.emit(item_obj)
 
         except Exception as e:
-            logger.error(f"Error handling item double click: {e}", exc_info=True)
+            logger.error("Error handling item double click: %s", e, exc_info=True)
+
+    def _as_item(self, result_id):
+        """
+        Build a fresh Item for a result
+
+        Not cached: receivers may modify the emitted Item, so each
+        double-click gets its own instance (and its own tags list).
+        """
+        result = self._results_by_id[result_id]
+        return Item(
+            item_id=str(result.get('id', '')),
+            label=result.get('label', ''),
+            content=result.get('content', ''),
+            item_type=result.get('type', 'TEXT').lower(),  # Convert to lowercase for ItemType enum
+            description=result.get('description'),
+            tags=_normalize_tags(result.get('tags')),
+            is_favorite=bool(result.get('is_favorite', 0)),
+            is_sensitive=bool(result.get('is_sensitive', 0)),
+            is_active=True
+        )
 
     def _get_type_icon(self, item_type):
         """Get icon for item type"""
@@ -306,15 +515,7 @@ class ResultsTreeView(QWidget):
 
     def _get_type_color(self, item_type):
         """Get color for item type"""
-        colors = {
-            'CODE': '#4ec9b0',  # Teal
-            'URL': '#569cd6',   # Blue
-            'PATH': '#dcdcaa',  # Yellow
-            'TEXT': '#d4d4d4',  # White
-            'IMAGE': '#c586c0', # Purple
-            'PDF': '#ce9178',   # Orange
-        }
-        return colors.get(item_type)
+        return _TYPE_COLORS.get(item_type)
 
     def expand_all(self):
         """Expand all categories"""
@@ -1,9 +1,10 @@
 """
 Alerts views package
-Contains alert list and widget views
+Contains alert list, model and delegate views
 """
 
 from .alerts_list import AlertsList
-from .alert_item_widget import AlertItemWidget
+from .alerts_model import AlertsModel
+from .alert_item_delegate import AlertItemDelegate
 
-__all__ = ['AlertsList', 'AlertItemWidget']
+__all__ = ['AlertsList', 'AlertsModel', 'AlertItemDelegate']
@@ -0,0 +1,254 @@
+"""
+Alert Item Delegate
+Paints a single alert row in the alerts list
+"""
+
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle, QToolTip
+from PyQt6.QtCore import Qt, QRect, QRectF, QSize, QEvent, pyqtSignal
+from PyQt6.QtGui import QFont, QColor, QPen, QPainter
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Plain single-line text: no line breaking for user text containing newlines
+_SINGLE_LINE = Qt.TextFlag.TextSingleLine.value
+_TEXT_LEFT = (Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter).value | _SINGLE_LINE
+_TEXT_BOTTOM_LEFT = (Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom).value | _SINGLE_LINE
+_TEXT_TOP_LEFT = (Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop).value | _SINGLE_LINE
+
+
+def _elided(painter, text, width):
+    """Elide text with '…' to fit width using the painter's current font"""
+    return painter.fontMetrics().elidedText(text or '', Qt.TextElideMode.ElideRight, width)
+
+
+def _format_alert_datetime(datetime_str):
+    """Format 'YYYY-MM-DD HH:MM:SS' as 'DD/MM HH:MM'"""
+    if len(datetime_str) >= 16 and datetime_str[4] == '-' and datetime_str[10] == ' ':
+        return f"{datetime_str[8:10]}/{datetime_str[5:7]} {datetime_str[11:16]}"
+    return datetime_str[:16]
+
+
+class AlertItemDelegate(QStyledItemDelegate):
+    """
+    Delegate that draws alert rows directly with QPainter
+    Shows datetime, message, priority, status, and action buttons
+    without creating a widget per row
+    """
+
+    # Signals
+    action_clicked = pyqtSignal(str, dict)  # Emitted with (action, alert) when a button is clicked
+
+    ROW_HEIGHT = 50
+    MESSAGE_ROW_HEIGHT = 40
+    BUTTON_SIZE = 30
+
+    PRIORITY_TEXT = {
+        'low': '🟢 Baja',
+        'medium': '🟡 Media',
+        'high': '🔴 Alta'
+    }
+
+    # status -> (text, color); any other status is active or disabled
+    STATUS_STYLE = {
+        'triggered': ('🔔 Disparada', '#ff9800'),
+        'dismissed': ('✓ Descartada', '#4caf50')
+    }
+    ACTIVE_STYLE = ('⏱ Activa', '#2196f3')
+    DISABLED_STYLE = ('⏸ Deshabilitada', '#757575')
+
+    # status -> row background
+    BACKGROUND_COLORS = {
+        'triggered': "#3d2d1d",  # Darker orange tint
+        'dismissed': "#1d2d1d",  # Darker green tint
+    }
+
+    BUTTON_TEXT = {'dismiss': "✓", 'edit': "✏", 'delete': "🗑"}
+    BUTTON_TOOLTIPS = {
+        'dismiss': "Descartar alerta",
+        'edit': "Editar alerta",
+        'delete': "Eliminar alerta"
+    }
+
+    def __init__(self, parent=None):
+        """
+        Initialize alert delegate
+
+        Args:
+            parent: Parent QObject (usually the list view)
+        """
+        super().__init__(parent)
+
+        self.datetime_font = QFont()
+        self.datetime_font.setPointSize(10)
+        self.datetime_font.setBold(True)
+
+        self.title_font = QFont()
+        self.title_font.setPointSize(10)
+
+        self.small_font = QFont()
+        self.small_font.setPointSize(9)
+
+        self.button_font = QFont()
+        self.button_font.setPointSize(11)
+
+    def sizeHint(self, option, index):
+        """Fixed row height"""
+        if index.model().alert_at(index.row()) is None:
+            return QSize(option.rect.width(), self.MESSAGE_ROW_HEIGHT)
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def _buttons(self, alert):
+        """Action buttons shown for an alert, left to right"""
+        if alert.get('status', 'active') == 'active' and alert.get('is_enabled', 1):
+            return ('dismiss', 'edit', 'delete')
+        return ('edit', 'delete')
+
+    def _layout(self, rect, alert):
+        """
+        Compute the sub-rects of a row
+
+        Returns:
+            Tuple (datetime_rect, content_rect, priority_rect, status_rect, button_rects)
+        """
+        inner = rect.adjusted(10, 8, -10, -8)
+        buttons = self._buttons(alert)
+
+        buttons_width = len(buttons) * self.BUTTON_SIZE + (len(buttons) - 1) * 5
+        buttons_left = inner.right() + 1 - buttons_width
+        button_top = inner.top() + (inner.height() - self.BUTTON_SIZE) // 2
+        button_rects = {
+            action: QRect(buttons_left + i * (self.BUTTON_SIZE + 5), button_top,
+                          self.BUTTON_SIZE, self.BUTTON_SIZE)
+            for i, action in enumerate(buttons)
+        }
+
+        status_rect = QRect(buttons_left - 10 - 110, inner.top(), 110, inner.height())
+        priority_rect = QRect(status_rect.left() - 10 - 90, inner.top(), 90, inner.height())
+        datetime_rect = QRect(inner.left(), inner.top(), 80, inner.height())
+        content_left = datetime_rect.right() + 1 + 10
+        content_rect = QRect(content_left, inner.top(),
+                             max(0, priority_rect.left() - 10 - content_left), inner.height())
+
+        return datetime_rect, content_rect, priority_rect, status_rect, button_rects
+
+    def _status(self, alert):
+        """Return (text, color) for the status badge"""
+        style = self.STATUS_STYLE.get(alert.get('status'))
+        if style is not None:
+            return style
+        return self.ACTIVE_STYLE if alert.get('is_enabled', 1) else self.DISABLED_STYLE
+
+    def paint(self, painter, option, index):
+        """Paint an alert row"""
+        alert = index.model().alert_at(index.row())
+        painter.save()
+
+        if alert is None:
+            # Informational message row
+            painter.setPen(QColor('#cccccc'))
+            painter.drawText(option.rect, Qt.AlignmentFlag.AlignCenter, index.data())
+            painter.restore()
+            return
+
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Background based on status
+        status = alert.get('status', 'active')
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        if hovered:
+            bg_color = "#333333"
+        else:
+            bg_color = self.BACKGROUND_COLORS.get(status, "#2d2d2d")  # Normal by default
+
+        painter.setPen(QPen(QColor('#007acc' if hovered else '#3d3d3d')))
+        painter.setBrush(QColor(bg_color))
+        painter.drawRoundedRect(QRectF(option.rect).adjusted(0.5, 0.5, -0.5, -0.5), 4, 4)
+
+        datetime_rect, content_rect, priority_rect, status_rect, button_rects = \
+            self._layout(option.rect, alert)
+
+        # DateTime
+        painter.setPen(QColor('#cccccc'))
+        painter.setFont(self.datetime_font)
+        painter.drawText(datetime_rect, _TEXT_LEFT, _format_alert_datetime(alert['alert_datetime']))
+
+        # Title + message
+        title = alert.get('alert_title', 'Alerta sin título')
+        message = (alert.get('alert_message') or '').strip()
+        painter.setFont(self.title_font)
+        title = _elided(painter, title, content_rect.width())
+        if message:
+            half = content_rect.height() // 2
+            painter.drawText(content_rect.adjusted(0, 0, 0, -half),
+                             _TEXT_BOTTOM_LEFT, title)
+            painter.setFont(self.small_font)
+            painter.setPen(QColor('#999999'))
+            # Elide long messages to the available width
+            painter.drawText(content_rect.adjusted(0, content_rect.height() - half + 2, 0, 0),
+                             _TEXT_TOP_LEFT, _elided(painter, message, content_rect.width()))
+        else:
+            painter.drawText(content_rect, _TEXT_LEFT, title)
+
+        # Priority badge
+        priority_text = self.PRIORITY_TEXT.get(alert.get('priority', 'medium'), '🟡 Media')
+        painter.setFont(self.small_font)
+        painter.setPen(QColor('#cccccc'))
+        painter.drawText(priority_rect, _TEXT_LEFT, priority_text)
+
+        # Status badge
+        status_text, status_color = self._status(alert)
+        painter.setPen(QColor(status_color))
+        painter.drawText(status_rect, _TEXT_LEFT, status_text)
+
+        # Action buttons
+        painter.setFont(self.button_font)
+        for action, rect in button_rects.items():
+            painter.setPen(QPen(QColor('#4d4d4d')))
+            painter.setBrush(QColor('#3d3d3d'))
+            painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 3, 3)
+            painter.setPen(QColor('#cccccc'))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self.BUTTON_TEXT[action])
+
+        painter.restore()
+
+    def action_at(self, rect, alert, pos):
+        """
+        Get the action button under a point
+
+        Args:
+            rect: Row rect
+            alert: Alert dictionary
+            pos: Point in view coordinates
+
+        Returns:
+            'dismiss', 'edit', 'delete' or None
+        """
+        for action, button_rect in self._layout(rect, alert)[4].items():
+            if button_rect.contains(pos):
+                return action
+        return None
+
+    def editorEvent(self, event, model, option, index):
+        """Dispatch clicks on the painted action buttons"""
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            alert = model.alert_at(index.row())
+            if alert is not None:
+                action = self.action_at(option.rect, alert, event.position().toPoint())
+                if action:
+                    logger.debug("Alert %s requested: %s", action, alert['id'])
+                    self.action_clicked.emit(action, alert)
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        """Show tooltips for the painted action buttons"""
+        if event.type() == QEvent.Type.ToolTip:
+            alert = index.model().alert_at(index.row())
+            if alert is not None:
+                action = self.action_at(option.rect, alert, event.pos())
+                if action:
+                    QToolTip.showText(event.globalPos(), self.BUTTON_TOOLTIPS[action], view)
+                    return True
+        return super().helpEvent(event, view, option, index)
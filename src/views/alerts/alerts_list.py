@@ -5,17 +5,68 @@ Displays alerts with filtering capabilities
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QLabel, QListWidget, QListWidgetItem, QComboBox, QMessageBox
+    QLabel, QListView, QAbstractItemView, QComboBox, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont
-from datetime import datetime
 import logging
 
-from .alert_item_widget import AlertItemWidget
+from .alerts_model import AlertsModel
+from .alert_item_delegate import AlertItemDelegate
+from src.core.db_query_worker import DBQueryWorker
 
 logger = logging.getLogger(__name__)
 
+# Stylesheet shared by all AlertsList instances
+_ALERTS_QSS = """
+    QWidget {
+        background-color: #2b2b2b;
+        color: #cccccc;
+    }
+    QPushButton {
+        background-color: #2d2d2d;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-size: 10pt;
+    }
+    QPushButton:hover {
+        background-color: #3d3d3d;
+        border-color: #007acc;
+    }
+    QPushButton:pressed {
+        background-color: #1e1e1e;
+    }
+    QComboBox {
+        background-color: #2d2d2d;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 5px 10px;
+        font-size: 10pt;
+    }
+    QComboBox:hover {
+        border-color: #007acc;
+    }
+    QComboBox::drop-down {
+        border: none;
+    }
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 5px solid #cccccc;
+        margin-right: 5px;
+    }
+    QListView {
+        background-color: #252525;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 5px;
+    }
+"""
+
 
 class AlertsList(QWidget):
     """
@@ -24,10 +75,47 @@ class AlertsList(QWidget):
     """
 
     # Signals
-    alert_selected = pyqtSignal(dict)  # Emitted when alert is selected
     create_alert_requested = pyqtSignal()  # Emitted when "New Alert" clicked
     edit_alert_requested = pyqtSignal(dict)  # Emitted when edit requested
     refresh_needed = pyqtSignal()  # Emitted when list needs refresh
+    alert_changed = pyqtSignal()  # Emitted when an alert is dismissed or deleted
+
+    # Only the columns shown in the list or needed by the editor dialog
+    _ALERT_COLUMNS = """
+        SELECT a.id, a.item_id, a.alert_datetime, a.alert_title, a.alert_message,
+               a.priority, a.status, a.is_enabled, i.label as item_label
+        FROM item_alerts a
+        LEFT JOIN items i ON a.item_id = i.id
+    """
+    _ALERT_STATS = """
+        SELECT a.status, a.is_enabled, COUNT(*)
+        FROM item_alerts a
+    """
+
+    # WHERE clause per filter: only active and enabled / triggered or dismissed / all
+    _ALERT_FILTERS = {
+        'active': "WHERE a.status = 'active' AND a.is_enabled = 1",
+        'past': "WHERE a.status IN ('triggered', 'dismissed')",
+        'all': "",
+    }
+
+    ALERT_QUERIES = {
+        'active': f"{_ALERT_COLUMNS} {_ALERT_FILTERS['active']} ORDER BY a.alert_datetime ASC",
+        'past': f"{_ALERT_COLUMNS} {_ALERT_FILTERS['past']} ORDER BY a.alert_datetime DESC",
+        'all': f"{_ALERT_COLUMNS} {_ALERT_FILTERS['all']} ORDER BY a.alert_datetime DESC",
+    }
+
+    ALERT_STATS_QUERIES = {
+        'active': f"{_ALERT_STATS} {_ALERT_FILTERS['active']} GROUP BY a.status, a.is_enabled",
+        'past': f"{_ALERT_STATS} {_ALERT_FILTERS['past']} GROUP BY a.status, a.is_enabled",
+        'all': f"{_ALERT_STATS} {_ALERT_FILTERS['all']} GROUP BY a.status, a.is_enabled",
+    }
+
+    FILTER_TEXT = {
+        'active': 'activas',
+        'all': 'en total',
+        'past': 'pasadas'
+    }
 
     def __init__(self, db_manager, parent=None):
         """
@@ -43,9 +131,21 @@ class AlertsList(QWidget):
         # Current filter
         self.current_filter = "active"  # active, all, past
 
+        # [active, triggered, dismissed] counts shown in the stats bar
+        self.stats = [0, 0, 0]
+
+        # Id of the latest load, used to discard stale worker results
+        self._load_request_id = 0
+
+        # Timer para debounce de recargas
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.setInterval(50)
+        self.reload_timer.timeout.connect(self._do_load_alerts)
+
         self.setup_ui()
         self.apply_styles()
-        self.load_alerts()
+        self._do_load_alerts()
 
         logger.info(f"AlertsList initialized with filter: {self.current_filter}")
 
@@ -91,9 +191,28 @@ class AlertsList(QWidget):
         self.stats_label.setStyleSheet("color: #999999;")
         layout.addWidget(self.stats_label)
 
-        # Alerts list
-        self.alerts_list = QListWidget()
+        # Alerts list (rows are painted by the delegate, no per-row widgets)
+        self.model = AlertsModel(self)
+        self.delegate = AlertItemDelegate(self)
+        self.delegate.action_clicked.connect(self.on_alert_action)
+        self.alert_actions = {
+            'edit': self.on_edit_alert,
+            'dismiss': self.on_dismiss_alert,
+            'delete': self.on_delete_alert
+        }
+
+        self.alerts_list = QListView()
         self.alerts_list.setSpacing(2)
+        # Every alert row has the same height, so Qt can skip per-row size queries
+        self.alerts_list.setUniformItemSizes(True)
+        self.alerts_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.alerts_list.setBatchSize(64)
+        self.alerts_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.alerts_list.setMouseTracking(True)
+        self.alerts_list.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.alerts_list.setModel(self.model)
+        self.alerts_list.setItemDelegate(self.delegate)
+        self.alerts_list.doubleClicked.connect(self.on_alert_double_clicked)
         layout.addWidget(self.alerts_list)
 
         # Action buttons
@@ -116,63 +235,7 @@ class AlertsList(QWidget):
 
     def apply_styles(self):
         """Apply styles to the widget"""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #2b2b2b;
-                color: #cccccc;
-            }
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 10pt;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border-color: #007acc;
-            }
-            QPushButton:pressed {
-                background-color: #1e1e1e;
-            }
-            QComboBox {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 5px 10px;
-                font-size: 10pt;
-            }
-            QComboBox:hover {
-                border-color: #007acc;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #cccccc;
-                margin-right: 5px;
-            }
-            QListWidget {
-                background-color: #252525;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 5px;
-            }
-            QListWidget::item {
-                background-color: transparent;
-                border: none;
-                padding: 2px;
-            }
-            QListWidget::item:selected {
-                background-color: transparent;
-                border: none;
-            }
-        """)
+        self.setStyleSheet(_ALERTS_QSS)
 
     def on_filter_changed(self, index):
         """Handle filter combo box change"""
@@ -181,125 +244,131 @@ class AlertsList(QWidget):
         self.load_alerts()
 
     def load_alerts(self):
-        """Load alerts from database based on current filter"""
-        try:
-            logger.info(f"Loading alerts with filter: {self.current_filter}")
-
-            # Clear current list
-            self.alerts_list.clear()
-
-            # Get all alerts from database
-            # Note: get_alerts_by_item requires item_id, so we need a different approach
-            # Let's get all items and their alerts
-            conn = self.db.connect()
-            cursor = conn.cursor()
-
-            # Build query based on filter
-            if self.current_filter == "active":
-                # Only active and enabled alerts
-                query = """
-                    SELECT a.*, i.label as item_label
-                    FROM item_alerts a
-                    LEFT JOIN items i ON a.item_id = i.id
-                    WHERE a.status = 'active' AND a.is_enabled = 1
-                    ORDER BY a.alert_datetime ASC
-                """
-            elif self.current_filter == "past":
-                # Triggered or dismissed alerts
-                query = """
-                    SELECT a.*, i.label as item_label
-                    FROM item_alerts a
-                    LEFT JOIN items i ON a.item_id = i.id
-                    WHERE a.status IN ('triggered', 'dismissed')
-                    ORDER BY a.alert_datetime DESC
-                """
-            else:  # all
-                # All alerts
-                query = """
-                    SELECT a.*, i.label as item_label
-                    FROM item_alerts a
-                    LEFT JOIN items i ON a.item_id = i.id
-                    ORDER BY a.alert_datetime DESC
-                """
-
-            cursor.execute(query)
-            columns = [desc[0] for desc in cursor.description]
-            alerts = [dict(zip(columns, row)) for row in cursor.fetchall()]
-
-            if not alerts:
-                # Show "no alerts" message
-                filter_text = {
-                    'active': 'activas',
-                    'all': 'en total',
-                    'past': 'pasadas'
-                }.get(self.current_filter, '')
-
-                item = QListWidgetItem(f"No hay alertas {filter_text}")
-                item.setFlags(Qt.ItemFlag.NoItemFlags)
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.alerts_list.addItem(item)
-                self.update_stats(0, 0, 0)
-                logger.debug(f"No alerts found for filter: {self.current_filter}")
-                return
+        """Schedule a reload, coalescing bursts of requests into one"""
+        self.reload_timer.start()
+
+    def _do_load_alerts(self):
+        """Load alerts from database based on current filter (in a worker thread)"""
+        logger.info(f"Loading alerts with filter: {self.current_filter}")
+
+        query_filter = self.current_filter if self.current_filter in self.ALERT_QUERIES else 'all'
+
+        # Results of older requests still running are discarded
+        self._load_request_id += 1
+        worker = DBQueryWorker(
+            self.db,
+            lambda conn: self._query_alerts(conn, query_filter),
+            self._load_request_id,
+            self
+        )
+        worker.result_ready.connect(self._on_alerts_loaded)
+        worker.error.connect(self._on_alerts_load_error)
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
 
-            # Count stats
-            active_count = sum(1 for a in alerts if a['status'] == 'active' and a['is_enabled'])
-            triggered_count = sum(1 for a in alerts if a['status'] == 'triggered')
-            dismissed_count = sum(1 for a in alerts if a['status'] == 'dismissed')
+    @classmethod
+    def _query_alerts(cls, conn, query_filter):
+        """
+        Run the alert queries for a filter (called from the worker thread)
 
-            # Add alerts to list
-            for alert in alerts:
-                self.add_alert_item(alert)
+        Returns:
+            Tuple (alerts, (active_count, triggered_count, dismissed_count))
+        """
+        # Count stats in SQL
+        active_count = triggered_count = dismissed_count = 0
+        for status, is_enabled, count in conn.execute(cls.ALERT_STATS_QUERIES[query_filter]):
+            if status == 'active':
+                if is_enabled:
+                    active_count += count
+            elif status == 'triggered':
+                triggered_count += count
+            elif status == 'dismissed':
+                dismissed_count += count
+
+        # Queries are constant strings so sqlite3's statement cache reuses them
+        # sqlite3.Row objects; AlertsModel converts them to dicts on first access
+        alerts = conn.execute(cls.ALERT_QUERIES[query_filter]).fetchall()
+
+        return alerts, (active_count, triggered_count, dismissed_count)
+
+    def _on_alerts_loaded(self, request_id, result):
+        """Show the alerts returned by the worker thread"""
+        if request_id != self._load_request_id:
+            return
+
+        alerts, (active_count, triggered_count, dismissed_count) = result
+
+        # Message shown when the filter returns no alerts
+        filter_text = self.FILTER_TEXT.get(self.current_filter, '')
+
+        # First batch now, the rest as the list scrolls
+        self.alerts_list.setUpdatesEnabled(False)
+        try:
+            self.model.setRows(alerts, f"No hay alertas {filter_text}")
+        finally:
+            self.alerts_list.setUpdatesEnabled(True)
 
-            # Update stats
-            self.update_stats(active_count, triggered_count, dismissed_count)
+        # Update stats
+        self.stats = [active_count, triggered_count, dismissed_count]
+        self.update_stats(*self.stats)
 
-            logger.info(f"Loaded {len(alerts)} alerts (Active: {active_count}, Triggered: {triggered_count}, Dismissed: {dismissed_count})")
+        logger.info(f"Loaded {len(alerts)} alerts (Active: {active_count}, Triggered: {triggered_count}, Dismissed: {dismissed_count})")
 
-        except Exception as e:
-            logger.error(f"Error loading alerts: {e}", exc_info=True)
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Error al cargar alertas: {str(e)}"
-            )
+    def _on_alerts_load_error(self, request_id, message):
+        """Report a failed alerts query"""
+        if request_id != self._load_request_id:
+            return
 
-    def update_stats(self, active, triggered, dismissed):
-        """Update the stats label"""
-        total = active + triggered + dismissed
-        self.stats_label.setText(
-            f"Total: {total} | Activas: {active} | Disparadas: {triggered} | Descartadas: {dismissed}"
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"Error al cargar alertas: {message}"
         )
 
-    def add_alert_item(self, alert):
+    def adjust_stats(self, status, is_enabled, delta):
         """
-        Add an alert item to the list
+        Add delta to the stats counter of one alert status and refresh the label
 
         Args:
-            alert: Alert dictionary
+            status: Alert status
+            is_enabled: Alert enabled flag
+            delta: Amount to add (usually +1/-1)
         """
-        # Create AlertItemWidget
-        alert_widget = AlertItemWidget(alert)
-
-        # Connect signals
-        alert_widget.edit_requested.connect(self.on_edit_alert)
-        alert_widget.dismiss_requested.connect(self.on_dismiss_alert)
-        alert_widget.delete_requested.connect(self.on_delete_alert)
-
-        # Create list item
-        list_item = QListWidgetItem()
-        list_item.setSizeHint(alert_widget.sizeHint())
-        list_item.setData(Qt.ItemDataRole.UserRole, alert)
+        if status == 'active':
+            if not is_enabled:
+                return
+            slot = 0
+        elif status == 'triggered':
+            slot = 1
+        elif status == 'dismissed':
+            slot = 2
+        else:
+            return
+        self.stats[slot] += delta
+        self.update_stats(*self.stats)
 
-        # Add to list
-        self.alerts_list.addItem(list_item)
-        self.alerts_list.setItemWidget(list_item, alert_widget)
+    def update_stats(self, active, triggered, dismissed):
+        """Update the stats label"""
+        total = active + triggered + dismissed
+        self.stats_label.setText(
+            f"Total: {total} | Activas: {active} | Disparadas: {triggered} | Descartadas: {dismissed}"
+        )
 
     def create_alert(self):
         """Handle new alert button click"""
         logger.debug("Create alert requested")
         self.create_alert_requested.emit()
 
+    def on_alert_action(self, action, alert):
+        """Dispatch a row action (edit/dismiss/delete) to its handler"""
+        self.alert_actions[action](alert)
+
+    def on_alert_double_clicked(self, index):
+        """Handle double click on a row to edit"""
+        alert = self.model.alert_at(index.row())
+        if alert is not None:
+            self.on_alert_action('edit', alert)
+
     def on_edit_alert(self, alert):
         """Handle edit alert request"""
         logger.debug(f"Edit alert: {alert['id']}")
@@ -319,7 +388,19 @@ class AlertsList(QWidget):
             try:
                 self.db.dismiss_alert(alert['id'])
                 logger.info(f"Alert dismissed: {alert['id']}")
-                self.load_alerts()  # Refresh list
+
+                # Update just this row instead of reloading the list
+                row = self.model.row_of(alert)
+                if row < 0:
+                    self.load_alerts()
+                else:
+                    self.adjust_stats(alert['status'], alert['is_enabled'], -1)
+                    if self.current_filter == 'active':
+                        self.model.removeRow(row)
+                    else:
+                        self.model.update_alert(row, status='dismissed')
+                        self.adjust_stats('dismissed', alert['is_enabled'], 1)
+                self.alert_changed.emit()
                 self.refresh_needed.emit()
             except Exception as e:
                 logger.error(f"Error dismissing alert: {e}", exc_info=True)
@@ -343,7 +424,15 @@ class AlertsList(QWidget):
             try:
                 self.db.delete_item_alert(alert['id'])
                 logger.info(f"Alert deleted: {alert['id']}")
-                self.load_alerts()  # Refresh list
+
+                # Remove just this row instead of reloading the list
+                row = self.model.row_of(alert)
+                if row < 0:
+                    self.load_alerts()
+                else:
+                    self.model.removeRow(row)
+                    self.adjust_stats(alert['status'], alert['is_enabled'], -1)
+                self.alert_changed.emit()
                 self.refresh_needed.emit()
             except Exception as e:
                 logger.error(f"Error deleting alert: {e}", exc_info=True)
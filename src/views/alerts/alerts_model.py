@@ -0,0 +1,155 @@
+"""
+Alerts Model
+List model holding the alert rows displayed by AlertsList
+"""
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+
+class AlertsModel(QAbstractListModel):
+    """
+    Model for the alerts list
+    Stores the alert rows returned from SQL; when there are no
+    alerts it can expose a single informational message row instead.
+    Rows are exposed to the view in batches as it scrolls
+    (canFetchMore/fetchMore)
+    """
+
+    FETCH_BATCH_SIZE = 128
+
+    def __init__(self, parent=None):
+        """
+        Initialize alerts model
+
+        Args:
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._alerts = []
+        self._message = None
+        self._loaded = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        """Number of rows (alerts, or 1 for the message row)"""
+        if parent.isValid():
+            return 0
+        if self._alerts:
+            return self._loaded
+        return 1 if self._message else 0
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return row data for the given role"""
+        if not index.isValid():
+            return None
+
+        alert = self.alert_at(index.row())
+        if alert is None:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self._message
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return alert.get('alert_title')
+        if role == Qt.ItemDataRole.UserRole:
+            return alert
+        return None
+
+    def flags(self, index):
+        """Message row is inert; alert rows are enabled"""
+        if self.alert_at(index.row()) is None:
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled
+
+    def setRows(self, alerts, message=None):
+        """
+        Replace all rows
+
+        Only the first batch is exposed now; the rest is fetched on demand
+
+        Args:
+            alerts: List of alert dictionaries or sqlite3.Row objects
+            message: Text shown as the only row when alerts is empty
+        """
+        self.beginResetModel()
+        self._alerts = alerts
+        self._loaded = min(len(alerts), self.FETCH_BATCH_SIZE)
+        self._message = message
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        """Whether there are rows not yet exposed to the view"""
+        return not parent.isValid() and self._loaded < len(self._alerts)
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Expose the next batch of rows"""
+        if parent.isValid():
+            return
+
+        first = self._loaded
+        last = min(len(self._alerts), first + self.FETCH_BATCH_SIZE) - 1
+        if last >= first:
+            self.beginInsertRows(QModelIndex(), first, last)
+            self._loaded = last + 1
+            self.endInsertRows()
+
+    def alert_at(self, row):
+        """
+        Get the alert dictionary for a row
+
+        Returns:
+            Alert dictionary, or None for the message row
+        """
+        if 0 <= row < self._loaded:
+            alert = self._alerts[row]
+            if not isinstance(alert, dict):
+                # Rows from SQL are converted lazily, only once they are used
+                alert = self._alerts[row] = dict(alert)
+            return alert
+        return None
+
+    def row_of(self, alert):
+        """
+        Find the row of an alert by id
+
+        Returns:
+            Row index, or -1 if the alert is not loaded
+        """
+        alert_id = alert['id']
+        for row in range(self._loaded):
+            if self._alerts[row]['id'] == alert_id:
+                return row
+        return -1
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        """Remove loaded alert rows"""
+        if parent.isValid() or row < 0 or count <= 0 or row + count > self._loaded:
+            return False
+
+        if count == len(self._alerts) and self._message:
+            # Last alerts gone: the message row takes their place
+            self.beginResetModel()
+            del self._alerts[row:row + count]
+            self._loaded = 0
+            self.endResetModel()
+            return True
+
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._alerts[row:row + count]
+        self._loaded -= count
+        self.endRemoveRows()
+        return True
+
+    def update_alert(self, row, **changes):
+        """
+        Update fields of a loaded alert in place
+
+        Args:
+            row: Row index
+            **changes: Fields to set on the alert dictionary
+        """
+        alert = self.alert_at(row)
+        if alert is None:
+            return
+        alert.update(changes)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
@@ -4,6 +4,7 @@ Contains event and alert list views
 """
 
 from .events_list import EventsList
-from .event_item_widget import EventItemWidget
+from .events_model import EventsModel
+from .event_item_delegate import EventItemDelegate
 
-__all__ = ['EventsList', 'EventItemWidget']
+__all__ = ['EventsList', 'EventsModel', 'EventItemDelegate']
@@ -0,0 +1,233 @@
+"""
+Event Item Delegate
+Paints day headers and calendar events in the events list
+"""
+
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle, QToolTip
+from PyQt6.QtCore import Qt, QRect, QRectF, QSize, QEvent, pyqtSignal
+from PyQt6.QtGui import QFont, QColor, QPen, QPainter
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Plain single-line text: no line breaking for user text containing newlines
+_SINGLE_LINE = Qt.TextFlag.TextSingleLine.value
+_TEXT_LEFT = (Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter).value | _SINGLE_LINE
+_TEXT_BOTTOM_LEFT = (Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom).value | _SINGLE_LINE
+_TEXT_TOP_LEFT = (Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop).value | _SINGLE_LINE
+
+
+def _elided(painter, text, width):
+    """Elide text with '…' to fit width using the painter's current font"""
+    return painter.fontMetrics().elidedText(text or '', Qt.TextElideMode.ElideRight, width)
+
+
+class EventItemDelegate(QStyledItemDelegate):
+    """
+    Delegate that draws events list rows directly with QPainter
+    Event rows show time, title, priority, status, and edit/delete
+    buttons without creating a widget per row
+    """
+
+    # Signals
+    action_clicked = pyqtSignal(str, dict)  # Emitted with (action, event) when a button is clicked
+
+    ROW_HEIGHT = 46
+    HEADER_HEIGHT = 28
+    MESSAGE_ROW_HEIGHT = 40
+    BUTTON_SIZE = 30
+
+    PRIORITY_TEXT = {
+        'low': '🟢 Baja',
+        'medium': '🟡 Media',
+        'high': '🔴 Alta'
+    }
+
+    # status -> (text, color)
+    STATUS_STYLE = {
+        'completed': ('✓ Completado', '#4caf50'),
+        'cancelled': ('✗ Cancelado', '#f44336'),
+        'pending': ('⏱ Pendiente', '#2196f3')
+    }
+
+    BUTTON_TEXT = {'edit': "✏", 'delete': "🗑"}
+    BUTTON_TOOLTIPS = {'edit': "Editar evento", 'delete': "Eliminar evento"}
+
+    def __init__(self, parent=None):
+        """
+        Initialize event delegate
+
+        Args:
+            parent: Parent QObject (usually the list view)
+        """
+        super().__init__(parent)
+
+        self.time_font = QFont()
+        self.time_font.setPointSize(10)
+        self.time_font.setBold(True)
+
+        self.header_font = QFont()
+        self.header_font.setPointSize(10)
+        self.header_font.setBold(True)
+
+        self.title_font = QFont()
+        self.title_font.setPointSize(10)
+
+        self.small_font = QFont()
+        self.small_font.setPointSize(9)
+
+        self.button_font = QFont()
+        self.button_font.setPointSize(11)
+
+    def sizeHint(self, option, index):
+        """Fixed row height per row kind"""
+        row = index.model().row_at(index.row())
+        if row is None:
+            height = self.MESSAGE_ROW_HEIGHT
+        elif isinstance(row, str):
+            height = self.HEADER_HEIGHT
+        else:
+            height = self.ROW_HEIGHT
+        return QSize(option.rect.width(), height)
+
+    def _layout(self, rect):
+        """
+        Compute the sub-rects of an event row
+
+        Returns:
+            Tuple (time_rect, content_rect, priority_rect, status_rect, button_rects)
+        """
+        inner = rect.adjusted(10, 8, -10, -8)
+        button_top = inner.top() + (inner.height() - self.BUTTON_SIZE) // 2
+
+        delete_rect = QRect(inner.right() + 1 - self.BUTTON_SIZE, button_top,
+                            self.BUTTON_SIZE, self.BUTTON_SIZE)
+        edit_rect = QRect(delete_rect.left() - 10 - self.BUTTON_SIZE, button_top,
+                          self.BUTTON_SIZE, self.BUTTON_SIZE)
+        status_rect = QRect(edit_rect.left() - 10 - 100, inner.top(), 100, inner.height())
+        priority_rect = QRect(status_rect.left() - 10 - 90, inner.top(), 90, inner.height())
+        time_rect = QRect(inner.left(), inner.top(), 50, inner.height())
+        content_left = time_rect.right() + 1 + 10
+        content_rect = QRect(content_left, inner.top(),
+                             max(0, priority_rect.left() - 10 - content_left), inner.height())
+
+        return time_rect, content_rect, priority_rect, status_rect, {
+            'edit': edit_rect, 'delete': delete_rect
+        }
+
+    def paint(self, painter, option, index):
+        """Paint a header, message or event row"""
+        row = index.model().row_at(index.row())
+        painter.save()
+
+        if row is None:
+            # Informational message row
+            painter.setPen(QColor('#cccccc'))
+            painter.drawText(option.rect, Qt.AlignmentFlag.AlignCenter, index.data())
+            painter.restore()
+            return
+
+        if isinstance(row, str):
+            # Day header
+            painter.fillRect(option.rect, Qt.GlobalColor.darkGray)
+            painter.setPen(Qt.GlobalColor.white)
+            painter.setFont(self.header_font)
+            painter.drawText(option.rect.adjusted(6, 0, -6, 0), _TEXT_LEFT, row)
+            painter.restore()
+            return
+
+        event = row
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        painter.setPen(QPen(QColor('#007acc' if hovered else '#3d3d3d')))
+        painter.setBrush(QColor('#333333' if hovered else '#2d2d2d'))
+        painter.drawRoundedRect(QRectF(option.rect).adjusted(0.5, 0.5, -0.5, -0.5), 4, 4)
+
+        time_rect, content_rect, priority_rect, status_rect, button_rects = \
+            self._layout(option.rect)
+
+        # Time
+        event_datetime = event['event_datetime']
+        time_str = event_datetime[11:16] if len(event_datetime) >= 16 else "00:00"
+        painter.setPen(QColor('#cccccc'))
+        painter.setFont(self.time_font)
+        painter.drawText(time_rect, _TEXT_LEFT, time_str)
+
+        # Title + description
+        title = event.get('title', 'Sin título')
+        description = (event.get('description') or '').strip()
+        painter.setFont(self.title_font)
+        title = _elided(painter, title, content_rect.width())
+        if description:
+            half = content_rect.height() // 2
+            painter.drawText(content_rect.adjusted(0, 0, 0, -half),
+                             _TEXT_BOTTOM_LEFT, title)
+            painter.setFont(self.small_font)
+            painter.setPen(QColor('#999999'))
+            # Elide long descriptions to the available width
+            painter.drawText(content_rect.adjusted(0, content_rect.height() - half + 2, 0, 0),
+                             _TEXT_TOP_LEFT, _elided(painter, description, content_rect.width()))
+        else:
+            painter.drawText(content_rect, _TEXT_LEFT, title)
+
+        # Priority badge
+        priority_text = self.PRIORITY_TEXT.get(event.get('priority', 'medium'), '🟡 Media')
+        painter.setFont(self.small_font)
+        painter.setPen(QColor('#cccccc'))
+        painter.drawText(priority_rect, _TEXT_LEFT, priority_text)
+
+        # Status badge
+        status_text, status_color = self.STATUS_STYLE.get(
+            event.get('status'), self.STATUS_STYLE['pending'])
+        painter.setPen(QColor(status_color))
+        painter.drawText(status_rect, _TEXT_LEFT, status_text)
+
+        # Action buttons
+        painter.setFont(self.button_font)
+        for action, rect in button_rects.items():
+            painter.setPen(QPen(QColor('#4d4d4d')))
+            painter.setBrush(QColor('#3d3d3d'))
+            painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 3, 3)
+            painter.setPen(QColor('#cccccc'))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self.BUTTON_TEXT[action])
+
+        painter.restore()
+
+    def action_at(self, rect, pos):
+        """
+        Get the action button under a point
+
+        Args:
+            rect: Row rect
+            pos: Point in view coordinates
+
+        Returns:
+            'edit', 'delete' or None
+        """
+        for action, button_rect in self._layout(rect)[4].items():
+            if button_rect.contains(pos):
+                return action
+        return None
+
+    def editorEvent(self, event, model, option, index):
+        """Dispatch clicks on the painted action buttons"""
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            calendar_event = model.event_at(index.row())
+            if calendar_event is not None:
+                action = self.action_at(option.rect, event.position().toPoint())
+                if action:
+                    logger.debug("Event %s requested: %s", action, calendar_event['id'])
+                    self.action_clicked.emit(action, calendar_event)
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        """Show tooltips for the painted action buttons"""
+        if event.type() == QEvent.Type.ToolTip and index.model().event_at(index.row()) is not None:
+            action = self.action_at(option.rect, event.pos())
+            if action:
+                QToolTip.showText(event.globalPos(), self.BUTTON_TOOLTIPS[action], view)
+                return True
+        return super().helpEvent(event, view, option, index)
@@ -5,18 +5,56 @@ Displays calendar events grouped by day with month navigation
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QLabel, QListWidget, QListWidgetItem, QMessageBox
+    QLabel, QListView, QAbstractItemView, QMessageBox
 )
-from PyQt6.QtCore import Qt, QDate, pyqtSignal
+from PyQt6.QtCore import Qt, QDate, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont
-from datetime import datetime
-from collections import defaultdict
+from datetime import date
+from collections import OrderedDict
+from functools import lru_cache
 import logging
 
-from .event_item_widget import EventItemWidget
+from .events_model import EventsModel
+from .event_item_delegate import EventItemDelegate
+from src.core.db_query_worker import DBQueryWorker
 
 logger = logging.getLogger(__name__)
 
+_MONTH_NAMES = (
+    "Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio",
+    "Julio", "Agosto", "Septiembre", "Octubre", "Noviembre", "Diciembre"
+)
+_DAYS_OF_WEEK = ("Lun", "Mar", "Mié", "Jue", "Vie", "Sáb", "Dom")
+
+# Stylesheet shared by all EventsList instances
+_EVENTS_QSS = """
+    QWidget {
+        background-color: #2b2b2b;
+        color: #cccccc;
+    }
+    QPushButton {
+        background-color: #2d2d2d;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-size: 10pt;
+    }
+    QPushButton:hover {
+        background-color: #3d3d3d;
+        border-color: #007acc;
+    }
+    QPushButton:pressed {
+        background-color: #1e1e1e;
+    }
+    QListView {
+        background-color: #252525;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 5px;
+    }
+"""
+
 
 class EventsList(QWidget):
     """
@@ -25,11 +63,13 @@ class EventsList(QWidget):
     """
 
     # Signals
-    event_selected = pyqtSignal(dict)  # Emitted when event is selected
     create_event_requested = pyqtSignal()  # Emitted when "New Event" clicked
     edit_event_requested = pyqtSignal(dict)  # Emitted when edit requested
     refresh_needed = pyqtSignal()  # Emitted when list needs refresh
 
+    MONTH_CACHE_SIZE = 12
+    EMPTY_MESSAGE = "No hay eventos en este mes"
+
     def __init__(self, db_manager, parent=None):
         """
         Initialize events list
@@ -46,9 +86,23 @@ class EventsList(QWidget):
         self.current_year = current_date.year()
         self.current_month = current_date.month()
 
+        # Recently viewed months: (year, month) -> events, LRU ordered
+        self._month_cache = OrderedDict()
+
+        # Id of the latest load, used to discard stale worker results
+        self._load_request_id = 0
+
+        # Timer para debounce de recargas
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.setInterval(50)
+        self.reload_timer.timeout.connect(self._do_load_events)
+
         self.setup_ui()
         self.apply_styles()
-        self.load_events()
+
+        # Load after the list has painted its (empty) frame
+        QTimer.singleShot(0, self._do_load_events)
 
         logger.info(f"EventsList initialized for {self.current_year}-{self.current_month:02d}")
 
@@ -96,9 +150,27 @@ class EventsList(QWidget):
 
         layout.addLayout(nav_layout)
 
-        # Events list
-        self.events_list = QListWidget()
+        # Events list (rows are painted by the delegate, no per-row widgets)
+        self.model = EventsModel(self)
+        self.delegate = EventItemDelegate(self)
+        self.delegate.action_clicked.connect(self.on_event_action)
+        self.event_actions = {
+            'edit': self.on_edit_event,
+            'delete': self.on_delete_event
+        }
+
+        self.events_list = QListView()
         self.events_list.setSpacing(2)
+        # Day headers are shorter than event rows, so sizes are not uniform here;
+        # batched layout still keeps large months from blocking the UI
+        self.events_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.events_list.setBatchSize(64)
+        self.events_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.events_list.setMouseTracking(True)
+        self.events_list.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.events_list.setModel(self.model)
+        self.events_list.setItemDelegate(self.delegate)
+        self.events_list.doubleClicked.connect(self.on_event_double_clicked)
         layout.addWidget(self.events_list)
 
         # Action buttons
@@ -112,7 +184,7 @@ class EventsList(QWidget):
         self.btn_refresh = QPushButton("🔄 Actualizar")
         self.btn_refresh.setFixedWidth(120)
         self.btn_refresh.setMinimumHeight(35)
-        self.btn_refresh.clicked.connect(self.load_events)
+        self.btn_refresh.clicked.connect(self.reload_events)
 
         buttons_layout.addWidget(self.btn_new_event, 1)
         buttons_layout.addWidget(self.btn_refresh)
@@ -121,50 +193,11 @@ class EventsList(QWidget):
 
     def apply_styles(self):
         """Apply styles to the widget"""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #2b2b2b;
-                color: #cccccc;
-            }
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 10pt;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border-color: #007acc;
-            }
-            QPushButton:pressed {
-                background-color: #1e1e1e;
-            }
-            QListWidget {
-                background-color: #252525;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 5px;
-            }
-            QListWidget::item {
-                background-color: transparent;
-                border: none;
-                padding: 2px;
-            }
-            QListWidget::item:selected {
-                background-color: transparent;
-                border: none;
-            }
-        """)
+        self.setStyleSheet(_EVENTS_QSS)
 
     def update_month_label(self):
         """Update the month label text"""
-        months = [
-            "Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio",
-            "Julio", "Agosto", "Septiembre", "Octubre", "Noviembre", "Diciembre"
-        ]
-        month_name = months[self.current_month - 1]
+        month_name = _MONTH_NAMES[self.current_month - 1]
         self.month_label.setText(f"{month_name} {self.current_year}")
 
     def previous_month(self):
@@ -200,109 +233,147 @@ class EventsList(QWidget):
         logger.debug(f"Navigated to today: {self.current_year}-{self.current_month:02d}")
 
     def load_events(self):
-        """Load events for current month from database"""
-        try:
-            logger.info(f"Loading events for {self.current_year}-{self.current_month:02d}")
-
-            # Clear current list
-            self.events_list.clear()
-
-            # Get events from database
-            events = self.db.get_events_by_month(self.current_year, self.current_month)
-
-            if not events:
-                # Show "no events" message
-                item = QListWidgetItem("No hay eventos en este mes")
-                item.setFlags(Qt.ItemFlag.NoItemFlags)
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.events_list.addItem(item)
-                logger.debug("No events found for this month")
-                return
-
-            # Group events by day
-            events_by_day = defaultdict(list)
-            for event in events:
-                day = event['event_datetime'][:10]  # YYYY-MM-DD
-                events_by_day[day].append(event)
-
-            # Add events to list grouped by day
-            for day in sorted(events_by_day.keys()):
-                # Add day header
-                self.add_day_header(day)
+        """Schedule a reload, coalescing bursts of requests into one"""
+        self.reload_timer.start()
+
+    def _do_load_events(self):
+        """Load events for current month from cache or database (in a worker thread)"""
+        logger.info(f"Loading events for {self.current_year}-{self.current_month:02d}")
+
+        # Results of older requests still running are discarded
+        self._load_request_id += 1
+
+        key = (self.current_year, self.current_month)
+        events = self._month_cache.get(key)
+        if events is not None:
+            self._month_cache.move_to_end(key)
+            self.show_events(events)
+            return
+
+        year, month = key
+        worker = DBQueryWorker(
+            self.db,
+            lambda conn: (key, self.db.get_events_by_month(year, month, conn=conn)),
+            self._load_request_id,
+            self
+        )
+        worker.result_ready.connect(self._on_events_loaded)
+        worker.error.connect(self._on_events_load_error)
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
+
+    def _on_events_loaded(self, request_id, result):
+        """Cache and show the events returned by the worker thread"""
+        if request_id != self._load_request_id:
+            return
 
-                # Add events for this day
-                for event in events_by_day[day]:
-                    self.add_event_item(event)
+        key, events = result
+        self._month_cache[key] = events
+        if len(self._month_cache) > self.MONTH_CACHE_SIZE:
+            self._month_cache.popitem(last=False)
 
-            logger.info(f"Loaded {len(events)} events in {len(events_by_day)} days")
+        self.show_events(events)
 
-        except Exception as e:
-            logger.error(f"Error loading events: {e}", exc_info=True)
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Error al cargar eventos: {str(e)}"
-            )
+    def _on_events_load_error(self, request_id, message):
+        """Report a failed events query"""
+        if request_id != self._load_request_id:
+            return
 
-    def add_day_header(self, day_str):
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"Error al cargar eventos: {message}"
+        )
+
+    def show_events(self, events):
         """
-        Add a day header to the list
+        Display a month of events grouped by day
 
         Args:
-            day_str: Date string in YYYY-MM-DD format
+            events: Event dictionaries sorted by event_datetime
         """
-        # Parse date
-        try:
-            date_obj = datetime.strptime(day_str, "%Y-%m-%d")
-            days_of_week = ["Lun", "Mar", "Mié", "Jue", "Vie", "Sáb", "Dom"]
-            day_name = days_of_week[date_obj.weekday()]
-            formatted_date = f"{day_name} {date_obj.day:02d}"
-        except:
-            formatted_date = day_str
-
-        # Create header item
-        header_text = f"📅 {formatted_date}"
-        item = QListWidgetItem(header_text)
-        item.setFlags(Qt.ItemFlag.NoItemFlags)  # Not selectable
+        if not events:
+            # Show "no events" message
+            self.model.setRows([], self.EMPTY_MESSAGE)
+            logger.debug("No events found for this month")
+            return
+
+        # Build rows grouped by day (events arrive sorted by event_datetime)
+        rows = []
+        prev_day = None
+        day_count = 0
+        for event in events:
+            day = event['event_datetime'][:10]  # YYYY-MM-DD
+            if day != prev_day:
+                # Add day header
+                rows.append(self.format_day_header(day))
+                prev_day = day
+                day_count += 1
+            rows.append(event)
 
-        # Style the header
-        header_font = QFont()
-        header_font.setPointSize(10)
-        header_font.setBold(True)
-        item.setFont(header_font)
-        item.setForeground(Qt.GlobalColor.white)
-        item.setBackground(Qt.GlobalColor.darkGray)
+        # Single model reset, painting once at the end
+        self.events_list.setUpdatesEnabled(False)
+        try:
+            self.model.setRows(rows, self.EMPTY_MESSAGE)
+        finally:
+            self.events_list.setUpdatesEnabled(True)
 
-        self.events_list.addItem(item)
+        logger.info(f"Loaded {len(events)} events in {day_count} days")
 
-    def add_event_item(self, event):
+    def invalidate_month(self, year=None, month=None):
         """
-        Add an event item to the list
+        Drop cached events
 
         Args:
-            event: Event dictionary
+            year: Year of the month to drop (None drops every month)
+            month: Month to drop
         """
-        # Create EventItemWidget
-        event_widget = EventItemWidget(event)
+        if year is None:
+            self._month_cache.clear()
+        else:
+            self._month_cache.pop((year, month), None)
+
+    def reload_events(self):
+        """Discard cached months and reload the current one from the database"""
+        self.invalidate_month()
+        self.load_events()
 
-        # Connect signals
-        event_widget.edit_requested.connect(self.on_edit_event)
-        event_widget.delete_requested.connect(self.on_delete_event)
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def format_day_header(day_str):
+        """
+        Build the text of a day header row
 
-        # Create list item
-        list_item = QListWidgetItem()
-        list_item.setSizeHint(event_widget.sizeHint())
-        list_item.setData(Qt.ItemDataRole.UserRole, event)
+        Cached because the same months are revisited while navigating.
 
-        # Add to list
-        self.events_list.addItem(list_item)
-        self.events_list.setItemWidget(list_item, event_widget)
+        Args:
+            day_str: Date string in YYYY-MM-DD format
+        """
+        # Parse date by slicing (much cheaper than strptime)
+        try:
+            day = int(day_str[8:10])
+            weekday = date(int(day_str[0:4]), int(day_str[5:7]), day).weekday()
+            formatted_date = f"{_DAYS_OF_WEEK[weekday]} {day:02d}"
+        except ValueError:
+            formatted_date = day_str
+
+        return f"📅 {formatted_date}"
 
     def create_event(self):
         """Handle new event button click"""
         logger.debug("Create event requested")
         self.create_event_requested.emit()
 
+    def on_event_action(self, action, event):
+        """Dispatch a row action (edit/delete) to its handler"""
+        self.event_actions[action](event)
+
+    def on_event_double_clicked(self, index):
+        """Handle double click on a row to edit"""
+        event = self.model.event_at(index.row())
+        if event is not None:
+            self.on_event_action('edit', event)
+
     def on_edit_event(self, event):
         """Handle edit event request"""
         logger.debug(f"Edit event: {event['id']}")
@@ -322,7 +393,16 @@ class EventsList(QWidget):
             try:
                 self.db.delete_calendar_event(event['id'])
                 logger.info(f"Event deleted: {event['id']}")
-                self.load_events()  # Refresh list
+
+                # Drop the event from its cached month
+                event_datetime = event['event_datetime']
+                cached = self._month_cache.get((int(event_datetime[0:4]), int(event_datetime[5:7])))
+                if cached is not None:
+                    cached[:] = [e for e in cached if e['id'] != event['id']]
+
+                # Remove just this row instead of reloading the list
+                if not self.model.remove_event(event):
+                    self.load_events()
                 self.refresh_needed.emit()
             except Exception as e:
                 logger.error(f"Error deleting event: {e}", exc_info=True)
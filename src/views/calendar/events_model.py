@@ -0,0 +1,118 @@
+"""
+Events Model
+List model holding the day headers and events displayed by EventsList
+"""
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+
+class EventsModel(QAbstractListModel):
+    """
+    Model for the events list
+    Rows are event dictionaries with day header strings interleaved;
+    when there are no events it can expose a single message row instead
+    """
+
+    def __init__(self, parent=None):
+        """
+        Initialize events model
+
+        Args:
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._rows = []
+        self._message = None
+
+    def rowCount(self, parent=QModelIndex()):
+        """Number of rows (headers + events, or 1 for the message row)"""
+        if parent.isValid():
+            return 0
+        if self._rows:
+            return len(self._rows)
+        return 1 if self._message else 0
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return row data for the given role"""
+        if not index.isValid():
+            return None
+
+        row = self.row_at(index.row())
+        if role == Qt.ItemDataRole.DisplayRole:
+            if row is None:
+                return self._message
+            if isinstance(row, str):
+                return row
+            return row.get('title')
+        if role == Qt.ItemDataRole.UserRole and isinstance(row, dict):
+            return row
+        return None
+
+    def flags(self, index):
+        """Headers and message row are inert; event rows are enabled"""
+        if isinstance(self.row_at(index.row()), dict):
+            return Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.NoItemFlags
+
+    def setRows(self, rows, message=None):
+        """
+        Replace all rows
+
+        Args:
+            rows: List of event dictionaries and day header strings
+            message: Text shown as the only row when rows is empty
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self._message = message
+        self.endResetModel()
+
+    def row_at(self, row):
+        """
+        Get the raw row
+
+        Returns:
+            Event dictionary, day header string, or None for the message row
+        """
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def event_at(self, row):
+        """Get the event dictionary for a row (None for headers/message)"""
+        value = self.row_at(row)
+        return value if isinstance(value, dict) else None
+
+    def remove_event(self, event):
+        """
+        Remove an event row, and its day header if it was the day's last event
+
+        Args:
+            event: Event dictionary (matched by id)
+
+        Returns:
+            True if the event was found and removed
+        """
+        event_id = event['id']
+        for row, value in enumerate(self._rows):
+            if isinstance(value, dict) and value['id'] == event_id:
+                break
+        else:
+            return False
+
+        first, last = row, row
+        next_row = self.row_at(row + 1)
+        if isinstance(self.row_at(row - 1), str) and (next_row is None or isinstance(next_row, str)):
+            first = row - 1
+
+        if last - first + 1 == len(self._rows) and self._message:
+            # Last event gone: the message row takes its place
+            self.beginResetModel()
+            del self._rows[first:last + 1]
+            self.endResetModel()
+            return True
+
+        self.beginRemoveRows(QModelIndex(), first, last)
+        del self._rows[first:last + 1]
+        self.endRemoveRows()
+        return True
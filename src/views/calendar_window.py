@@ -5,9 +5,9 @@ Main window for calendar events and alerts management
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QPushButton, QLabel
+    QTabWidget, QPushButton, QLabel, QStatusBar
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QSettings, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QFont
 import logging
 
@@ -15,11 +15,111 @@ from .calendar.events_list import EventsList
 from .alerts.alerts_list import AlertsList
 from .dialogs.event_editor_dialog import EventEditorDialog
 from .dialogs.alert_editor_dialog import AlertEditorDialog
-from .dialogs.notification_dialog import NotificationDialog
+from .dialogs.notification_dialog import AlertNotificationManager
 from src.core.alert_service import AlertService
+from src.utils.screen_geometry import get_available_geometry
 
 logger = logging.getLogger(__name__)
 
+# Stylesheet shared by all CalendarWindow instances
+_CALENDAR_QSS = """
+    QMainWindow {
+        background-color: #2b2b2b;
+        color: #cccccc;
+    }
+
+    /* Custom Title Bar */
+    #titleBar {
+        background-color: #1e1e1e;
+        border-bottom: 1px solid #3d3d3d;
+    }
+
+    #titleBarButton {
+        background-color: transparent;
+        color: #cccccc;
+        border: none;
+        border-radius: 3px;
+        font-size: 16pt;
+        font-weight: bold;
+    }
+
+    #titleBarButton:hover {
+        background-color: #3d3d3d;
+    }
+
+    #titleBarButtonClose {
+        background-color: transparent;
+        color: #cccccc;
+        border: none;
+        border-radius: 3px;
+        font-size: 18pt;
+        font-weight: bold;
+    }
+
+    #titleBarButtonClose:hover {
+        background-color: #e81123;
+        color: #ffffff;
+    }
+
+    /* Tab Widget */
+    QTabWidget::pane {
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        background-color: #2b2b2b;
+        margin-top: -1px;
+    }
+
+    QTabBar::tab {
+        background-color: #252525;
+        color: #cccccc;
+        padding: 12px 24px;
+        margin-right: 2px;
+        border: 1px solid #3d3d3d;
+        border-bottom: none;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+        font-size: 10pt;
+    }
+
+    QTabBar::tab:selected {
+        background-color: #2b2b2b;
+        color: #ffffff;
+        border-bottom: 2px solid #007acc;
+    }
+
+    QTabBar::tab:hover:!selected {
+        background-color: #2d2d2d;
+    }
+
+    QStatusBar {
+        background-color: #1e1e1e;
+        color: #cccccc;
+        border-top: 1px solid #3d3d3d;
+    }
+
+    /* Labels */
+    QLabel {
+        color: #cccccc;
+        padding: 20px;
+        font-size: 11pt;
+    }
+"""
+
+
+# Title font shared by all CalendarWindow instances, created on first use
+# (a QFont needs the QApplication to exist)
+_title_font = None
+
+
+def _get_title_font():
+    """Get the shared bold title font"""
+    global _title_font
+    if _title_font is None:
+        _title_font = QFont()
+        _title_font.setPointSize(11)
+        _title_font.setBold(True)
+    return _title_font
+
 
 class CalendarWindow(QMainWindow):
     """
@@ -41,16 +141,35 @@ class CalendarWindow(QMainWindow):
         super().__init__(parent)
         self.controller = controller
         self.db = controller.config_manager.db if controller else None
+        self.settings = QSettings("WidgetSidebar", "CalendarWindow")
+
+        # Tab widgets, built when their tab is first shown
+        self.events_list = None
+        self.alerts_list = None
+
+        # Created by setup_alert_service once the window is shown
+        self.alert_service = None
+
+        # Editor dialogs, created on first use and reused afterwards
+        self._event_dialog = None
+        self._alert_dialog = None
+
+        # Title bar drag offset, only used when startSystemMove() is unsupported
+        self.drag_position = None
+
+        # Shared popup for triggered alerts, shown one at a time
+        self.notifications = AlertNotificationManager.instance()
+        self.notifications.alert_shown.connect(self.on_notification_shown)
 
         self.setup_window()
         self.setup_ui()
         self.apply_styles()
 
-        # Initialize and start AlertService
-        self.setup_alert_service()
+        # Initialize and start AlertService once the window has been shown
+        QTimer.singleShot(0, self.setup_alert_service)
 
-        # Position window centered on screen
-        self.center_on_screen()
+        # Restore last geometry (centered on screen the first time)
+        self.restore_geometry()
 
         logger.info("CalendarWindow initialized")
 
@@ -83,24 +202,58 @@ class CalendarWindow(QMainWindow):
         main_layout.addWidget(self.create_title_bar())
 
         # Add tab widget
+        # Tab contents are built the first time each tab is shown
         self.tab_widget = QTabWidget()
+        self._tab_factories = {
+            0: self._make_events_tab,
+            1: self._make_alerts_tab
+        }
+        self._tab_built = {}
+
+        for label in ("📅 Eventos", "🔔 Alertas"):
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self.tab_widget.addTab(page, label)
+
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(self.tab_widget.currentIndex())
+
+        main_layout.addWidget(self.tab_widget)
 
-        # Events tab with EventsList
+        # Status bar for transient confirmations (e.g. "Alerta creada")
+        self.setStatusBar(QStatusBar())
+
+    def _ensure_tab_built(self, index):
+        """
+        Build the real widget of a tab the first time it is shown
+
+        Args:
+            index: Tab index
+        """
+        if index in self._tab_built or index not in self._tab_factories:
+            return
+
+        widget = self._tab_factories[index]()
+        self.tab_widget.widget(index).layout().addWidget(widget)
+        self._tab_built[index] = widget
+        logger.debug(f"Tab {index} built")
+
+    def _make_events_tab(self):
+        """Create the events tab with EventsList"""
         self.events_list = EventsList(self.db)
-        # Connect signals (editors will be implemented in Phase 7)
         self.events_list.create_event_requested.connect(self.on_create_event_requested)
         self.events_list.edit_event_requested.connect(self.on_edit_event_requested)
+        return self.events_list
 
-        # Alerts tab with AlertsList
+    def _make_alerts_tab(self):
+        """Create the alerts tab with AlertsList"""
         self.alerts_list = AlertsList(self.db)
-        # Connect signals (editors will be implemented in Phase 7)
         self.alerts_list.create_alert_requested.connect(self.on_create_alert_requested)
         self.alerts_list.edit_alert_requested.connect(self.on_edit_alert_requested)
-
-        self.tab_widget.addTab(self.events_list, "📅 Eventos")
-        self.tab_widget.addTab(self.alerts_list, "🔔 Alertas")
-
-        main_layout.addWidget(self.tab_widget)
+        if self.alert_service is not None:
+            self.alerts_list.alert_changed.connect(self.alert_service.reschedule)
+        return self.alerts_list
 
     def create_title_bar(self):
         """
@@ -119,10 +272,7 @@ class CalendarWindow(QMainWindow):
 
         # Window icon and title
         title_label = QLabel("📅 Calendario y Alertas")
-        title_font = QFont()
-        title_font.setPointSize(11)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_get_title_font())
 
         layout.addWidget(title_label)
         layout.addStretch()
@@ -167,27 +317,37 @@ class CalendarWindow(QMainWindow):
             self.btn_maximize.setText("❐")
 
     def title_bar_mouse_press(self, event):
-        """Handle mouse press on title bar for window dragging"""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.drag_position = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+        """
+        Handle mouse press on title bar: let the window manager drag the window
+
+        Falls back to moving the window from title_bar_mouse_move when the
+        platform doesn't support startSystemMove().
+        """
+        self.drag_position = None
+        # Only allow dragging when not maximized
+        if event.button() == Qt.MouseButton.LeftButton and not self.isMaximized():
+            if not self.windowHandle().startSystemMove():
+                self.drag_position = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
             event.accept()
 
     def title_bar_mouse_move(self, event):
-        """Handle mouse move on title bar for window dragging"""
-        if event.buttons() == Qt.MouseButton.LeftButton and hasattr(self, 'drag_position'):
+        """Handle mouse move on title bar for the manual dragging fallback"""
+        if event.buttons() == Qt.MouseButton.LeftButton and self.drag_position is not None:
             # Only allow dragging when not maximized
             if self.isMaximized():
                 return
             self.move(event.globalPosition().toPoint() - self.drag_position)
             event.accept()
 
+    def restore_geometry(self):
+        """Restore the window geometry saved on close, or center it on first run"""
+        geometry = self.settings.value("geometry")
+        if geometry is None or not self.restoreGeometry(geometry):
+            self.center_on_screen()
+
     def center_on_screen(self):
         """Center the window on the screen with appropriate size"""
-        from PyQt6.QtGui import QGuiApplication
-
-        # Get the primary screen
-        screen = QGuiApplication.primaryScreen()
-        screen_geometry = screen.availableGeometry()
+        screen_geometry = get_available_geometry()
 
         # Set window size to 80% of screen size
         window_width = int(screen_geometry.width() * 0.8)
@@ -203,92 +363,34 @@ class CalendarWindow(QMainWindow):
 
     def apply_styles(self):
         """Apply dark theme styles to the window"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2b2b2b;
-                color: #cccccc;
-            }
-
-            /* Custom Title Bar */
-            #titleBar {
-                background-color: #1e1e1e;
-                border-bottom: 1px solid #3d3d3d;
-            }
-
-            #titleBarButton {
-                background-color: transparent;
-                color: #cccccc;
-                border: none;
-                border-radius: 3px;
-                font-size: 16pt;
-                font-weight: bold;
-            }
-
-            #titleBarButton:hover {
-                background-color: #3d3d3d;
-            }
-
-            #titleBarButtonClose {
-                background-color: transparent;
-                color: #cccccc;
-                border: none;
-                border-radius: 3px;
-                font-size: 18pt;
-                font-weight: bold;
-            }
-
-            #titleBarButtonClose:hover {
-                background-color: #e81123;
-                color: #ffffff;
-            }
-
-            /* Tab Widget */
-            QTabWidget::pane {
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                background-color: #2b2b2b;
-                margin-top: -1px;
-            }
-
-            QTabBar::tab {
-                background-color: #252525;
-                color: #cccccc;
-                padding: 12px 24px;
-                margin-right: 2px;
-                border: 1px solid #3d3d3d;
-                border-bottom: none;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                font-size: 10pt;
-            }
-
-            QTabBar::tab:selected {
-                background-color: #2b2b2b;
-                color: #ffffff;
-                border-bottom: 2px solid #007acc;
-            }
-
-            QTabBar::tab:hover:!selected {
-                background-color: #2d2d2d;
-            }
-
-            /* Labels */
-            QLabel {
-                color: #cccccc;
-                padding: 20px;
-                font-size: 11pt;
-            }
-        """)
-
+        self.setStyleSheet(_CALENDAR_QSS)
+
+    def get_event_dialog(self):
+        """Get the reusable EventEditorDialog, creating it on first use"""
+        if self._event_dialog is None:
+            self._event_dialog = EventEditorDialog(self.db, parent=self)
+        return self._event_dialog
+
+    def get_alert_dialog(self):
+        """Get the reusable AlertEditorDialog, creating it on first use"""
+        if self._alert_dialog is None:
+            self._alert_dialog = AlertEditorDialog(self.db, parent=self)
+            if self.alert_service is not None:
+                self._alert_dialog.accepted.connect(self.alert_service.reschedule)
+        return self._alert_dialog
+
+    @pyqtSlot()
     def on_create_event_requested(self):
         """Handle create event request - open EventEditorDialog"""
         logger.info("Create event requested")
-        dialog = EventEditorDialog(self.db, parent=self)
+        dialog = self.get_event_dialog()
+        dialog.prepare()
         if dialog.exec():
             # Refresh events list after creation
             self.refresh_events()
             logger.debug("Event created, list refreshed")
 
+    @pyqtSlot(dict)
     def on_edit_event_requested(self, event):
         """
         Handle edit event request - open EventEditorDialog
@@ -297,21 +399,25 @@ class CalendarWindow(QMainWindow):
             event: Event dictionary to edit
         """
         logger.info(f"Edit event requested: {event['id']}")
-        dialog = EventEditorDialog(self.db, event=event, parent=self)
+        dialog = self.get_event_dialog()
+        dialog.prepare(event=event)
         if dialog.exec():
             # Refresh events list after edit
             self.refresh_events()
             logger.debug("Event edited, list refreshed")
 
+    @pyqtSlot()
     def on_create_alert_requested(self):
         """Handle create alert request - open AlertEditorDialog"""
         logger.info("Create alert requested")
-        dialog = AlertEditorDialog(self.db, parent=self)
+        dialog = self.get_alert_dialog()
+        dialog.prepare()
         if dialog.exec():
             # Refresh alerts list after creation
             self.refresh_alerts()
             logger.debug("Alert created, list refreshed")
 
+    @pyqtSlot(dict)
     def on_edit_alert_requested(self, alert):
         """
         Handle edit alert request - open AlertEditorDialog
@@ -320,7 +426,8 @@ class CalendarWindow(QMainWindow):
             alert: Alert dictionary to edit
         """
         logger.info(f"Edit alert requested: {alert['id']}")
-        dialog = AlertEditorDialog(self.db, alert=alert, parent=self)
+        dialog = self.get_alert_dialog()
+        dialog.prepare(alert=alert)
         if dialog.exec():
             # Refresh alerts list after edit
             self.refresh_alerts()
@@ -330,11 +437,19 @@ class CalendarWindow(QMainWindow):
         """Initialize and start the AlertService"""
         if self.db:
             try:
-                # Create AlertService with 60-second check interval
-                self.alert_service = AlertService(self.db, check_interval=60000)
+                # Create AlertService (wakes up only when the next alert is due)
+                self.alert_service = AlertService(self.db)
 
                 # Connect alert_triggered signal to show notification
-                self.alert_service.alert_triggered.connect(self.on_alert_triggered)
+                # (queued: the notification opens after check_alerts has finished)
+                self.alert_service.alert_triggered.connect(
+                    self.on_alert_triggered, Qt.ConnectionType.QueuedConnection)
+
+                # Reschedule when alerts change (the list/dialog may already exist)
+                if self.alerts_list is not None:
+                    self.alerts_list.alert_changed.connect(self.alert_service.reschedule)
+                if self._alert_dialog is not None:
+                    self._alert_dialog.accepted.connect(self.alert_service.reschedule)
 
                 # Start the service
                 self.alert_service.start()
@@ -345,49 +460,47 @@ class CalendarWindow(QMainWindow):
         else:
             logger.warning("AlertService not initialized: no database connection")
 
+    @pyqtSlot(dict, dict)
     def on_alert_triggered(self, alert, item):
         """
         Handle alert triggered by AlertService
-        Shows notification dialog
+        Queues the alert for the shared notification popup
 
         Args:
             alert: Alert dictionary
             item: Item dictionary
         """
         logger.info(f"Alert triggered: {alert.get('id')} - {alert.get('alert_title')}")
+        self.notifications.show_alert(alert, item)
 
-        try:
-            # Show notification dialog
-            notification = NotificationDialog(alert, item, self)
-            notification.exec()
-
-            # Refresh alerts list to show updated status
-            self.refresh_alerts()
-
-            logger.debug("Notification shown and alerts refreshed")
-
-        except Exception as e:
-            logger.error(f"Error showing notification: {e}", exc_info=True)
+    @pyqtSlot(dict)
+    def on_notification_shown(self, alert):
+        """Refresh alerts list to show the updated status of a notified alert"""
+        self.refresh_alerts()
+        logger.debug("Notification shown and alerts refreshed")
 
     def refresh_events(self):
         """Refresh the events list"""
-        if hasattr(self, 'events_list'):
-            self.events_list.load_events()
+        if self.events_list is not None:
+            self.events_list.reload_events()
             logger.debug("Events list refreshed")
 
     def refresh_alerts(self):
         """Refresh the alerts list"""
-        if hasattr(self, 'alerts_list'):
+        if self.alerts_list is not None:
             self.alerts_list.load_alerts()
             logger.debug("Alerts list refreshed")
 
     def closeEvent(self, event):
         """Handle window close event"""
         # Stop AlertService
-        if hasattr(self, 'alert_service'):
+        if self.alert_service is not None:
             self.alert_service.stop()
             logger.info("AlertService stopped")
 
+        # Remember geometry for the next time the window is opened
+        self.settings.setValue("geometry", self.saveGeometry())
+
         logger.info("CalendarWindow closed")
         self.window_closed.emit()
         event.accept()
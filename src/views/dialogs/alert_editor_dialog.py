@@ -6,15 +6,114 @@ Dialog for creating and editing alerts
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QHBoxLayout,
     QLineEdit, QTextEdit, QComboBox, QDateTimeEdit,
-    QPushButton, QDialogButtonBox, QMessageBox, QLabel, QCheckBox
+    QPushButton, QMessageBox, QLabel, QCheckBox
 )
 from PyQt6.QtCore import Qt, QDateTime
-from PyQt6.QtGui import QFont
-from datetime import datetime
+from PyQt6.QtGui import QFont, QStandardItemModel, QStandardItem
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Stylesheet shared by all AlertEditorDialog instances
+_ALERT_DIALOG_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: #cccccc;
+    }
+    QLabel {
+        color: #cccccc;
+    }
+    QLineEdit, QTextEdit {
+        background-color: #1e1e1e;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 6px;
+        font-size: 10pt;
+    }
+    QLineEdit:focus, QTextEdit:focus {
+        border-color: #007acc;
+    }
+    QComboBox {
+        background-color: #1e1e1e;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 6px;
+        font-size: 10pt;
+    }
+    QComboBox:hover {
+        border-color: #007acc;
+    }
+    QComboBox::drop-down {
+        border: none;
+    }
+    QDateTimeEdit {
+        background-color: #1e1e1e;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 6px;
+        font-size: 10pt;
+    }
+    QDateTimeEdit:focus {
+        border-color: #007acc;
+    }
+    QCheckBox {
+        color: #cccccc;
+        font-size: 10pt;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        border: 1px solid #3d3d3d;
+        border-radius: 3px;
+        background-color: #1e1e1e;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #007acc;
+        border-color: #007acc;
+    }
+    QPushButton {
+        background-color: #2d2d2d;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 8px 20px;
+        font-size: 10pt;
+        min-width: 100px;
+    }
+    QPushButton:hover {
+        background-color: #3d3d3d;
+        border-color: #007acc;
+    }
+    QPushButton:pressed {
+        background-color: #1e1e1e;
+    }
+    QPushButton[default="true"] {
+        background-color: #007acc;
+        color: #ffffff;
+    }
+    QPushButton[default="true"]:hover {
+        background-color: #005a9e;
+    }
+"""
+
+
+# Header font reused by every AlertEditorDialog; built lazily because
+# creating a QFont before the QApplication is not allowed
+_title_font = None
+
+
+def _get_title_font():
+    """Get the shared bold title font"""
+    global _title_font
+    if _title_font is None:
+        _title_font = QFont()
+        _title_font.setPointSize(12)
+        _title_font.setBold(True)
+    return _title_font
+
 
 class AlertEditorDialog(QDialog):
     """
@@ -22,6 +121,10 @@ class AlertEditorDialog(QDialog):
     Provides a simple form for alert data entry
     """
 
+    # Items combo model shared by all instances, refilled when db.get_items_cache_key() changes
+    _items_model = None
+    _items_model_version = None
+
     def __init__(self, db_manager, alert=None, item_id=None, parent=None):
         """
         Initialize alert editor dialog
@@ -63,15 +166,15 @@ class AlertEditorDialog(QDialog):
         layout.setSpacing(15)
 
         # Title
-        title_label = QLabel("🔔 " + ("Editar Alerta" if self.is_edit_mode else "Nueva Alerta"))
-        title_font = QFont()
-        title_font.setPointSize(12)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        layout.addWidget(title_label)
+        self.title_label = QLabel("🔔 " + ("Editar Alerta" if self.is_edit_mode else "Nueva Alerta"))
+        self.title_label.setFont(_get_title_font())
+        layout.addWidget(self.title_label)
 
         # Form layout
         form_layout = QFormLayout()
+
+        # Build the form without intermediate repaints; laid out once at the end
+        self.setUpdatesEnabled(False)
         form_layout.setSpacing(10)
 
         # Item selector
@@ -114,8 +217,7 @@ class AlertEditorDialog(QDialog):
 
         # Info box
         info_label = QLabel(
-            "💡 Las alertas se dispararán automáticamente cuando llegue su fecha/hora. "
-            "El servicio de alertas revisa cada 60 segundos."
+            "💡 Las alertas se dispararán automáticamente cuando llegue su fecha/hora."
         )
         info_label.setWordWrap(True)
         info_label.setStyleSheet("""
@@ -133,136 +235,73 @@ class AlertEditorDialog(QDialog):
         note_label.setStyleSheet("color: #999999; font-size: 9pt;")
         layout.addWidget(note_label)
 
+        # Inline validation error (hidden until validate() fails)
+        self.error_label = QLabel()
+        self.error_label.setStyleSheet("color: #ff6b6b;")
+        self.error_label.setWordWrap(True)
+        self.error_label.hide()
+        layout.addWidget(self.error_label)
+
         layout.addStretch()
 
         # Buttons
-        button_box = QDialogButtonBox()
-
         self.save_button = QPushButton("💾 Guardar")
         self.save_button.setDefault(True)
         self.cancel_button = QPushButton("❌ Cancelar")
 
-        button_box.addButton(self.save_button, QDialogButtonBox.ButtonRole.AcceptRole)
-        button_box.addButton(self.cancel_button, QDialogButtonBox.ButtonRole.RejectRole)
+        self.save_button.clicked.connect(self.save)
+        self.cancel_button.clicked.connect(self.reject)
 
-        button_box.accepted.connect(self.save)
-        button_box.rejected.connect(self.reject)
+        buttons_layout = QHBoxLayout()
+        buttons_layout.addStretch()
+        buttons_layout.addWidget(self.cancel_button)
+        buttons_layout.addWidget(self.save_button)
+        layout.addLayout(buttons_layout)
 
-        layout.addWidget(button_box)
+        self.setUpdatesEnabled(True)
+        self.adjustSize()
 
     def apply_styles(self):
         """Apply dark theme styles"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: #cccccc;
-            }
-            QLabel {
-                color: #cccccc;
-            }
-            QLineEdit, QTextEdit {
-                background-color: #1e1e1e;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 10pt;
-            }
-            QLineEdit:focus, QTextEdit:focus {
-                border-color: #007acc;
-            }
-            QComboBox {
-                background-color: #1e1e1e;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 10pt;
-            }
-            QComboBox:hover {
-                border-color: #007acc;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QDateTimeEdit {
-                background-color: #1e1e1e;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 10pt;
-            }
-            QDateTimeEdit:focus {
-                border-color: #007acc;
-            }
-            QCheckBox {
-                color: #cccccc;
-                font-size: 10pt;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border: 1px solid #3d3d3d;
-                border-radius: 3px;
-                background-color: #1e1e1e;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #007acc;
-                border-color: #007acc;
-            }
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 8px 20px;
-                font-size: 10pt;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border-color: #007acc;
-            }
-            QPushButton:pressed {
-                background-color: #1e1e1e;
-            }
-            QPushButton[default="true"] {
-                background-color: #007acc;
-                color: #ffffff;
-            }
-            QPushButton[default="true"]:hover {
-                background-color: #005a9e;
-            }
-        """)
+        self.setStyleSheet(_ALERT_DIALOG_QSS)
 
-    def load_items(self):
-        """Load items from database into combo box"""
-        try:
-            conn = self.db.connect()
-            cursor = conn.cursor()
-            cursor.execute("SELECT id, label FROM items ORDER BY label")
-            items = cursor.fetchall()
+    def get_items_model(self):
+        """
+        Get the items model shared by the combo box of every dialog
+
+        The model is refilled in place when the database's items cache
+        key changes, so dialogs already using it see the new list.
+        """
+        version = (id(self.db), self.db.get_items_cache_key())
+        model = AlertEditorDialog._items_model
+        if model is None:
+            model = AlertEditorDialog._items_model = QStandardItemModel()
 
-            self.item_combo.clear()
+        if AlertEditorDialog._items_model_version != version:
+            # "None" option at the beginning, then all items
+            rows = [QStandardItem("(Ninguno - Sin item asociado)")]
+            for item_id, label in self.db.get_item_labels():
+                row = QStandardItem(label)
+                row.setData(item_id, Qt.ItemDataRole.UserRole)
+                rows.append(row)
 
-            # Add "None" option at the beginning
-            self.item_combo.addItem("(Ninguno - Sin item asociado)", None)
+            model.clear()
+            model.invisibleRootItem().appendRows(rows)
+            AlertEditorDialog._items_model_version = version
 
-            # Add all items
-            for item_id, label in items:
-                self.item_combo.addItem(label, item_id)
+        return model
+
+    def load_items(self):
+        """Load items from database into combo box"""
+        try:
+            model = self.get_items_model()
+            if self.item_combo.model() is not model:
+                self.item_combo.setModel(model)
 
             # Set default item if provided
-            if self.default_item_id:
-                index = self.item_combo.findData(self.default_item_id)
-                if index >= 0:
-                    self.item_combo.setCurrentIndex(index)
-            else:
-                # Select "None" by default if no default item
-                self.item_combo.setCurrentIndex(0)
+            self.select_default_item()
 
-            logger.debug(f"Loaded {len(items)} items into combo box")
+            logger.debug(f"Loaded {model.rowCount() - 1} items into combo box")
 
         except Exception as e:
             logger.error(f"Error loading items: {e}", exc_info=True)
@@ -272,6 +311,46 @@ class AlertEditorDialog(QDialog):
                 "No se pudieron cargar los items disponibles."
             )
 
+    def select_default_item(self):
+        """Select the default item in the combo box ("None" if there is no default)"""
+        if self.default_item_id:
+            index = self.item_combo.findData(self.default_item_id)
+            if index >= 0:
+                self.item_combo.setCurrentIndex(index)
+        else:
+            # Select "None" by default if no default item
+            self.item_combo.setCurrentIndex(0)
+
+    def prepare(self, alert=None, item_id=None):
+        """
+        Reset the dialog for a new create/edit session so it can be reused
+
+        Args:
+            alert: Alert dictionary for editing (None for create mode)
+            item_id: Default item ID for new alerts
+        """
+        self.alert = alert
+        self.default_item_id = item_id
+        self.is_edit_mode = alert is not None
+
+        title = "Editar Alerta" if self.is_edit_mode else "Nueva Alerta"
+        self.setWindowTitle(title)
+        self.title_label.setText("🔔 " + title)
+
+        # Reset form fields to their defaults
+        self.error_label.hide()
+        if AlertEditorDialog._items_model_version != (id(self.db), self.db.get_items_cache_key()):
+            self.load_items()
+        self.select_default_item()
+        self.title_edit.clear()
+        self.message_edit.clear()
+        self.datetime_edit.setDateTime(QDateTime.currentDateTime())
+        self.priority_combo.setCurrentIndex(1)  # Default to medium
+        self.enabled_checkbox.setChecked(True)
+
+        if self.is_edit_mode:
+            self.load_alert_data()
+
     def load_alert_data(self):
         """Load alert data into form fields"""
         if not self.alert:
@@ -294,7 +373,8 @@ class AlertEditorDialog(QDialog):
             # Set datetime
             datetime_str = self.alert.get('alert_datetime', '')
             if datetime_str:
-                dt = QDateTime.fromString(datetime_str, "yyyy-MM-dd HH:mm:ss")
+                # ISODate also accepts the "yyyy-MM-dd HH:mm:ss" form stored in the DB
+                dt = QDateTime.fromString(datetime_str, Qt.DateFormat.ISODate)
                 if dt.isValid():
                     self.datetime_edit.setDateTime(dt)
 
@@ -322,38 +402,47 @@ class AlertEditorDialog(QDialog):
         """
         # Check title
         if not self.title_edit.text().strip():
-            QMessageBox.warning(
-                self,
-                "Validación",
-                "El título es requerido."
-            )
-            self.title_edit.setFocus()
+            self.show_error("El título es requerido.", self.title_edit)
             return False
 
         # Check message
         if not self.message_edit.toPlainText().strip():
-            QMessageBox.warning(
-                self,
-                "Validación",
-                "El mensaje es requerido."
-            )
-            self.message_edit.setFocus()
+            self.show_error("El mensaje es requerido.", self.message_edit)
             return False
 
         # Item is now optional - no validation needed
 
         # Check datetime is valid
         if not self.datetime_edit.dateTime().isValid():
-            QMessageBox.warning(
-                self,
-                "Validación",
-                "La fecha y hora no son válidas."
-            )
-            self.datetime_edit.setFocus()
+            self.show_error("La fecha y hora no son válidas.", self.datetime_edit)
             return False
 
+        self.error_label.hide()
         return True
 
+    def show_error(self, message, widget):
+        """
+        Show a validation error below the form and focus the offending field
+
+        Args:
+            message: Error text
+            widget: Field to focus
+        """
+        self.error_label.setText(message)
+        self.error_label.show()
+        widget.setFocus()
+
+    def show_status(self, message):
+        """
+        Show a transient message in the parent window's status bar (if any)
+
+        Args:
+            message: Message text
+        """
+        parent = self.parent()
+        if parent is not None and hasattr(parent, 'statusBar'):
+            parent.statusBar().showMessage(message, 2000)
+
     def save(self):
         """Save alert to database"""
         if not self.validate():
@@ -382,11 +471,7 @@ class AlertEditorDialog(QDialog):
 
                 if success:
                     logger.info(f"Alert updated: {self.alert['id']}")
-                    QMessageBox.information(
-                        self,
-                        "Éxito",
-                        "Alerta actualizada correctamente."
-                    )
+                    self.show_status("Alerta actualizada correctamente.")
                     self.accept()
                 else:
                     raise Exception("La actualización retornó False")
@@ -398,19 +483,12 @@ class AlertEditorDialog(QDialog):
                     alert_datetime=alert_datetime,
                     alert_title=alert_title,
                     alert_message=alert_message,
-                    priority=priority
+                    priority=priority,
+                    is_enabled=is_enabled
                 )
 
-                # Update is_enabled if unchecked
-                if not is_enabled:
-                    self.db.update_item_alert(alert_id, is_enabled=0)
-
                 logger.info(f"Alert created: {alert_id}")
-                QMessageBox.information(
-                    self,
-                    "Éxito",
-                    "Alerta creada correctamente."
-                )
+                self.show_status("Alerta creada correctamente.")
                 self.accept()
 
         except Exception as e:
@@ -23,17 +23,238 @@ Fecha: 2025-12-26
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QTextEdit, QCheckBox, QPushButton, QMessageBox, QScrollArea,
+    QPlainTextEdit, QCheckBox, QPushButton, QMessageBox, QScrollArea,
     QWidget, QFrame
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QFont, QTextCursor
 from src.views.widgets.item_tags_section import ItemTagsSection
+from src.views.widgets.status_toast import StatusToast
 from src.core.global_tag_manager import GlobalTagManager
+from functools import lru_cache
+from operator import itemgetter
+import base64
+import os
+import tempfile
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Hojas de estilo compartidas por todas las instancias de EditItemDialog
+# (acotadas a #EditItemDialog; el texto se construye una sola vez)
+
+# Scroll area del formulario
+_SCROLL_QSS = """
+    #EditItemDialog QScrollArea#formScroll {
+        background: transparent;
+        border: none;
+    }
+    #EditItemDialog #formScroll QScrollBar:vertical {
+        background: #2d2d2d;
+        width: 10px;
+        border-radius: 5px;
+    }
+    #EditItemDialog #formScroll QScrollBar::handle:vertical {
+        background: #555555;
+        border-radius: 5px;
+        min-height: 20px;
+    }
+    #EditItemDialog #formScroll QScrollBar::handle:vertical:hover {
+        background: #00ff88;
+    }
+"""
+
+# Botón "Cargar contenido completo" bajo la vista previa del content
+_LOAD_FULL_BUTTON_QSS = """
+    #EditItemDialog QPushButton#loadFullButton {
+        background-color: #2d2d2d;
+        color: #FFA726;
+        border: 1px solid #555;
+        border-radius: 4px;
+        font-size: 10px;
+        padding: 6px 12px;
+    }
+    #EditItemDialog QPushButton#loadFullButton:hover {
+        border-color: #00ff88;
+    }
+"""
+
+# Icono de check (SVG blanco) del checkbox is_sensitive
+_CHECKMARK_SVG_B64 = (
+    "PHN2ZyB3aWR0aD0iMTYiIGhlaWdodD0iMTYiIHZpZXdCb3g9IjAgMCAxNiAxNiIgZmlsbD0ibm9u"
+    "ZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEzLjMzMzMg"
+    "NEw2IDExLjMzMzNMMi42NjY2NyA4IiBzdHJva2U9IndoaXRlIiBzdHJva2Utd2lkdGg9IjIiIHN0"
+    "cm9rZS1saW5lY2FwPSJyb3VuZCIgc3Ryb2tlLWxpbmVqb2luPSJyb3VuZCIvPgo8L3N2Zz4K"
+)
+_dialog_qss = None
+
+# Checkbox is_sensitive ($checkmark se sustituye por la ruta del SVG)
+_SENSITIVE_CHECKBOX_QSS = """
+    #EditItemDialog QCheckBox#sensitiveCheckbox {
+        color: #ffffff;
+        spacing: 8px;
+    }
+    #EditItemDialog QCheckBox#sensitiveCheckbox::indicator {
+        width: 20px;
+        height: 20px;
+        border: 2px solid #555;
+        border-radius: 4px;
+        background-color: #2d2d2d;
+    }
+    #EditItemDialog QCheckBox#sensitiveCheckbox::indicator:checked {
+        background-color: #FF5722;
+        border-color: #FF5722;
+        image: url("$checkmark");
+    }
+    #EditItemDialog QCheckBox#sensitiveCheckbox::indicator:hover {
+        border-color: #00ff88;
+    }
+"""
+
+# Advertencia para items sensibles
+_SENSITIVE_WARNING_QSS = """
+    #EditItemDialog QLabel#sensitiveWarning {
+        color: #FFA726;
+        font-size: 9px;
+        padding: 8px;
+        background-color: rgba(255, 167, 38, 0.1);
+        border-left: 3px solid #FFA726;
+        border-radius: 4px;
+    }
+"""
+
+# Botón Cancelar
+_CANCEL_BUTTON_QSS = """
+    #EditItemDialog QPushButton#cancelButton {
+        background-color: #555;
+        color: #ffffff;
+        border: 1px solid #666;
+        border-radius: 6px;
+        font-size: 11px;
+        font-weight: 600;
+        padding: 8px 16px;
+    }
+    #EditItemDialog QPushButton#cancelButton:hover {
+        background-color: #666;
+        border-color: #777;
+    }
+    #EditItemDialog QPushButton#cancelButton:pressed {
+        background-color: #444;
+    }
+"""
+
+# Botón Guardar
+_SAVE_BUTTON_QSS = """
+    #EditItemDialog QPushButton#saveButton {
+        background-color: #4CAF50;
+        color: #ffffff;
+        border: 1px solid #45a049;
+        border-radius: 6px;
+        font-size: 11px;
+        font-weight: 700;
+        padding: 8px 16px;
+    }
+    #EditItemDialog QPushButton#saveButton:hover {
+        background-color: #45a049;
+        border-color: #3d8b40;
+    }
+    #EditItemDialog QPushButton#saveButton:pressed {
+        background-color: #3d8b40;
+    }
+    #EditItemDialog QPushButton#saveButton:disabled {
+        background-color: #555;
+        color: #888;
+        border-color: #444;
+    }
+"""
+
+# Estilos base del diálogo (campos de texto)
+_EDIT_ITEM_DIALOG_QSS = """
+    QDialog#EditItemDialog {
+        background-color: #1e1e1e;
+        color: #ffffff;
+        font-family: 'Segoe UI', Arial, sans-serif;
+    }
+    #EditItemDialog QLineEdit, #EditItemDialog QPlainTextEdit {
+        background-color: #2d2d2d;
+        color: #ffffff;
+        border: 2px solid #444;
+        border-radius: 6px;
+        padding: 8px;
+        font-size: 11px;
+        font-family: 'Consolas', 'Courier New', monospace;
+    }
+    #EditItemDialog QLineEdit:focus, #EditItemDialog QPlainTextEdit:focus {
+        border-color: #00ff88;
+    }
+    #EditItemDialog QLineEdit::placeholder, #EditItemDialog QPlainTextEdit::placeholder {
+        color: #666;
+    }
+"""
+
+
+def _get_dialog_qss():
+    """
+    Obtener la hoja de estilo completa del diálogo
+
+    Reúne en una sola hoja los estilos de los widgets con nombre de objeto,
+    así cada hijo se pule una vez al crearse en lugar de reaplicar su propia
+    hoja. El SVG del checkbox se decodifica una sola vez a un archivo
+    temporal, así Qt carga el icono desde disco en lugar de un data URL.
+    """
+    global _dialog_qss
+    if _dialog_qss is None:
+        path = os.path.join(tempfile.gettempdir(), "sd_pn_checkmark.svg")
+        try:
+            with open(path, "wb") as f:
+                f.write(base64.b64decode(_CHECKMARK_SVG_B64))
+        except OSError as e:
+            logger.warning(f"No se pudo escribir el icono de check: {e}")
+        _dialog_qss = "".join((
+            _EDIT_ITEM_DIALOG_QSS,
+            _SCROLL_QSS,
+            _LOAD_FULL_BUTTON_QSS,
+            _SENSITIVE_CHECKBOX_QSS.replace("$checkmark", path.replace("\\", "/")),
+            _SENSITIVE_WARNING_QSS,
+            _CANCEL_BUTTON_QSS,
+            _SAVE_BUTTON_QSS,
+        ))
+    return _dialog_qss
+
+
+def _qthrottled(fn, timeout_ms: int = 100, parent=None):
+    """
+    Envolver fn para que se ejecute como máximo una vez cada timeout_ms
+
+    La primera llamada programa la ejecución al final del intervalo; las que
+    llegan mientras tanto se descartan. fn se llama sin argumentos y debe
+    leer el estado actual (no el de la señal que la disparó).
+
+    Args:
+        fn: Callable sin argumentos
+        timeout_ms: Intervalo mínimo entre ejecuciones
+        parent: QObject dueño del timer
+
+    Returns:
+        Callable que acepta (y descarta) los argumentos de cualquier señal
+    """
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(timeout_ms)
+    timer.timeout.connect(fn)
+
+    def throttled(*args):
+        if not timer.isActive():
+            timer.start()
+
+    return throttled
+
+
+@lru_cache(maxsize=None)
+def _get_font(point_size: int, bold: bool = False) -> QFont:
+    """Fuente "Segoe UI" compartida (se crea al primer uso, ya con QApplication)"""
+    return QFont("Segoe UI", point_size, QFont.Weight.Bold if bold else QFont.Weight.Normal)
+
 
 class EditItemDialog(QDialog):
     """
@@ -51,12 +272,19 @@ class EditItemDialog(QDialog):
     - Tags de elemento - se actualiza si se guardan cambios
 
     Señales:
-        item_updated: Emitida cuando se guarda el item con éxito
+        item_updated: Emitida cuando se guarda el item con éxito, con 'id'
+            y solo los campos modificados (label, content, is_sensitive, tags)
     """
 
     # Señales
     item_updated = pyqtSignal(dict)  # Item actualizado
 
+    # Contenido que se carga solo como vista previa (bloquea el layout de Qt)
+    LARGE_CONTENT_CHARS = 200_000
+    LONG_LINE_CHARS = 10_000
+    PREVIEW_CHARS = 10_000
+    LOAD_CHUNK_CHARS = 64 * 1024  # Trozo insertado por iteración del event loop
+
     def __init__(self, item_data: dict, db_manager, parent=None):
         """
         Inicializa el diálogo de edición
@@ -70,6 +298,13 @@ class EditItemDialog(QDialog):
         self.db = db_manager
         self.item_data = item_data
         self.item_id = item_data.get('id')
+        self._full_content = None  # Contenido completo mientras solo se muestra la vista previa
+        self._load_pos = None  # Posición en _full_content mientras se carga por trozos
+
+        # El selector de tags se construye al mostrarse el diálogo (consulta la BD)
+        self.tag_selector = None
+        self._tag_selector_ready = False
+        self._pending_tag_names = []
 
         # Verificar que tengamos un ID válido
         if not self.item_id:
@@ -88,11 +323,14 @@ class EditItemDialog(QDialog):
             Qt.WindowType.WindowTitleHint
         )
 
+        # Estilo antes que los hijos: cada widget se pule una sola vez al crearse
+        self.setUpdatesEnabled(False)
+        self._apply_styles()
         self._setup_ui()
         self._load_data()
-        self._apply_styles()
+        self.setUpdatesEnabled(True)
 
-        logger.info(f"EditItemDialog inicializado para item ID {self.item_id}")
+        logger.info("EditItemDialog inicializado para item ID %s", self.item_id)
 
     def _setup_ui(self):
         """Configurar interfaz del diálogo"""
@@ -103,7 +341,7 @@ class EditItemDialog(QDialog):
 
         # Título del diálogo
         title_label = QLabel("🖊️ Editar Item")
-        title_label.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
+        title_label.setFont(_get_font(14, bold=True))
         title_label.setStyleSheet("color: #00ff88; margin-bottom: 10px;")
         layout.addWidget(title_label)
 
@@ -118,25 +356,7 @@ class EditItemDialog(QDialog):
         scroll_area.setWidgetResizable(True)
         scroll_area.setFrameShape(QFrame.Shape.NoFrame)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background: #2d2d2d;
-                width: 10px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical {
-                background: #555555;
-                border-radius: 5px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #00ff88;
-            }
-        """)
+        scroll_area.setObjectName("formScroll")
 
         # Widget contenedor del formulario
         form_widget = QWidget()
@@ -151,7 +371,7 @@ class EditItemDialog(QDialog):
         label_layout.setSpacing(5)
 
         label_title = QLabel("📝 Label (Título) *")
-        label_title.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+        label_title.setFont(_get_font(10, bold=True))
         label_title.setStyleSheet("color: #ffffff;")
         label_layout.addWidget(label_title)
 
@@ -169,52 +389,55 @@ class EditItemDialog(QDialog):
         content_layout.setSpacing(5)
 
         content_title = QLabel("📄 Content (Contenido)")
-        content_title.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+        content_title.setFont(_get_font(10, bold=True))
         content_title.setStyleSheet("color: #ffffff;")
-        content_layout.addWidget(content_title)
 
-        self.content_input = QTextEdit()
+        # Título + contador de caracteres/líneas del content
+        content_header = QHBoxLayout()
+        content_header.addWidget(content_title)
+        content_header.addStretch()
+        self.content_stats_label = QLabel()
+        self.content_stats_label.setStyleSheet("color: #888; font-size: 9px;")
+        content_header.addWidget(self.content_stats_label)
+        content_layout.addLayout(content_header)
+
+        # QPlainTextEdit: documento de texto plano, mucho más ligero que QTextEdit con contenido grande
+        self.content_input = QPlainTextEdit()
         self.content_input.setPlaceholderText("Ej: git status, https://api.example.com, C:\\Projects\\...")
+        self.content_input.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.content_input.document().setDocumentMargin(0)  # El padding ya lo aporta el QSS
+        self.content_input.setTabChangesFocus(True)
+        self.content_input.setUndoRedoEnabled(True)
         self.content_input.setMinimumHeight(200)
         self.content_input.setMaximumHeight(300)
         content_layout.addWidget(self.content_input)
 
+        # Validación en vivo limitada a una vez cada 150 ms (no por cada tecla)
+        self.content_input.textChanged.connect(_qthrottled(self._validate_live, 150, self))
+
+        # Botón para cargar el contenido completo cuando solo se muestra la vista previa
+        self.load_full_btn = QPushButton()
+        self.load_full_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.load_full_btn.setObjectName("loadFullButton")
+        self.load_full_btn.clicked.connect(self._load_full_content)
+        self.load_full_btn.setVisible(False)
+        content_layout.addWidget(self.load_full_btn)
+
         form_layout.addWidget(content_container)
 
         # === TAGS GLOBALES ===
-        # Crear tag manager si tenemos db
-        tag_manager = GlobalTagManager(self.db) if self.db else None
-
-        # Widget de selector de tags
-        self.tag_selector = ItemTagsSection(tag_manager=tag_manager)
-        self.tag_selector.setMinimumHeight(200)
-        self.tag_selector.setMaximumHeight(300)
-        form_layout.addWidget(self.tag_selector)
+        # Contenedor del selector de tags (se llena en _ensure_tag_selector)
+        self.tag_selector_container = QWidget()
+        self.tag_selector_container.setMinimumHeight(200)
+        self.tag_selector_container.setMaximumHeight(300)
+        tag_selector_layout = QVBoxLayout(self.tag_selector_container)
+        tag_selector_layout.setContentsMargins(0, 0, 0, 0)
+        form_layout.addWidget(self.tag_selector_container)
 
         # === CHECKBOX IS_SENSITIVE ===
         self.sensitive_checkbox = QCheckBox("🔒 Marcar como sensible (cifrado)")
-        self.sensitive_checkbox.setFont(QFont("Segoe UI", 10))
-        self.sensitive_checkbox.setStyleSheet("""
-            QCheckBox {
-                color: #ffffff;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-                border: 2px solid #555;
-                border-radius: 4px;
-                background-color: #2d2d2d;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #FF5722;
-                border-color: #FF5722;
-                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTYiIGhlaWdodD0iMTYiIHZpZXdCb3g9IjAgMCAxNiAxNiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEzLjMzMzMgNEw2IDExLjMzMzNMMi42NjY2NyA4IiBzdHJva2U9IndoaXRlIiBzdHJva2Utd2lkdGg9IjIiIHN0cm9rZS1saW5lY2FwPSJyb3VuZCIgc3Ryb2tlLWxpbmVqb2luPSJyb3VuZCIvPgo8L3N2Zz4K);
-            }
-            QCheckBox::indicator:hover {
-                border-color: #00ff88;
-            }
-        """)
+        self.sensitive_checkbox.setFont(_get_font(10))
+        self.sensitive_checkbox.setObjectName("sensitiveCheckbox")
         form_layout.addWidget(self.sensitive_checkbox)
 
         # Nota de advertencia para items sensibles
@@ -222,21 +445,12 @@ class EditItemDialog(QDialog):
             "⚠️ El contenido será cifrado. Necesitarás la contraseña maestra para acceder."
         )
         self.sensitive_warning.setWordWrap(True)
-        self.sensitive_warning.setStyleSheet("""
-            color: #FFA726;
-            font-size: 9px;
-            padding: 8px;
-            background-color: rgba(255, 167, 38, 0.1);
-            border-left: 3px solid #FFA726;
-            border-radius: 4px;
-        """)
+        self.sensitive_warning.setObjectName("sensitiveWarning")
         self.sensitive_warning.setVisible(False)
         form_layout.addWidget(self.sensitive_warning)
 
         # Conectar checkbox para mostrar/ocultar advertencia
-        self.sensitive_checkbox.stateChanged.connect(
-            lambda state: self.sensitive_warning.setVisible(state == Qt.CheckState.Checked.value)
-        )
+        self.sensitive_checkbox.stateChanged.connect(self._on_sensitive_toggled)
 
         # Spacer
         form_layout.addStretch()
@@ -264,24 +478,7 @@ class EditItemDialog(QDialog):
         cancel_btn.setMinimumWidth(120)
         cancel_btn.setMinimumHeight(40)
         cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #555;
-                color: #ffffff;
-                border: 1px solid #666;
-                border-radius: 6px;
-                font-size: 11px;
-                font-weight: 600;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #666;
-                border-color: #777;
-            }
-            QPushButton:pressed {
-                background-color: #444;
-            }
-        """)
+        cancel_btn.setObjectName("cancelButton")
         cancel_btn.clicked.connect(self.reject)
         buttons_layout.addWidget(cancel_btn)
 
@@ -290,29 +487,7 @@ class EditItemDialog(QDialog):
         self.save_btn.setMinimumWidth(150)
         self.save_btn.setMinimumHeight(40)
         self.save_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: #ffffff;
-                border: 1px solid #45a049;
-                border-radius: 6px;
-                font-size: 11px;
-                font-weight: 700;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-                border-color: #3d8b40;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-            QPushButton:disabled {
-                background-color: #555;
-                color: #888;
-                border-color: #444;
-            }
-        """)
+        self.save_btn.setObjectName("saveButton")
         self.save_btn.clicked.connect(self._save_changes)
         buttons_layout.addWidget(self.save_btn)
 
@@ -325,8 +500,17 @@ class EditItemDialog(QDialog):
             self.label_input.setText(self.item_data.get('label', ''))
 
             # Cargar content (descifrado si es sensible)
-            content = self.item_data.get('content', '')
-            self.content_input.setPlainText(content)
+            content = self.item_data.get('content', '') or ''
+            if self._is_large_content(content):
+                # Solo una vista previa de solo lectura; el resto bajo demanda
+                self._full_content = content
+                self.content_input.setPlainText(content[:self.PREVIEW_CHARS])
+                self.content_input.setReadOnly(True)
+                self.load_full_btn.setText(
+                    f"⬇ Vista previa - Cargar contenido completo ({len(content):,} caracteres)")
+                self.load_full_btn.setVisible(True)
+            else:
+                self.content_input.setPlainText(content)
 
             # Cargar is_sensitive
             is_sensitive = self.item_data.get('is_sensitive', False)
@@ -334,35 +518,26 @@ class EditItemDialog(QDialog):
 
             # Cargar tags (si existen)
             tags = self.item_data.get('tags', [])
-            logger.info(f"📋 Tags recibidos de item_data: {tags} (tipo: {type(tags)})")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("📋 Tags recibidos de item_data: %s (tipo: %s)", tags, type(tags))
 
-            if tags:
+            if isinstance(tags, list) and tags:
                 # Convertir lista de tags a lista de nombres
-                tag_names = []
-                if isinstance(tags, list) and len(tags) > 0:
-                    logger.debug(f"   Primer tag (muestra): {tags[0]} (tipo: {type(tags[0])})")
-
-                    if isinstance(tags[0], dict):
-                        # Lista de dicts {'id': x, 'name': y}
-                        tag_names = [tag['name'] for tag in tags if 'name' in tag]
-                        logger.info(f"   Tags extraídos de dicts: {tag_names}")
-                    else:
-                        # Lista de strings
-                        tag_names = tags
-                        logger.info(f"   Tags ya son strings: {tag_names}")
-
-                    if tag_names:
-                        logger.info(f"🏷️  Estableciendo tags en selector: {tag_names}")
-                        self.tag_selector.set_selected_tags(tag_names)
-                        logger.info(f"✅ Tags cargados exitosamente")
-                    else:
-                        logger.warning(f"⚠️  tag_names está vacío después de conversión")
+                if isinstance(tags[0], dict):
+                    # Lista de dicts {'id': x, 'name': y}
+                    tag_names = list(map(itemgetter('name'), tags))
                 else:
-                    logger.warning(f"⚠️  tags no es una lista válida o está vacía")
+                    # Lista de strings
+                    tag_names = list(tags)
+
+                self._pending_tag_names = tag_names
+                if self._tag_selector_ready:
+                    self.tag_selector.set_selected_tags(self._pending_tag_names)
+                logger.info("🏷️  Tags cargados: %s", tag_names)
             else:
                 logger.info("ℹ️  Item sin tags")
 
-            logger.info(f"Datos del item {self.item_id} cargados en el formulario")
+            logger.info("Datos del item %s cargados en el formulario", self.item_id)
 
         except Exception as e:
             logger.error(f"❌ Error cargando datos del item: {e}", exc_info=True)
@@ -372,30 +547,104 @@ class EditItemDialog(QDialog):
                 f"No se pudieron cargar los datos del item:\n{str(e)}"
             )
 
+    def showEvent(self, event):
+        """Construir el selector de tags justo después de mostrarse el diálogo"""
+        super().showEvent(event)
+        if not self._tag_selector_ready:
+            QTimer.singleShot(0, self._ensure_tag_selector)
+
+    @pyqtSlot()
+    def _ensure_tag_selector(self):
+        """Crear GlobalTagManager e ItemTagsSection la primera vez que se necesitan"""
+        if self._tag_selector_ready:
+            return
+        self._tag_selector_ready = True
+
+        # Crear tag manager si tenemos db
+        # (su caché de tags por nombre vive lo mismo que el diálogo)
+        tag_manager = GlobalTagManager(self.db, cache_lookups=True) if self.db else None
+
+        # Widget de selector de tags
+        self.tag_selector = ItemTagsSection(tag_manager=tag_manager)
+        self.tag_selector_container.layout().addWidget(self.tag_selector)
+
+        if self._pending_tag_names:
+            self.tag_selector.set_selected_tags(self._pending_tag_names)
+
+        logger.debug("Selector de tags creado para item ID %s", self.item_id)
+
+    def _validate_live(self):
+        """Actualizar el contador del content mientras se escribe"""
+        # En vista previa se describe el contenido completo, no el recortado
+        text = self._full_content if self._full_content is not None else self.content_input.toPlainText()
+        lines = text.count('\n') + 1 if text else 0
+        self.content_stats_label.setText(f"{len(text):,} caracteres · {lines:,} líneas")
+
+    def _is_large_content(self, content: str) -> bool:
+        """
+        Determinar si el contenido es demasiado grande para cargarlo directamente
+
+        Un texto muy largo o con líneas enormes (p. ej. data URIs en base64)
+        congela el layout, la selección y la búsqueda del editor.
+        """
+        if len(content) > self.LARGE_CONTENT_CHARS:
+            return True
+        return any(len(line) > self.LONG_LINE_CHARS for line in content.split('\n', 10)[:10])
+
+    @pyqtSlot()
+    def _load_full_content(self):
+        """
+        Cargar el contenido completo en el editor y permitir editarlo
+
+        El contenido se inserta en trozos de LOAD_CHUNK_CHARS, uno por
+        iteración del event loop, para no bloquear la UI con un único
+        setPlainText de varios MB. Mientras dura la carga el editor sigue
+        en solo lectura y al guardar se usa _full_content.
+        """
+        if self._full_content is None or self._load_pos is not None:
+            return
+
+        self.load_full_btn.setEnabled(False)
+        self.load_full_btn.setText("⏳ Cargando contenido completo...")
+
+        # Sin historial de deshacer para la carga (se reactiva al terminar)
+        self.content_input.setUndoRedoEnabled(False)
+        self.content_input.setPlainText(self._full_content[:self.LOAD_CHUNK_CHARS])
+        self._load_pos = self.LOAD_CHUNK_CHARS
+        QTimer.singleShot(0, self._insert_next_chunk)
+
+    @pyqtSlot()
+    def _insert_next_chunk(self):
+        """Insertar el siguiente trozo del contenido completo al final del editor"""
+        if self._full_content is None or self._load_pos is None:
+            return
+
+        if self._load_pos < len(self._full_content):
+            cursor = QTextCursor(self.content_input.document())
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.insertText(self._full_content[self._load_pos:self._load_pos + self.LOAD_CHUNK_CHARS])
+            self._load_pos += self.LOAD_CHUNK_CHARS
+            QTimer.singleShot(0, self._insert_next_chunk)
+            return
+
+        # Carga terminada: el documento equivale al contenido original
+        self.content_input.setUndoRedoEnabled(True)
+        self.content_input.document().setModified(False)
+        self.content_input.setReadOnly(False)
+        self._full_content = None
+        self._load_pos = None
+        self.load_full_btn.setVisible(False)
+
     def _apply_styles(self):
-        """Aplicar estilos CSS al diálogo"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            QLineEdit, QTextEdit {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 2px solid #444;
-                border-radius: 6px;
-                padding: 8px;
-                font-size: 11px;
-                font-family: 'Consolas', 'Courier New', monospace;
-            }
-            QLineEdit:focus, QTextEdit:focus {
-                border-color: #00ff88;
-            }
-            QLineEdit::placeholder, QTextEdit::placeholder {
-                color: #666;
-            }
-        """)
+        """
+        Aplicar estilos CSS al diálogo
+
+        La hoja se aplica al propio diálogo (no a la QApplication): las hojas
+        de las ventanas padre, como el QWidget genérico de
+        ProjectAreaViewerPanel, tienen prioridad sobre la de la aplicación.
+        """
+        self.setObjectName("EditItemDialog")
+        self.setStyleSheet(_get_dialog_qss())
 
     def _validate_input(self) -> bool:
         """
@@ -418,6 +667,12 @@ class EditItemDialog(QDialog):
         # Content es opcional
         return True
 
+    @pyqtSlot(int)
+    def _on_sensitive_toggled(self, state: int):
+        """Mostrar/ocultar la advertencia de contenido cifrado"""
+        self.sensitive_warning.setVisible(state == Qt.CheckState.Checked.value)
+
+    @pyqtSlot()
     def _save_changes(self):
         """Guardar cambios del item"""
         # Validar entrada
@@ -427,9 +682,20 @@ class EditItemDialog(QDialog):
         try:
             # Obtener valores del formulario
             new_label = self.label_input.text().strip()
-            new_content = self.content_input.toPlainText().strip()
+            if self._full_content is not None:
+                # Solo se mostró la vista previa: conservar el contenido original
+                new_content = self._full_content.strip()
+            elif not self.content_input.document().isModified():
+                # Sin ediciones desde que se cargó: no copiar el documento a un str
+                new_content = (self.item_data.get('content', '') or '').strip()
+            else:
+                new_content = self.content_input.toPlainText().strip()
             new_is_sensitive = self.sensitive_checkbox.isChecked()
-            new_tags = self.tag_selector.get_selected_tags()
+            if self._tag_selector_ready:
+                new_tags = self.tag_selector.get_selected_tags()
+            else:
+                # El selector aún no se construyó: los tags no han cambiado
+                new_tags = list(self._pending_tag_names)
 
             # Preparar datos para actualizar
             update_data = {
@@ -439,28 +705,36 @@ class EditItemDialog(QDialog):
                 'tags': new_tags
             }
 
+            # Comparar con lo cargado (normalizado igual que el formulario):
+            # solo se escriben los campos que cambiaron
+            loaded_data = {
+                'label': (self.item_data.get('label', '') or '').strip(),
+                'content': (self.item_data.get('content', '') or '').strip(),
+                'is_sensitive': bool(self.item_data.get('is_sensitive', False)),
+                'tags': self._pending_tag_names
+            }
+            changed = {k: v for k, v in update_data.items() if v != loaded_data[k]}
+            if 'is_sensitive' in changed:
+                # El content se cifra según is_sensitive: reenviarlo siempre
+                changed['content'] = new_content
+
+            if not changed:
+                logger.debug("Item %s sin cambios, no se actualiza la BD", self.item_id)
+                self.accept()
+                return
+
             # Actualizar item en BD
-            self.db.update_item(self.item_id, **update_data)
+            self.db.update_item(self.item_id, **changed)
 
-            logger.info(f"✅ Item {self.item_id} actualizado: label='{new_label}', "
-                       f"is_sensitive={new_is_sensitive}, tags={new_tags}")
+            # Solo los nombres de campo: el content puede ser sensible
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("✅ Item %s actualizado: %s", self.item_id, sorted(changed))
 
-            # Emitir señal con los datos actualizados
-            updated_item_data = self.item_data.copy()
-            updated_item_data.update({
-                'label': new_label,
-                'content': new_content,
-                'is_sensitive': new_is_sensitive,
-                'tags': new_tags
-            })
-            self.item_updated.emit(updated_item_data)
+            # Emitir solo los campos modificados (sin copiar item_data completo)
+            self.item_updated.emit({'id': self.item_id, **changed})
 
-            # Mostrar mensaje de éxito
-            QMessageBox.information(
-                self,
-                "✅ Item Actualizado",
-                f"El item '{new_label}' se actualizó correctamente."
-            )
+            # Aviso no bloqueante en la ventana padre (el diálogo se cierra ya)
+            StatusToast.show_message(self.parentWidget(), f"✅ Item '{new_label}' actualizado")
 
             # Cerrar diálogo
             self.accept()
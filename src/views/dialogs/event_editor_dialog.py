@@ -8,13 +8,116 @@ from PyQt6.QtWidgets import (
     QLineEdit, QTextEdit, QComboBox, QDateTimeEdit,
     QPushButton, QDialogButtonBox, QMessageBox, QLabel
 )
-from PyQt6.QtCore import Qt, QDateTime
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QDate, QDateTime, QTime, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QStandardItemModel, QStandardItem
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Dark theme shared by all EventEditorDialog instances (scoped to #eventEditorDialog)
+_EVENT_EDITOR_QSS = """
+    QDialog#eventEditorDialog {
+        background-color: #2b2b2b;
+        color: #cccccc;
+    }
+    #eventEditorDialog QLabel {
+        color: #cccccc;
+    }
+    #eventEditorDialog QLabel#eventEditorTitle {
+        font-size: 12pt;
+        font-weight: bold;
+    }
+    #eventEditorDialog QLineEdit, #eventEditorDialog QTextEdit {
+        background-color: #1e1e1e;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 6px;
+        font-size: 10pt;
+    }
+    #eventEditorDialog QLineEdit:focus, #eventEditorDialog QTextEdit:focus {
+        border-color: #007acc;
+    }
+    #eventEditorDialog QComboBox {
+        background-color: #1e1e1e;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 6px;
+        font-size: 10pt;
+    }
+    #eventEditorDialog QComboBox:hover {
+        border-color: #007acc;
+    }
+    #eventEditorDialog QComboBox::drop-down {
+        border: none;
+    }
+    #eventEditorDialog QDateTimeEdit {
+        background-color: #1e1e1e;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 6px;
+        font-size: 10pt;
+    }
+    #eventEditorDialog QDateTimeEdit:focus {
+        border-color: #007acc;
+    }
+    #eventEditorDialog QPushButton {
+        background-color: #2d2d2d;
+        color: #cccccc;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 8px 20px;
+        font-size: 10pt;
+        min-width: 100px;
+    }
+    #eventEditorDialog QPushButton:hover {
+        background-color: #3d3d3d;
+        border-color: #007acc;
+    }
+    #eventEditorDialog QPushButton:pressed {
+        background-color: #1e1e1e;
+    }
+    #eventEditorDialog QPushButton[default="true"] {
+        background-color: #007acc;
+        color: #ffffff;
+    }
+    #eventEditorDialog QPushButton[default="true"]:hover {
+        background-color: #005a9e;
+    }
+    #eventEditorDialog QLineEdit[invalid="true"], #eventEditorDialog QDateTimeEdit[invalid="true"] {
+        border-color: #ff6b6b;
+    }
+"""
+
+# (text, data) options of the type and priority combo boxes
+_EVENT_TYPES = (
+    ("📌 Recordatorio", "reminder"),
+    ("⏰ Fecha límite", "deadline"),
+    ("✓ Tarea", "task"),
+    ("📅 Reunión", "meeting"),
+    ("🎯 Presentación", "presentation"),
+)
+
+_PRIORITIES = (
+    ("🟢 Baja", "low"),
+    ("🟡 Media", "medium"),
+    ("🔴 Alta", "high"),
+)
+
+
+class _LazyItemComboBox(QComboBox):
+    """Combo box that announces when its popup is about to open"""
+
+    popup_about_to_show = pyqtSignal()
+
+    def showPopup(self):
+        """Let the owner fill the list before the popup is shown"""
+        self.popup_about_to_show.emit()
+        super().showPopup()
+
 
 class EventEditorDialog(QDialog):
     """
@@ -22,6 +125,10 @@ class EventEditorDialog(QDialog):
     Provides a simple form for event data entry
     """
 
+    # Items list shared by all instances, invalidated by db.get_items_cache_key()
+    _items_cache = None
+    _items_cache_version = None
+
     def __init__(self, db_manager, event=None, item_id=None, parent=None):
         """
         Initialize event editor dialog
@@ -36,17 +143,24 @@ class EventEditorDialog(QDialog):
         self.db = db_manager
         self.event = event
         self.default_item_id = item_id
+        self._items_loaded = False  # Full item list is only loaded when the combo opens
 
         # Determine mode
         self.is_edit_mode = event is not None
 
         self.setup_window()
-        self.setup_ui()
+
+        # Build and fill the whole form before the first layout/paint pass
+        self.setUpdatesEnabled(False)
         self.apply_styles()
+        self.setup_ui()
 
-        # Load event data if editing
+        # Fill the form once: event data when editing, defaults otherwise
         if self.is_edit_mode:
             self.load_event_data()
+        else:
+            self.load_defaults()
+        self.setUpdatesEnabled(True)
 
         logger.info(f"EventEditorDialog initialized ({'Edit' if self.is_edit_mode else 'Create'} mode)")
 
@@ -63,20 +177,22 @@ class EventEditorDialog(QDialog):
         layout.setSpacing(15)
 
         # Title
-        title_label = QLabel("📅 " + ("Editar Evento" if self.is_edit_mode else "Nuevo Evento"))
-        title_font = QFont()
-        title_font.setPointSize(12)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        layout.addWidget(title_label)
-
-        # Form layout
+        self.title_label = QLabel("📅 " + ("Editar Evento" if self.is_edit_mode else "Nuevo Evento"))
+        self.title_label.setObjectName("eventEditorTitle")
+        layout.addWidget(self.title_label)
+
+        # Form layout (filled detached, attached to the dialog once below)
         form_layout = QFormLayout()
         form_layout.setSpacing(10)
 
-        # Item selector
-        self.item_combo = QComboBox()
-        self.load_items()
+        # Item selector (only "None" and the selected item until it is opened)
+        self.item_combo = _LazyItemComboBox()
+        # Size from a fixed text length, not by measuring every item label
+        self.item_combo.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon)
+        self.item_combo.setMinimumContentsLength(20)
+        self.item_combo.popup_about_to_show.connect(self.ensure_items_loaded)
+        self.reset_items()
+        self.select_default_item()
         form_layout.addRow("Item asociado:", self.item_combo)
 
         # Title
@@ -92,26 +208,18 @@ class EventEditorDialog(QDialog):
 
         # Date and time
         self.datetime_edit = QDateTimeEdit()
-        self.datetime_edit.setDateTime(QDateTime.currentDateTime())
         self.datetime_edit.setCalendarPopup(True)
         self.datetime_edit.setDisplayFormat("dd/MM/yyyy HH:mm")
         form_layout.addRow("Fecha y hora:*", self.datetime_edit)
 
         # Event type
         self.type_combo = QComboBox()
-        self.type_combo.addItem("📌 Recordatorio", "reminder")
-        self.type_combo.addItem("⏰ Fecha límite", "deadline")
-        self.type_combo.addItem("✓ Tarea", "task")
-        self.type_combo.addItem("📅 Reunión", "meeting")
-        self.type_combo.addItem("🎯 Presentación", "presentation")
+        self.fill_combo(self.type_combo, _EVENT_TYPES)
         form_layout.addRow("Tipo:", self.type_combo)
 
         # Priority
         self.priority_combo = QComboBox()
-        self.priority_combo.addItem("🟢 Baja", "low")
-        self.priority_combo.addItem("🟡 Media", "medium")
-        self.priority_combo.addItem("🔴 Alta", "high")
-        self.priority_combo.setCurrentIndex(1)  # Default to medium
+        self.fill_combo(self.priority_combo, _PRIORITIES)
         form_layout.addRow("Prioridad:", self.priority_combo)
 
         layout.addLayout(form_layout)
@@ -121,6 +229,13 @@ class EventEditorDialog(QDialog):
         note_label.setStyleSheet("color: #999999; font-size: 9pt;")
         layout.addWidget(note_label)
 
+        # Inline validation error (hidden until validate() fails)
+        self.error_label = QLabel()
+        self.error_label.setStyleSheet("color: #ff6b6b;")
+        self.error_label.setWordWrap(True)
+        self.error_label.hide()
+        layout.addWidget(self.error_label)
+
         layout.addStretch()
 
         # Buttons
@@ -139,101 +254,92 @@ class EventEditorDialog(QDialog):
         layout.addWidget(button_box)
 
     def apply_styles(self):
-        """Apply dark theme styles"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: #cccccc;
-            }
-            QLabel {
-                color: #cccccc;
-            }
-            QLineEdit, QTextEdit {
-                background-color: #1e1e1e;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 10pt;
-            }
-            QLineEdit:focus, QTextEdit:focus {
-                border-color: #007acc;
-            }
-            QComboBox {
-                background-color: #1e1e1e;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 10pt;
-            }
-            QComboBox:hover {
-                border-color: #007acc;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QDateTimeEdit {
-                background-color: #1e1e1e;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 10pt;
-            }
-            QDateTimeEdit:focus {
-                border-color: #007acc;
-            }
-            QPushButton {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 8px 20px;
-                font-size: 10pt;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border-color: #007acc;
-            }
-            QPushButton:pressed {
-                background-color: #1e1e1e;
-            }
-            QPushButton[default="true"] {
-                background-color: #007acc;
-                color: #ffffff;
-            }
-            QPushButton[default="true"]:hover {
-                background-color: #005a9e;
-            }
-        """)
+        """
+        Apply dark theme styles
 
-    def load_items(self):
-        """Load items from database into combo box"""
-        try:
-            conn = self.db.connect()
-            cursor = conn.cursor()
-            cursor.execute("SELECT id, label FROM items ORDER BY label")
-            items = cursor.fetchall()
+        Set on the dialog itself rather than the application: the parent
+        CalendarWindow's sheet would take priority over app-level rules.
+        """
+        self.setObjectName("eventEditorDialog")
+        self.setStyleSheet(_EVENT_EDITOR_QSS)
 
-            self.item_combo.clear()
+    @classmethod
+    def _get_items_cache(cls, db):
+        """
+        Get (id, label) pairs for the item combo box
 
-            # Add "None" option at the beginning
-            self.item_combo.addItem("(Ninguno - Sin item asociado)", None)
+        The list is cached on the class and only re-queried when
+        the database's items cache key changes (add/rename/delete item).
 
-            # Add all items
-            for item_id, label in items:
-                self.item_combo.addItem(label, item_id)
+        Args:
+            db: DBManager instance
+        """
+        version = (id(db), db.get_items_cache_key())
+        if cls._items_cache is None or cls._items_cache_version != version:
+            cls._items_cache = db.get_item_labels()
+            cls._items_cache_version = version
+        return cls._items_cache
+
+    @staticmethod
+    def fill_combo(combo, options):
+        """
+        Fill a combo box from (text, data) pairs in one batch
 
-            # Set default item if provided
-            if self.default_item_id:
-                index = self.item_combo.findData(self.default_item_id)
-                if index >= 0:
-                    self.item_combo.setCurrentIndex(index)
-            else:
-                # Select "None" by default if no default item
-                self.item_combo.setCurrentIndex(0)
+        Args:
+            combo: QComboBox to fill
+            options: Sequence of (text, data) tuples
+        """
+        combo.blockSignals(True)
+        combo.addItems([text for text, _ in options])
+        for row, (_, data) in enumerate(options):
+            combo.setItemData(row, data)
+        combo.blockSignals(False)
+
+    def items_are_current(self):
+        """Whether the combo holds the full, up-to-date item list"""
+        return (self._items_loaded and
+                EventEditorDialog._items_cache_version == (id(self.db), self.db.get_items_cache_key()))
+
+    def reset_items(self):
+        """Leave only the "None" option in the combo until the full list is needed"""
+        self.item_combo.blockSignals(True)
+        self.item_combo.clear()
+        self.item_combo.addItem("(Ninguno - Sin item asociado)", None)
+        self.item_combo.blockSignals(False)
+        self._items_loaded = False
+
+    @pyqtSlot()
+    def ensure_items_loaded(self):
+        """Load the full item list the first time the combo is opened"""
+        if not self.items_are_current():
+            self.load_items()
+
+    def load_items(self):
+        """Load items from database into combo box, keeping the current selection"""
+        try:
+            items = self._get_items_cache(self.db)
+            current_item_id = self.item_combo.currentData()
+
+            # Build the model off-widget: "None" option at the beginning, then all items
+            model = QStandardItemModel(self.item_combo)
+            rows = [QStandardItem("(Ninguno - Sin item asociado)")]
+            for item_id, label in items:
+                row = QStandardItem(label)
+                row.setData(item_id, Qt.ItemDataRole.UserRole)
+                rows.append(row)
+            model.invisibleRootItem().appendRows(rows)
+
+            # Swap it in with a single update (the previous model is owned and deleted by the combo)
+            self.item_combo.blockSignals(True)
+            self.item_combo.setUpdatesEnabled(False)
+            try:
+                self.item_combo.setModel(model)
+            finally:
+                self.item_combo.setUpdatesEnabled(True)
+                self.item_combo.blockSignals(False)
+            self._items_loaded = True
+
+            self.select_item(current_item_id)
 
             logger.debug(f"Loaded {len(items)} items into combo box")
 
@@ -245,8 +351,91 @@ class EventEditorDialog(QDialog):
                 "No se pudieron cargar los items disponibles."
             )
 
+    def get_item_label(self, item_id):
+        """
+        Get the label of a single item without loading the whole list
+
+        Args:
+            item_id: Item ID
+
+        Returns:
+            str or None: Item label, None if the item does not exist
+        """
+        if EventEditorDialog._items_cache_version == (id(self.db), self.db.get_items_cache_key()):
+            for cached_id, label in EventEditorDialog._items_cache:
+                if cached_id == item_id:
+                    return label
+            return None
+
+        return self.db.get_item_label(item_id)
+
+    def select_item(self, item_id):
+        """
+        Select an item in the combo box ("None" if item_id is empty)
+
+        If the full list has not been loaded yet, only that item's row is added.
+
+        Args:
+            item_id: Item ID to select
+        """
+        if not item_id:
+            self.item_combo.setCurrentIndex(0)
+            return
+
+        index = self.item_combo.findData(item_id)
+        if index < 0 and not self._items_loaded:
+            try:
+                label = self.get_item_label(item_id)
+            except Exception as e:
+                logger.error(f"Error loading item label: {e}", exc_info=True)
+                label = None
+            if label is not None:
+                self.item_combo.addItem(label, item_id)
+                index = self.item_combo.count() - 1
+        if index >= 0:
+            self.item_combo.setCurrentIndex(index)
+
+    def select_default_item(self):
+        """Select the default item in the combo box ("None" if there is no default)"""
+        self.select_item(self.default_item_id)
+
+    def prepare(self, event=None, item_id=None):
+        """
+        Reset the dialog for a new create/edit session so it can be reused
+
+        Args:
+            event: Event dictionary for editing (None for create mode)
+            item_id: Default item ID for new events
+        """
+        self.event = event
+        self.default_item_id = item_id
+        self.is_edit_mode = event is not None
+
+        title = "Editar Evento" if self.is_edit_mode else "Nuevo Evento"
+        self.setWindowTitle(title)
+        self.title_label.setText("📅 " + title)
+
+        self.clear_errors()
+        if not self.items_are_current():
+            self.reset_items()
+        self.select_default_item()
+
+        # Each field is written once, by whichever path applies
+        if self.is_edit_mode:
+            self.load_event_data()
+        else:
+            self.load_defaults()
+
+    def load_defaults(self):
+        """Reset form fields to their create-mode defaults"""
+        self.title_edit.clear()
+        self.desc_edit.clear()
+        self.datetime_edit.setDateTime(QDateTime.currentDateTime())
+        self.type_combo.setCurrentIndex(0)
+        self.priority_combo.setCurrentIndex(1)  # Default to medium
+
     def load_event_data(self):
-        """Load event data into form fields"""
+        """Load event data into form fields (missing values fall back to the defaults)"""
         if not self.event:
             return
 
@@ -254,9 +443,7 @@ class EventEditorDialog(QDialog):
             # Set item
             item_id = self.event.get('item_id')
             if item_id:
-                index = self.item_combo.findData(item_id)
-                if index >= 0:
-                    self.item_combo.setCurrentIndex(index)
+                self.select_item(item_id)
 
             # Set title
             self.title_edit.setText(self.event.get('title', ''))
@@ -266,22 +453,29 @@ class EventEditorDialog(QDialog):
 
             # Set datetime
             datetime_str = self.event.get('event_datetime', '')
+            qdt = QDateTime.currentDateTime()
             if datetime_str:
-                dt = QDateTime.fromString(datetime_str, "yyyy-MM-dd HH:mm:ss")
-                if dt.isValid():
-                    self.datetime_edit.setDateTime(dt)
+                # Fixed storage format: parse in Python, not with Qt's format parser
+                try:
+                    dt = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
+                except ValueError:
+                    logger.warning(f"Invalid event datetime: {datetime_str!r}")
+                else:
+                    qdt = QDateTime(
+                        QDate(dt.year, dt.month, dt.day),
+                        QTime(dt.hour, dt.minute, dt.second)
+                    )
+            self.datetime_edit.setDateTime(qdt)
 
             # Set type
             event_type = self.event.get('event_type', 'reminder')
             index = self.type_combo.findData(event_type)
-            if index >= 0:
-                self.type_combo.setCurrentIndex(index)
+            self.type_combo.setCurrentIndex(index if index >= 0 else 0)
 
             # Set priority
             priority = self.event.get('priority', 'medium')
             index = self.priority_combo.findData(priority)
-            if index >= 0:
-                self.priority_combo.setCurrentIndex(index)
+            self.priority_combo.setCurrentIndex(index if index >= 0 else 1)
 
             logger.debug(f"Loaded event data: {self.event['id']}")
 
@@ -295,30 +489,56 @@ class EventEditorDialog(QDialog):
         Returns:
             bool: True if valid, False otherwise
         """
+        self.clear_errors()
+
         # Check title
         if not self.title_edit.text().strip():
-            QMessageBox.warning(
-                self,
-                "Validación",
-                "El título es requerido."
-            )
-            self.title_edit.setFocus()
+            self.show_error("El título es requerido.", self.title_edit)
             return False
 
         # Item is now optional - no validation needed
 
         # Check datetime is valid
         if not self.datetime_edit.dateTime().isValid():
-            QMessageBox.warning(
-                self,
-                "Validación",
-                "La fecha y hora no son válidas."
-            )
-            self.datetime_edit.setFocus()
+            self.show_error("La fecha y hora no son válidas.", self.datetime_edit)
             return False
 
         return True
 
+    def show_error(self, message, widget):
+        """
+        Show a validation error below the form, mark the field and focus it
+
+        Args:
+            message: Error text
+            widget: Field to mark and focus
+        """
+        self.error_label.setText(message)
+        self.error_label.show()
+        self.set_invalid(widget, True)
+        widget.setFocus()
+
+    def clear_errors(self):
+        """Hide the validation error and unmark the fields"""
+        self.error_label.hide()
+        for widget in (self.title_edit, self.datetime_edit):
+            self.set_invalid(widget, False)
+
+    @staticmethod
+    def set_invalid(widget, invalid):
+        """
+        Toggle the red "invalid" border of a field
+
+        Args:
+            widget: Field widget
+            invalid: Whether the field holds an invalid value
+        """
+        if bool(widget.property("invalid")) == invalid:
+            return
+        widget.setProperty("invalid", invalid)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+
     def save(self):
         """Save event to database"""
         if not self.validate():
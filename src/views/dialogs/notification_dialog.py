@@ -4,14 +4,235 @@ Popup notification for triggered alerts
 """
 
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QWidget
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont, QScreen
+from PyQt6.QtCore import Qt, QTimer, QObject, QSize, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QColor, QFont, QPainter, QStaticText, QTransform
+from src.styles.app_stylesheet import install_app_stylesheet
+from src.utils.screen_geometry import get_available_geometry
+from collections import deque
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Dark theme shared by all NotificationDialog instances (scoped to
+# #notificationDialog); the border color follows the "priority" dynamic
+# property instead of rebuilding the stylesheet per alert. The alert text
+# itself is painted by NotificationContentWidget, not styled labels.
+_NOTIFICATION_QSS = """
+    QDialog#notificationDialog {
+        background-color: #2b2b2b;
+        border: 2px solid #ffc107;
+        border-radius: 8px;
+    }
+    QDialog#notificationDialog[priority="low"] {
+        border-color: #4caf50;
+    }
+    QDialog#notificationDialog[priority="high"] {
+        border-color: #ff5252;
+    }
+    #notificationDialog QPushButton {
+        background-color: #3d3d3d;
+        color: #cccccc;
+        border: 1px solid #4d4d4d;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-size: 10pt;
+    }
+    #notificationDialog QPushButton:hover {
+        background-color: #4d4d4d;
+        border-color: #007acc;
+    }
+    #notificationDialog QPushButton:pressed {
+        background-color: #2d2d2d;
+    }
+    #notificationDialog QPushButton#closeButton {
+        background-color: transparent;
+        border: none;
+        color: #cccccc;
+        font-size: 18pt;
+        font-weight: bold;
+        border-radius: 12px;
+    }
+    #notificationDialog QPushButton#closeButton:hover {
+        background-color: #e81123;
+        color: #ffffff;
+    }
+"""
+
+
+class NotificationContentWidget(QWidget):
+    """
+    Header, title, message, item and priority badge of a notification
+
+    Everything is drawn in one QPainter pass from QStaticText objects
+    instead of a stack of styled QLabels. Only the close button is a real
+    child widget, pinned to the top-right corner.
+    """
+
+    SPACING = 12
+    HEADER_SPACING = 10
+    CLOSE_BUTTON_SIZE = 25
+    # Width available inside the 380px dialog (15px margins)
+    DEFAULT_WIDTH = 350
+
+    TEXT_COLOR = QColor('#ffffff')
+    MESSAGE_COLOR = QColor('#cccccc')
+    ITEM_COLOR = QColor('#999999')
+    SEPARATOR_COLOR = QColor('#3d3d3d')
+    PRIORITY_COLORS = {
+        'low': QColor('#4caf50'),
+        'medium': QColor('#ffc107'),
+        'high': QColor('#ff5252')
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._icon_font = self._derive_font(20)
+        self._header_font = self._derive_font(11, bold=True)
+        self._title_font = self._derive_font(12, bold=True)
+        self._message_font = self._derive_font(10)
+        self._small_font = self._derive_font(9)
+
+        # Fixed header texts are laid out once
+        self._icon_text = self._static_text("🔔", self._icon_font)
+        self._header_text = self._static_text("Alerta Programada", self._header_font)
+
+        self._title = ''
+        self._message = ''
+        self._item_text = self._static_text('', self._small_font)
+        self._priority_text = self._static_text('', self._small_font)
+        self._priority_color = self.PRIORITY_COLORS['medium']
+
+        # Wrapped texts, rebuilt only when the content or the width changes
+        self._layout_width = None
+        self._title_text = None
+        self._message_text = None
+
+        self.close_button = QPushButton("×", self)
+        self.close_button.setFixedSize(self.CLOSE_BUTTON_SIZE, self.CLOSE_BUTTON_SIZE)
+        self.close_button.setObjectName("closeButton")
+
+        policy = self.sizePolicy()
+        policy.setHeightForWidth(True)
+        self.setSizePolicy(policy)
+
+    def _derive_font(self, point_size, bold=False):
+        """Copy of the widget font with the given size and weight"""
+        font = QFont(self.font())
+        font.setPointSize(point_size)
+        font.setBold(bold)
+        return font
+
+    @staticmethod
+    def _static_text(text, font, width=-1):
+        """Build a plain-text QStaticText laid out for font (wrapped at width)"""
+        # QStaticText ignores "\n" in plain text; use Unicode line separators
+        static_text = QStaticText(text.replace('\n', '\u2028'))
+        static_text.setTextFormat(Qt.TextFormat.PlainText)
+        static_text.setTextWidth(width)
+        static_text.prepare(QTransform(), font)
+        return static_text
+
+    def set_content(self, title, message, item_text, priority_text, priority):
+        """
+        Replace the painted texts
+
+        Args:
+            title: Alert title
+            message: Alert message ('' hides the message block)
+            item_text: Associated item line
+            priority_text: Priority badge text
+            priority: 'low', 'medium' or 'high'
+        """
+        self._title = title
+        self._message = message
+        self._item_text = self._static_text(item_text, self._small_font)
+        self._priority_text = self._static_text(priority_text, self._small_font)
+        self._priority_color = self.PRIORITY_COLORS.get(
+            priority, self.PRIORITY_COLORS['medium'])
+
+        self._layout_width = None
+        self.updateGeometry()
+        self.update()
+
+    def _ensure_layout(self, width):
+        """Re-wrap title and message for width if needed"""
+        if width == self._layout_width:
+            return
+        self._title_text = self._static_text(self._title, self._title_font, width)
+        self._message_text = (
+            self._static_text(self._message, self._message_font, width)
+            if self._message else None
+        )
+        self._layout_width = width
+
+    def _header_height(self):
+        """Height of the icon/header/close button row"""
+        return max(
+            self.CLOSE_BUTTON_SIZE,
+            int(self._icon_text.size().height()),
+            int(self._header_text.size().height())
+        )
+
+    def _blocks(self, width):
+        """Static texts below the separator, in paint order, with colors and fonts"""
+        self._ensure_layout(width)
+        blocks = [(self._title_text, self.TEXT_COLOR, self._title_font)]
+        if self._message_text is not None:
+            blocks.append((self._message_text, self.MESSAGE_COLOR, self._message_font))
+        blocks.append((self._item_text, self.ITEM_COLOR, self._small_font))
+        blocks.append((self._priority_text, self._priority_color, self._small_font))
+        return blocks
+
+    def hasHeightForWidth(self):
+        return True
+
+    def heightForWidth(self, width):
+        height = self._header_height() + self.SPACING + 1
+        for static_text, _color, _font in self._blocks(width):
+            height += self.SPACING + int(static_text.size().height())
+        return height
+
+    def sizeHint(self):
+        return QSize(self.DEFAULT_WIDTH, self.heightForWidth(self.DEFAULT_WIDTH))
+
+    def minimumSizeHint(self):
+        return QSize(0, self.heightForWidth(self.DEFAULT_WIDTH))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.close_button.move(self.width() - self.CLOSE_BUTTON_SIZE, 0)
+
+    def paintEvent(self, event):
+        width = self.width()
+        header_height = self._header_height()
+        painter = QPainter(self)
+
+        # Header: icon + text, vertically centered on the close button row
+        x = 0
+        for static_text, font in ((self._icon_text, self._icon_font),
+                                  (self._header_text, self._header_font)):
+            size = static_text.size()
+            painter.setFont(font)
+            painter.setPen(self.TEXT_COLOR)
+            painter.drawStaticText(x, int((header_height - size.height()) / 2), static_text)
+            x += int(size.width()) + self.HEADER_SPACING
+
+        # Separator line
+        y = header_height + self.SPACING
+        painter.fillRect(0, y, width, 1, self.SEPARATOR_COLOR)
+        y += 1
+
+        for static_text, color, font in self._blocks(width):
+            y += self.SPACING
+            painter.setFont(font)
+            painter.setPen(color)
+            painter.drawStaticText(0, y, static_text)
+            y += int(static_text.size().height())
+
+        painter.end()
+
 
 class NotificationDialog(QDialog):
     """
@@ -19,25 +240,33 @@ class NotificationDialog(QDialog):
     Appears in bottom-right corner with alert information
     """
 
-    def __init__(self, alert, item, parent=None):
+    PRIORITY_TEXT = {
+        'low': '🟢 Prioridad Baja',
+        'medium': '🟡 Prioridad Media',
+        'high': '🔴 Prioridad Alta'
+    }
+
+    def __init__(self, alert=None, item=None, parent=None):
         """
         Initialize notification dialog
 
         Args:
-            alert: Alert dictionary
+            alert: Alert dictionary (can be set later with set_content)
             item: Item dictionary associated with alert
             parent: Parent widget
         """
         super().__init__(parent)
-        self.alert = alert
-        self.item = item
+        self.alert = {}
+        self.item = {}
+
+        # Widgets and styles are built on the first show (see setVisible)
+        self._built = False
+        self._content_dirty = False
 
         self.setup_window()
-        self.setup_ui()
-        self.apply_styles()
-        self.position_dialog()
 
-        logger.info(f"NotificationDialog shown for alert: {alert.get('id')}")
+        if alert is not None:
+            self.set_content(alert, item)
 
     def setup_window(self):
         """Configure window properties"""
@@ -61,89 +290,11 @@ class NotificationDialog(QDialog):
         layout.setContentsMargins(15, 15, 15, 15)
         layout.setSpacing(12)
 
-        # Header with close button
-        header_layout = QHBoxLayout()
-        header_layout.setSpacing(10)
-
-        # Alert icon and title
-        icon_label = QLabel("🔔")
-        icon_font = QFont()
-        icon_font.setPointSize(20)
-        icon_label.setFont(icon_font)
-        header_layout.addWidget(icon_label)
-
-        header_text = QLabel("Alerta Programada")
-        header_font = QFont()
-        header_font.setPointSize(11)
-        header_font.setBold(True)
-        header_text.setFont(header_font)
-        header_layout.addWidget(header_text, 1)
-
-        # Close button
-        close_btn = QPushButton("×")
-        close_btn.setFixedSize(25, 25)
-        close_btn.setObjectName("closeButton")
-        close_btn.clicked.connect(self.reject)
-        header_layout.addWidget(close_btn)
-
-        layout.addLayout(header_layout)
-
-        # Separator line
-        separator = QLabel()
-        separator.setFixedHeight(1)
-        separator.setStyleSheet("background-color: #3d3d3d;")
-        layout.addWidget(separator)
-
-        # Alert title
-        alert_title = self.alert.get('alert_title', 'Sin título')
-        title_label = QLabel(alert_title)
-        title_font = QFont()
-        title_font.setPointSize(12)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        title_label.setWordWrap(True)
-        layout.addWidget(title_label)
-
-        # Alert message
-        alert_message = self.alert.get('alert_message', '')
-        if alert_message:
-            message_label = QLabel(alert_message)
-            message_font = QFont()
-            message_font.setPointSize(10)
-            message_label.setFont(message_font)
-            message_label.setWordWrap(True)
-            message_label.setStyleSheet("color: #cccccc;")
-            layout.addWidget(message_label)
-
-        # Item info
-        item_info = QLabel(f"📌 Item: {self.item.get('label', 'Desconocido')}")
-        item_font = QFont()
-        item_font.setPointSize(9)
-        item_info.setFont(item_font)
-        item_info.setStyleSheet("color: #999999;")
-        layout.addWidget(item_info)
-
-        # Priority badge
-        priority = self.alert.get('priority', 'medium')
-        priority_text = {
-            'low': '🟢 Prioridad Baja',
-            'medium': '🟡 Prioridad Media',
-            'high': '🔴 Prioridad Alta'
-        }.get(priority, '🟡 Prioridad Media')
-
-        priority_label = QLabel(priority_text)
-        priority_font = QFont()
-        priority_font.setPointSize(9)
-        priority_label.setFont(priority_font)
-
-        if priority == 'high':
-            priority_label.setStyleSheet("color: #ff5252;")
-        elif priority == 'low':
-            priority_label.setStyleSheet("color: #4caf50;")
-        else:
-            priority_label.setStyleSheet("color: #ffc107;")
-
-        layout.addWidget(priority_label)
+        # Header, separator, title, message, item and priority are
+        # painted by a single widget
+        self.content = NotificationContentWidget()
+        self.content.close_button.clicked.connect(self.reject)
+        layout.addWidget(self.content)
 
         layout.addStretch()
 
@@ -170,71 +321,90 @@ class NotificationDialog(QDialog):
         # self.auto_close_timer.timeout.connect(self.reject)
         # self.auto_close_timer.start(30000)  # 30 seconds
 
+    def setVisible(self, visible):
+        """Build the UI on first show and fill in the pending alert"""
+        # Done before Qt's own show handling so the new children are shown
+        # and laid out with the dialog (showEvent would be too late for that)
+        if visible:
+            if not self._built:
+                self.apply_styles()
+                self.setup_ui()
+                self._built = True
+            if self._content_dirty:
+                self.fill_content()
+        super().setVisible(visible)
+
+    def set_content(self, alert, item):
+        """
+        Set the alert to display so the same instance can be reused
+
+        The widgets are only filled when the dialog is (or becomes) visible.
+
+        Args:
+            alert: Alert dictionary
+            item: Item dictionary associated with alert
+        """
+        self.alert = alert
+        self.item = item or {}
+        self._content_dirty = True
+
+        if self._built and self.isVisible():
+            self.fill_content()
+
+    def fill_content(self):
+        """Fill the widgets from the current alert, then resize and reposition"""
+        self._content_dirty = False
+        alert = self.alert
+
+        priority = alert.get('priority', 'medium')
+        if priority not in self.PRIORITY_TEXT:
+            priority = 'medium'
+
+        self.content.set_content(
+            alert.get('alert_title', 'Sin título'),
+            alert.get('alert_message', '') or '',
+            f"📌 Item: {self.item.get('label', 'Desconocido')}",
+            self.PRIORITY_TEXT[priority],
+            priority
+        )
+        self.set_priority(priority)
+
+        self.adjustSize()
+        self.position_dialog()
+
+        logger.info(f"NotificationDialog shown for alert: {alert.get('id')}")
+
     def apply_styles(self):
-        """Apply dark theme styles"""
-        priority = self.alert.get('priority', 'medium')
-
-        # Different border color based on priority
-        if priority == 'high':
-            border_color = "#ff5252"
-        elif priority == 'low':
-            border_color = "#4caf50"
-        else:
-            border_color = "#ffc107"
-
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: #2b2b2b;
-                border: 2px solid {border_color};
-                border-radius: 8px;
-            }}
-            QLabel {{
-                color: #ffffff;
-                background-color: transparent;
-            }}
-            QPushButton {{
-                background-color: #3d3d3d;
-                color: #cccccc;
-                border: 1px solid #4d4d4d;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 10pt;
-            }}
-            QPushButton:hover {{
-                background-color: #4d4d4d;
-                border-color: #007acc;
-            }}
-            QPushButton:pressed {{
-                background-color: #2d2d2d;
-            }}
-            #closeButton {{
-                background-color: transparent;
-                border: none;
-                color: #cccccc;
-                font-size: 18pt;
-                font-weight: bold;
-                border-radius: 12px;
-            }}
-            #closeButton:hover {{
-                background-color: #e81123;
-                color: #ffffff;
-            }}
-        """)
+        """Apply dark theme styles (installed once at application level)"""
+        self.setObjectName("notificationDialog")
+        install_app_stylesheet("notificationDialog", _NOTIFICATION_QSS)
+
+    def set_priority(self, priority):
+        """
+        Restyle the border for the given priority
+
+        The dialog is only re-polished when the priority actually changes;
+        the badge color is painted by the content widget.
+
+        Args:
+            priority: 'low', 'medium' or 'high'
+        """
+        if self.property("priority") == priority:
+            return
+
+        self.setProperty("priority", priority)
+        self.style().unpolish(self)
+        self.style().polish(self)
 
     def position_dialog(self):
         """Position dialog in bottom-right corner of screen"""
         try:
-            # Get primary screen
-            screen = self.screen()
-            if screen is None:
-                from PyQt6.QtWidgets import QApplication
-                screen = QApplication.primaryScreen()
-
-            screen_geometry = screen.availableGeometry()
+            # Cached primary screen geometry (no platform query per alert)
+            screen_geometry = get_available_geometry()
 
             # Calculate position (bottom-right corner with margins)
-            x = screen_geometry.width() - self.width() - 20
-            y = screen_geometry.height() - self.height() - 20
+            x = screen_geometry.x() + screen_geometry.width() - self.width() - 20
+            y = screen_geometry.y() + screen_geometry.height() - self.height() - 20
 
             self.move(x, y)
             logger.debug(f"Notification positioned at ({x}, {y})")
@@ -249,8 +419,68 @@ class NotificationDialog(QDialog):
         # For now, just accept the dialog
         self.accept()
 
-    def showEvent(self, event):
-        """Handle show event to ensure proper positioning"""
-        super().showEvent(event)
-        # Reposition after show to ensure correct placement
-        QTimer.singleShot(10, self.position_dialog)
+
+class AlertNotificationManager(QObject):
+    """
+    Shows triggered alerts one at a time in a single reused NotificationDialog
+
+    Alerts that arrive while a notification is open are queued and shown
+    when it is closed. Use AlertNotificationManager.instance() to share one
+    manager (and one popup) across the application.
+    """
+
+    # Emitted after an alert has been put on screen
+    alert_shown = pyqtSignal(dict)
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Get the application-wide notification manager"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._dialog = None
+        self._pending = deque()
+
+    def show_alert(self, alert, item):
+        """
+        Queue an alert for display
+
+        Args:
+            alert: Alert dictionary
+            item: Item dictionary associated with alert
+        """
+        self._pending.append((alert, item))
+        QTimer.singleShot(0, self._show_next)
+
+    def pending_count(self):
+        """Number of alerts waiting behind the visible notification"""
+        return len(self._pending)
+
+    @pyqtSlot()
+    def _show_next(self):
+        """Show the next queued alert unless a notification is already open"""
+        if self._dialog is not None and self._dialog.isVisible():
+            return  # Shown when the current notification is closed
+        if not self._pending:
+            return
+
+        alert, item = self._pending.popleft()
+        try:
+            # Non-modal, no nested event loop
+            if self._dialog is None:
+                self._dialog = NotificationDialog()
+                self._dialog.finished.connect(
+                    lambda _result: QTimer.singleShot(0, self._show_next))
+            self._dialog.set_content(alert, item)
+            self._dialog.show()
+            self._dialog.raise_()
+
+            self.alert_shown.emit(alert)
+
+        except Exception as e:
+            logger.error(f"Error showing notification: {e}", exc_info=True)
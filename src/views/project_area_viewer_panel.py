@@ -1366,8 +1366,10 @@ class ProjectAreaViewerPanel(QWidget):
                     group_widget.add_item_clicked.connect(add_item_callback)
 
                 # Agregar items al grupo
+                group_widget.begin_bulk_add()
                 for item_data in group['items']:
                     group_widget.add_item(item_data)
+                group_widget.end_bulk_add()
 
                 tag_container_layout.addWidget(group_widget)
 
@@ -1401,8 +1403,10 @@ class ProjectAreaViewerPanel(QWidget):
 
         # Grupo de items
         group_widget = ItemGroupWidget("Sin clasificar", "other")
+        group_widget.begin_bulk_add()
         for item_data in items:
             group_widget.add_item(item_data)
+        group_widget.end_bulk_add()
 
         tag_container_layout.addWidget(group_widget)
         self.content_layout.addWidget(tag_container)
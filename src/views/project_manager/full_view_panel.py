@@ -14,7 +14,7 @@ Versión: 1.0
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QScrollArea, QLabel, QFrame, QPushButton, QHBoxLayout
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QEvent, QCoreApplication
 from PyQt6.QtGui import QShortcut, QKeySequence
 from .styles.full_view_styles import FullViewStyles
 from .widgets.headers import ProjectHeaderWidget, ProjectTagHeaderWidget
@@ -285,8 +285,10 @@ class ProjectFullViewPanel(QWidget):
             )
 
             # Agregar items al grupo
+            group_widget.begin_bulk_add()
             for item_data in group['items']:
                 group_widget.add_item(item_data)
+            group_widget.end_bulk_add()
 
             tag_container_layout.addWidget(group_widget)
 
@@ -320,8 +322,10 @@ class ProjectFullViewPanel(QWidget):
 
         # Grupo de items
         group_widget = ItemGroupWidget("Sin clasificar", "other")
+        group_widget.begin_bulk_add()
         for item_data in items:
             group_widget.add_item(item_data)
+        group_widget.end_bulk_add()
 
         tag_container_layout.addWidget(group_widget)
         self.content_layout.addWidget(tag_container)
@@ -441,6 +445,11 @@ class ProjectFullViewPanel(QWidget):
         # Buscar en todos los widgets de items
         from .widgets.items.base_item_widget import BaseItemWidget
 
+        # Crear antes los widgets de items que los grupos tengan pendientes
+        created_items = False
+        for group_widget in self.content_widget.findChildren(ItemGroupWidget):
+            created_items = group_widget.create_pending_items() or created_items
+
         all_item_widgets = self.content_widget.findChildren(BaseItemWidget)
 
         for item_widget in all_item_widgets:
@@ -453,8 +462,12 @@ class ProjectFullViewPanel(QWidget):
         if total_results > 0:
             self.current_result_index = 0
             self.search_bar.update_results(0, total_results)
-            # Scroll al primer resultado
-            self._scroll_to_item(self.search_results[0])
+            # Scroll al primer resultado (los widgets recién creados aún no
+            # tienen posición: esperar a que se procese el layout)
+            if created_items:
+                QTimer.singleShot(0, self._scroll_to_current_result)
+            else:
+                self._scroll_to_item(self.search_results[0])
         else:
             self.search_bar.update_results(0, 0)
 
@@ -513,6 +526,18 @@ class ProjectFullViewPanel(QWidget):
         for item_widget in all_item_widgets:
             item_widget.clear_highlight()
 
+    def _scroll_to_current_result(self):
+        """
+        Hacer scroll al resultado de búsqueda actual (si sigue existiendo)
+
+        Se llama diferido tras crear widgets pendientes: procesa antes los
+        LayoutRequest encolados para que los grupos anidados ya tengan su
+        posición final.
+        """
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.LayoutRequest.value)
+        if 0 <= self.current_result_index < len(self.search_results):
+            self._scroll_to_item(self.search_results[self.current_result_index])
+
     def _scroll_to_item(self, item_widget):
         """
         Hacer scroll para mostrar un item específico
@@ -427,6 +427,219 @@ class FullViewStyles:
             }}
         """
 
+    @classmethod
+    def get_item_group_style(cls):
+        """
+        Estilos compartidos por un ItemGroupWidget y todos sus items
+
+        Se aplican una vez en el grupo en lugar de llamar a setStyleSheet en
+        cada item, botón, barra y contenedor. Incluye los estilos de cada
+        tipo de item (TextItemWidget, CodeItemWidget, ...). Los widgets solo
+        fijan su objectName (o propiedades dinámicas para estados como
+        "copied").
+        """
+        return (
+            cls.get_text_item_style()
+            + cls.get_code_item_style()
+            + cls.get_url_item_style()
+            + cls.get_path_item_style()
+            + cls.get_web_static_item_style()
+            + cls.get_copy_button_style()
+        ) + """
+            QFrame#itemsToolbar {
+                background-color: #252525;
+                border-top: 1px solid #333;
+                border-bottom: 1px solid #333;
+            }
+
+            QLabel#itemsToolbarLabel {
+                color: #ffffff;
+                font-size: 10px;
+                font-weight: bold;
+            }
+
+            QPushButton#addItemButton {
+                background-color: #1565C0;
+                color: #ffffff;
+                border: 1px solid #1976D2;
+                border-radius: 4px;
+                font-size: 10px;
+                font-weight: bold;
+                padding: 4px 10px;
+            }
+            QPushButton#addItemButton:hover {
+                background-color: #1976D2;
+            }
+            QPushButton#addItemButton:pressed {
+                background-color: #0d47a1;
+            }
+
+            QPushButton#createListButton {
+                background-color: #2d5d2e;
+                color: #00ff88;
+                border: 2px solid #00ff88;
+                border-radius: 4px;
+                font-size: 16px;
+                font-weight: bold;
+            }
+            QPushButton#createListButton:hover {
+                background-color: #3a7a3c;
+                border-color: #7CFC00;
+            }
+            QPushButton#createListButton:pressed {
+                background-color: #1a4d2e;
+            }
+
+            QPushButton#copyListNameButton {
+                background-color: #3d3d3d;
+                color: #ffffff;
+                border: 1px solid #555;
+                border-radius: 4px;
+                font-size: 12px;
+                padding: 2px;
+            }
+            QPushButton#copyListNameButton:hover {
+                background-color: #4d4d4d;
+                border-color: #666;
+            }
+            QPushButton#copyListNameButton:pressed {
+                background-color: #2d2d2d;
+            }
+
+            QWidget#itemActionBar {
+                background-color: transparent;
+            }
+
+            QWidget#itemContentArea,
+            QWidget#itemContentArea QWidget {
+                background: transparent;
+            }
+
+            QScrollArea#itemContentScroll {
+                background: transparent;
+                border: none;
+            }
+            QScrollArea#itemContentScroll QScrollBar:vertical {
+                background: #2d2d2d;
+                width: 8px;
+                border-radius: 4px;
+            }
+            QScrollArea#itemContentScroll QScrollBar::handle:vertical {
+                background: #555555;
+                border-radius: 4px;
+                min-height: 20px;
+            }
+            QScrollArea#itemContentScroll QScrollBar::handle:vertical:hover {
+                background: #00ff88;
+            }
+            QScrollArea#itemContentScroll QScrollBar::add-line:vertical,
+            QScrollArea#itemContentScroll QScrollBar::sub-line:vertical {
+                height: 0px;
+            }
+
+            QPushButton#itemMoveButton {
+                background-color: #4d4d4d;
+                color: #ff5555;
+                border: 1px solid #555;
+                border-radius: 4px;
+                font-size: 12px;
+                font-weight: bold;
+                padding: 2px;
+            }
+            QPushButton#itemMoveButton:hover {
+                background-color: #5d5d5d;
+                border-color: #ff5555;
+                color: #ff7777;
+            }
+            QPushButton#itemMoveButton:pressed {
+                background-color: #3d3d3d;
+            }
+            QPushButton#itemMoveButton:disabled {
+                background-color: #2d2d2d;
+                color: #555;
+                border-color: #444;
+            }
+
+            QPushButton#itemEditButton {
+                background-color: #FF9800;
+                color: #ffffff;
+                border: 1px solid #F57C00;
+                border-radius: 4px;
+                font-size: 14px;
+                padding: 2px;
+            }
+            QPushButton#itemEditButton:hover {
+                background-color: #FB8C00;
+                border-color: #E65100;
+            }
+            QPushButton#itemEditButton:pressed {
+                background-color: #E65100;
+            }
+
+            QPushButton#itemCopyButton {
+                background-color: #3d3d3d;
+                color: #ffffff;
+                border: 1px solid #555;
+                border-radius: 4px;
+                font-size: 14px;
+                padding: 2px;
+            }
+            QPushButton#itemCopyButton:hover {
+                background-color: #4d4d4d;
+                border-color: #666;
+            }
+            QPushButton#itemCopyButton:pressed {
+                background-color: #2d2d2d;
+            }
+
+            QPushButton#itemCopyButton[copied="true"],
+            QPushButton#copyListNameButton[copied="true"] {
+                background-color: #4CAF50;
+                border-color: #45a049;
+            }
+            QPushButton#itemCopyButton[copied="true"]:hover,
+            QPushButton#copyListNameButton[copied="true"]:hover {
+                background-color: #45a049;
+                border-color: #3d8b40;
+            }
+            QPushButton#itemCopyButton[copied="true"]:pressed,
+            QPushButton#copyListNameButton[copied="true"]:pressed {
+                background-color: #3d8b40;
+            }
+
+            QPushButton#itemInfoButton {
+                background-color: #2196F3;
+                color: #ffffff;
+                border: 1px solid #1976D2;
+                border-radius: 4px;
+                font-size: 14px;
+                padding: 2px;
+            }
+            QPushButton#itemInfoButton:hover {
+                background-color: #1976D2;
+                border-color: #0d47a1;
+            }
+            QPushButton#itemInfoButton:pressed {
+                background-color: #0d47a1;
+            }
+
+            QPushButton#itemDeleteButton {
+                background-color: #d32f2f;
+                color: #ffffff;
+                border: 1px solid #b71c1c;
+                border-radius: 4px;
+                font-size: 14px;
+                padding: 2px;
+            }
+            QPushButton#itemDeleteButton:hover {
+                background-color: #c62828;
+                border-color: #8e0000;
+            }
+            QPushButton#itemDeleteButton:pressed {
+                background-color: #b71c1c;
+            }
+        """
+
     @staticmethod
     def get_copy_button_style():
         """Estilos para CopyButton"""
@@ -450,6 +663,13 @@ class FullViewStyles:
                 background-color: {Colors.ACCENT};
                 color: #FFFFFF;
             }}
+
+            CopyButton[copied="true"] {{
+                background-color: {Colors.SUCCESS};
+                color: #FFFFFF;
+                border: none;
+                font-weight: bold;
+            }}
         """
 
     @staticmethod
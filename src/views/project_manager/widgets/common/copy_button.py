@@ -10,8 +10,6 @@ Versión: 1.0
 
 from PyQt6.QtWidgets import QPushButton
 from PyQt6.QtCore import QTimer, pyqtSignal, Qt
-from ...styles.full_view_styles import FullViewStyles
-from ...styles.color_palette import FullViewColorPalette
 
 
 class CopyButton(QPushButton):
@@ -21,6 +19,9 @@ class CopyButton(QPushButton):
     Muestra un icono de copiar que cambia a check cuando
     se hace click, con feedback visual temporal.
 
+    Los estilos (incluido el estado copied="true") vienen de
+    FullViewStyles.get_item_group_style(), aplicada en el grupo contenedor.
+
     Señales:
         copy_clicked: Emitida cuando se hace click en el botón
     """
@@ -42,7 +43,6 @@ class CopyButton(QPushButton):
         self.feedback_duration = 1000  # ms
 
         self.init_ui()
-        self.apply_styles()
 
     def init_ui(self):
         """Inicializar interfaz de usuario"""
@@ -54,10 +54,6 @@ class CopyButton(QPushButton):
         # Conectar señal de click
         self.clicked.connect(self.on_clicked)
 
-    def apply_styles(self):
-        """Aplicar estilos CSS"""
-        self.setStyleSheet(FullViewStyles.get_copy_button_style())
-
     def on_clicked(self):
         """Manejar evento de click"""
         self.show_feedback()
@@ -75,16 +71,7 @@ class CopyButton(QPushButton):
         self.setToolTip("¡Copiado!")
 
         # Aplicar estilo de éxito
-        self.setStyleSheet(f"""
-            CopyButton {{
-                background-color: {FullViewColorPalette.SUCCESS};
-                color: #FFFFFF;
-                border: none;
-                border-radius: 4px;
-                font-size: 16px;
-                font-weight: bold;
-            }}
-        """)
+        self._set_copied(True)
 
         # Restaurar después de feedback_duration
         QTimer.singleShot(self.feedback_duration, self.reset_state)
@@ -93,7 +80,18 @@ class CopyButton(QPushButton):
         """Restaurar estado original del botón"""
         self.setText(self.original_text)
         self.setToolTip("Copiar al portapapeles")
-        self.apply_styles()
+        self._set_copied(False)
+
+    def _set_copied(self, copied: bool):
+        """
+        Activar/desactivar el estilo de "copiado"
+
+        Args:
+            copied: True para mostrar el estilo de éxito
+        """
+        self.setProperty("copied", copied)
+        self.style().unpolish(self)
+        self.style().polish(self)
 
     def set_feedback_duration(self, duration_ms: int):
         """
@@ -20,7 +20,8 @@ class SearchBarWidget(QWidget):
     Barra de búsqueda tipo Ctrl+F
 
     Características:
-    - Campo de texto con búsqueda en tiempo real (debounce 300ms)
+    - Campo de texto con búsqueda en tiempo real (inmediata, como máximo
+      una búsqueda cada 300ms mientras se escribe)
     - Botones de navegación (anterior/siguiente)
     - Contador de resultados (ej: "2 de 15")
     - Botón cerrar
@@ -39,6 +40,9 @@ class SearchBarWidget(QWidget):
     previous_result = pyqtSignal()  # Ir al resultado anterior
     search_closed = pyqtSignal()  # Cerrar búsqueda
 
+    # Tiempo mínimo entre dos búsquedas mientras se escribe
+    SEARCH_COOLDOWN_MS = 300
+
     def __init__(self, parent=None):
         """
         Inicializar widget de búsqueda
@@ -51,9 +55,11 @@ class SearchBarWidget(QWidget):
         # Estado interno
         self.current_index = 0
         self.total_results = 0
+        self._last_emitted_text = ''
+        self._pending_text = None  # Texto llegado durante el enfriamiento
         self.search_timer = QTimer()
         self.search_timer.setSingleShot(True)
-        self.search_timer.timeout.connect(self._emit_search_changed)
+        self.search_timer.timeout.connect(self._on_cooldown_finished)
 
         self.init_ui()
         self.apply_styles()
@@ -164,24 +170,41 @@ class SearchBarWidget(QWidget):
 
     def _on_text_changed(self, text: str):
         """
-        Manejar cambio de texto con debounce
+        Manejar cambio de texto con enfriamiento
+
+        La primera tecla busca al instante; las que llegan durante los
+        siguientes SEARCH_COOLDOWN_MS solo guardan el texto, que se busca
+        al terminar el enfriamiento.
 
         Args:
             text: Texto ingresado
         """
-        # Reiniciar timer de debounce
-        self.search_timer.stop()
-
-        if text:
-            # Esperar 300ms antes de buscar
-            self.search_timer.start(300)
-        else:
+        if not text:
             # Si el texto está vacío, emitir inmediatamente
-            self._emit_search_changed()
+            self.search_timer.stop()
+            self._pending_text = None
+            self._emit_search_changed(text)
+            return
+
+        if self.search_timer.isActive():
+            self._pending_text = text
+            return
+
+        self._emit_search_changed(text)
+        self.search_timer.start(self.SEARCH_COOLDOWN_MS)
+
+    def _on_cooldown_finished(self):
+        """Buscar el último texto recibido durante el enfriamiento, si cambió"""
+        text, self._pending_text = self._pending_text, None
+        if text is None or text == self._last_emitted_text:
+            return
+
+        self._emit_search_changed(text)
+        self.search_timer.start(self.SEARCH_COOLDOWN_MS)
 
-    def _emit_search_changed(self):
+    def _emit_search_changed(self, text: str):
         """Emitir señal de búsqueda cambiada"""
-        text = self.search_input.text()
+        self._last_emitted_text = text
         self.search_text_changed.emit(text)
 
     def _on_close(self):
@@ -107,23 +107,7 @@ class GroupHeaderWidget(QFrame):
         self.create_list_btn.setFixedSize(24, 24)
         self.create_list_btn.setToolTip("Crear nueva lista")
         self.create_list_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.create_list_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2d5d2e;
-                color: #00ff88;
-                border: 2px solid #00ff88;
-                border-radius: 4px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #3a7a3c;
-                border-color: #7CFC00;
-            }
-            QPushButton:pressed {
-                background-color: #1a4d2e;
-            }
-        """)
+        self.create_list_btn.setObjectName("createListButton")
         self.create_list_btn.clicked.connect(self.create_list_clicked.emit)
 
         # Insertar botón antes del spacer
@@ -138,23 +122,7 @@ class GroupHeaderWidget(QFrame):
         self.copy_list_name_btn.setFixedSize(24, 24)
         self.copy_list_name_btn.setToolTip("Copiar nombre de lista al portapapeles")
         self.copy_list_name_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.copy_list_name_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: 1px solid #555;
-                border-radius: 4px;
-                font-size: 12px;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-                border-color: #666;
-            }
-            QPushButton:pressed {
-                background-color: #2d2d2d;
-            }
-        """)
+        self.copy_list_name_btn.setObjectName("copyListNameButton")
         self.copy_list_name_btn.clicked.connect(self._copy_list_name_to_clipboard)
 
         # Insertar botón antes del spacer
@@ -166,27 +134,8 @@ class GroupHeaderWidget(QFrame):
             # Copiar al portapapeles
             pyperclip.copy(self.group_name)
 
-            # Feedback visual: cambiar a verde temporalmente
-            success_style = """
-                QPushButton {
-                    background-color: #4CAF50;
-                    color: #ffffff;
-                    border: 1px solid #45a049;
-                    border-radius: 4px;
-                    font-size: 12px;
-                    padding: 2px;
-                }
-                QPushButton:hover {
-                    background-color: #45a049;
-                    border-color: #3d8b40;
-                }
-                QPushButton:pressed {
-                    background-color: #3d8b40;
-                }
-            """
-
-            # Cambiar a verde con checkmark
-            self.copy_list_name_btn.setStyleSheet(success_style)
+            # Feedback visual: cambiar a verde con checkmark
+            self._set_copy_button_copied(True)
             self.copy_list_name_btn.setText("✓")
 
             # Restaurar después de 1.5 segundos
@@ -197,27 +146,23 @@ class GroupHeaderWidget(QFrame):
 
     def _restore_copy_button_style(self):
         """Restaurar estilo original del botón de copiar"""
-        original_style = """
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: 1px solid #555;
-                border-radius: 4px;
-                font-size: 12px;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-                border-color: #666;
-            }
-            QPushButton:pressed {
-                background-color: #2d2d2d;
-            }
-        """
         if self.copy_list_name_btn:
-            self.copy_list_name_btn.setStyleSheet(original_style)
+            self._set_copy_button_copied(False)
             self.copy_list_name_btn.setText("📋")
 
+    def _set_copy_button_copied(self, copied: bool):
+        """
+        Activar/desactivar el estado "copied" del botón de copiar
+
+        El estilo de cada estado está en FullViewStyles.get_item_group_style().
+
+        Args:
+            copied: True para mostrar el estilo de éxito
+        """
+        self.copy_list_name_btn.setProperty("copied", copied)
+        self.copy_list_name_btn.style().unpolish(self.copy_list_name_btn)
+        self.copy_list_name_btn.style().polish(self.copy_list_name_btn)
+
     def get_group_name(self) -> str:
         """
         Obtener nombre del grupo
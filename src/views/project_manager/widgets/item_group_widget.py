@@ -9,9 +9,10 @@ Versión: 1.1
 """
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer
 from .headers.group_header import GroupHeaderWidget
 from .items import TextItemWidget, CodeItemWidget, URLItemWidget, PathItemWidget, WebStaticItemWidget
+from ..styles.full_view_styles import FullViewStyles
 
 
 class ItemGroupWidget(QWidget):
@@ -33,6 +34,9 @@ class ItemGroupWidget(QWidget):
     create_list_clicked = pyqtSignal()
     add_item_clicked = pyqtSignal()
 
+    # Widgets de item creados por vuelta del event loop
+    ITEM_BATCH_SIZE = 20
+
     def __init__(self, group_name: str, group_type: str = "category", parent=None):
         """
         Inicializar widget de grupo de items
@@ -46,7 +50,10 @@ class ItemGroupWidget(QWidget):
 
         self.group_name = group_name
         self.group_type = group_type
-        self.items = []
+        self._item_widgets = []
+        self._pending_items = []  # item_data cuyo widget aún no se creó
+        self._batch_scheduled = False
+        self._bulk_adding = False
 
         self.init_ui()
 
@@ -56,6 +63,9 @@ class ItemGroupWidget(QWidget):
         self.main_layout.setContentsMargins(0, 0, 0, 0)
         self.main_layout.setSpacing(0)
 
+        # Estilos compartidos por header, toolbar e items del grupo
+        self.setStyleSheet(FullViewStyles.get_item_group_style())
+
         # Header del grupo
         self.header = GroupHeaderWidget()
         self.header.set_group_info(self.group_name, self.group_type)
@@ -75,24 +85,13 @@ class ItemGroupWidget(QWidget):
         """Agregar barra de herramientas de items (solo para listas)"""
         toolbar = QFrame()
         toolbar.setObjectName("itemsToolbar")
-        toolbar.setStyleSheet("""
-            QFrame#itemsToolbar {
-                background-color: #252525;
-                border-top: 1px solid #333;
-                border-bottom: 1px solid #333;
-            }
-        """)
         toolbar_layout = QHBoxLayout(toolbar)
         toolbar_layout.setContentsMargins(40, 8, 15, 8)
         toolbar_layout.setSpacing(10)
 
         # Label "Items"
         items_label = QLabel("📦 Items")
-        items_label.setStyleSheet("""
-            color: #ffffff;
-            font-size: 10px;
-            font-weight: bold;
-        """)
+        items_label.setObjectName("itemsToolbarLabel")
         toolbar_layout.addWidget(items_label)
 
         toolbar_layout.addStretch()
@@ -103,34 +102,103 @@ class ItemGroupWidget(QWidget):
         add_item_btn.setMinimumWidth(110)
         add_item_btn.setToolTip("Agregar nuevo item a esta lista")
         add_item_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        add_item_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1565C0;
-                color: #ffffff;
-                border: 1px solid #1976D2;
-                border-radius: 4px;
-                font-size: 10px;
-                font-weight: bold;
-                padding: 4px 10px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-            QPushButton:pressed {
-                background-color: #0d47a1;
-            }
-        """)
+        add_item_btn.setObjectName("addItemButton")
         add_item_btn.clicked.connect(self.add_item_clicked.emit)
         toolbar_layout.addWidget(add_item_btn)
 
         self.main_layout.addWidget(toolbar)
 
+    @property
+    def items(self) -> list:
+        """
+        Widgets de los items del grupo
+
+        Crea antes los que aún estén pendientes, para que búsquedas y
+        recorridos vean siempre todos los items.
+        """
+        self.create_pending_items()
+        return self._item_widgets
+
     def add_item(self, item_data: dict):
         """
         Agregar item al grupo
 
-        Crea el widget apropiado según el tipo de item
-        y lo agrega al layout de items.
+        El widget no se crea aquí: se encola y se crea por lotes de
+        ITEM_BATCH_SIZE en las siguientes vueltas del event loop, para que
+        la vista se muestre sin esperar a construir cientos de widgets.
+
+        Args:
+            item_data: Diccionario con datos del item
+        """
+        self._pending_items.append(item_data)
+
+        if not self._bulk_adding:
+            self._schedule_next_batch()
+
+    def begin_bulk_add(self):
+        """
+        Empezar una carga masiva de items
+
+        Los add_item() siguientes solo encolan; el primer lote se programa
+        una sola vez en end_bulk_add().
+        """
+        self._bulk_adding = True
+
+    def end_bulk_add(self):
+        """Terminar una carga masiva iniciada con begin_bulk_add()"""
+        self._bulk_adding = False
+        self._schedule_next_batch()
+
+    def _schedule_next_batch(self):
+        """Programar la creación del siguiente lote si hay items pendientes"""
+        if self._pending_items and not self._batch_scheduled:
+            self._batch_scheduled = True
+            QTimer.singleShot(0, self._create_next_batch)
+
+    @pyqtSlot()
+    def _create_next_batch(self):
+        """Crear el siguiente lote de widgets pendientes"""
+        self._batch_scheduled = False
+        if not self._pending_items:
+            return
+
+        batch = self._pending_items[:self.ITEM_BATCH_SIZE]
+        del self._pending_items[:self.ITEM_BATCH_SIZE]
+        self._create_item_widgets(batch)
+
+        self._schedule_next_batch()
+
+    def create_pending_items(self) -> bool:
+        """
+        Crear ya todos los widgets de items pendientes
+
+        Returns:
+            True si se crearon widgets (aún sin geometría hasta que el
+            layout se procese en el event loop)
+        """
+        pending, self._pending_items = self._pending_items, []
+        if pending:
+            self._create_item_widgets(pending)
+        return bool(pending)
+
+    def _create_item_widgets(self, items_data: list):
+        """
+        Crear varios widgets de items con una sola actualización del grupo
+
+        Args:
+            items_data: Lista de diccionarios con datos de items
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            for item_data in items_data:
+                self._create_item_widget(item_data)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _create_item_widget(self, item_data: dict):
+        """
+        Crear el widget apropiado según el tipo de item
+        y agregarlo al layout de items
 
         Args:
             item_data: Diccionario con datos del item
@@ -152,7 +220,7 @@ class ItemGroupWidget(QWidget):
         # Conectar señal de copiado
         item_widget.item_copied.connect(self.on_item_copied)
 
-        self.items.append(item_widget)
+        self._item_widgets.append(item_widget)
         self.items_layout.addWidget(item_widget)
 
     def on_item_copied(self, item_data: dict):
@@ -167,9 +235,10 @@ class ItemGroupWidget(QWidget):
 
     def clear_items(self):
         """Limpiar todos los items del grupo"""
-        for item in self.items:
+        self._pending_items.clear()
+        for item in self._item_widgets:
             item.deleteLater()
-        self.items.clear()
+        self._item_widgets.clear()
 
     def get_item_count(self) -> int:
         """
@@ -178,7 +247,7 @@ class ItemGroupWidget(QWidget):
         Returns:
             Número de items
         """
-        return len(self.items)
+        return len(self._item_widgets) + len(self._pending_items)
 
     def get_group_name(self) -> str:
         """
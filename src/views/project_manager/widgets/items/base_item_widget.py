@@ -10,15 +10,29 @@ Versión: 1.0
 
 from PyQt6.QtWidgets import QFrame, QHBoxLayout, QVBoxLayout, QLabel, QPushButton, QMenu, QScrollArea, QWidget
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QCursor
+from PyQt6.QtGui import QCursor, QGuiApplication
 from abc import abstractmethod
-import pyperclip
+from functools import lru_cache
 import re
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _compile_search_pattern(search_text: str) -> re.Pattern:
+    """
+    Compilar (una sola vez por texto) el patrón de resaltado de búsqueda
+
+    Args:
+        search_text: Texto buscado
+
+    Returns:
+        Patrón case-insensitive que coincide literalmente con search_text
+    """
+    return re.compile(re.escape(search_text), re.IGNORECASE)
+
+
 class BaseItemWidget(QFrame):
     """
     Clase base abstracta para todos los widgets de items
@@ -48,6 +62,7 @@ class BaseItemWidget(QFrame):
 
         self.item_data = item_data
         self.copy_button = None
+        self._update_search_haystack()
 
         # Variables para resize manual
         self._is_resizing = False
@@ -84,7 +99,7 @@ class BaseItemWidget(QFrame):
         # ✨ NUEVO: Barra de acciones superior (esquina derecha)
         action_bar = QWidget()
         action_bar.setFixedHeight(32)
-        action_bar.setStyleSheet("background-color: transparent;")
+        action_bar.setObjectName("itemActionBar")
         action_bar_layout = QHBoxLayout(action_bar)
         action_bar_layout.setContentsMargins(8, 4, 8, 4)
         action_bar_layout.setSpacing(6)
@@ -108,7 +123,7 @@ class BaseItemWidget(QFrame):
 
         # ✨ MODIFICADO: Área de contenido (debajo de la barra)
         content_container_widget = QWidget()
-        content_container_widget.setStyleSheet("background: transparent;")
+        content_container_widget.setObjectName("itemContentArea")
         content_container_layout = QVBoxLayout(content_container_widget)
         content_container_layout.setContentsMargins(8, 0, 8, 6)
         content_container_layout.setSpacing(0)
@@ -119,32 +134,14 @@ class BaseItemWidget(QFrame):
         self.content_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.content_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.content_scroll.setFrameShape(QFrame.Shape.NoFrame)
-        self.content_scroll.setStyleSheet("""
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background: #2d2d2d;
-                width: 8px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical {
-                background: #555555;
-                border-radius: 4px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #00ff88;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        self.content_scroll.setObjectName("itemContentScroll")
 
         # Widget contenedor del contenido (dentro del scroll)
         self.content_container = QWidget()
-        self.content_container.setStyleSheet("background: transparent;")
+        self.content_container.setObjectName("itemContentArea")
+
+        # Labels con texto buscable (las registra render_content)
+        self._highlightable_labels = []
 
         # Layout de contenido (vertical, dentro del contenedor)
         self.content_layout = QVBoxLayout(self.content_container)
@@ -170,9 +167,24 @@ class BaseItemWidget(QFrame):
 
         Este método debe ser implementado por cada subclase
         para mostrar el contenido según el tipo de item.
+        Los QLabel con texto del item deben pasarse a _register_label()
+        para que la búsqueda los resalte.
         """
         pass
 
+    def _register_label(self, label: QLabel) -> QLabel:
+        """
+        Registrar un QLabel cuyo texto se resalta al buscar
+
+        Args:
+            label: QLabel creado en render_content
+
+        Returns:
+            El mismo label
+        """
+        self._highlightable_labels.append(label)
+        return label
+
     def copy_to_clipboard(self):
         """
         Copiar contenido del item al portapapeles
@@ -197,15 +209,11 @@ class BaseItemWidget(QFrame):
 
         content = self.item_data.get('content', '')
         if content:
-            try:
-                pyperclip.copy(content)
-                self.item_copied.emit(self.item_data)
-
-                # Feedback visual: cambiar botón a verde temporalmente
-                self._show_copy_success_feedback()
+            QGuiApplication.clipboard().setText(content)
+            self.item_copied.emit(self.item_data)
 
-            except Exception as e:
-                print(f"Error al copiar al portapapeles: {e}")
+            # Feedback visual: cambiar botón a verde temporalmente
+            self._show_copy_success_feedback()
 
     def get_item_label(self) -> str:
         """
@@ -294,30 +302,27 @@ class BaseItemWidget(QFrame):
         if not search_text:
             return False
 
-        search_lower = search_text.lower()
-
-        # Buscar en label
-        label = self.get_item_label()
-        if label and search_lower in label.lower():
-            return True
-
-        # Buscar en content (sin enmascarar)
-        content = self.item_data.get('content', '')
-        if content and search_lower in content.lower():
-            return True
+        return search_text.lower() in self._search_haystack
 
-        # Buscar en description
-        description = self.get_item_description()
-        if description and search_lower in description.lower():
-            return True
+    def _update_search_haystack(self):
+        """
+        Precalcular el texto en minúsculas donde busca has_match
 
-        return False
+        Une label, content (sin enmascarar) y description con un separador
+        que no puede aparecer en la búsqueda. Debe llamarse cada vez que
+        cambia item_data.
+        """
+        self._search_haystack = '\x00'.join((
+            self.get_item_label() or '',
+            self.item_data.get('content', '') or '',
+            self.get_item_description() or ''
+        )).lower()
 
     def highlight_text(self, search_text: str):
         """
         Resaltar texto de búsqueda en el widget
 
-        Recorre todos los QLabel hijos y resalta el texto encontrado
+        Recorre los QLabel registrados y resalta el texto encontrado
         usando HTML con color de fondo amarillo.
 
         Args:
@@ -326,9 +331,17 @@ class BaseItemWidget(QFrame):
         if not search_text:
             return
 
-        # Recorrer todos los widgets hijos que sean QLabel
-        for child in self.findChildren(QLabel):
-            self._highlight_label(child, search_text)
+        # Si el item no contiene el texto, ningún label lo contiene
+        search_lower = search_text.lower()
+        if search_lower not in self._search_haystack:
+            return
+
+        # Patrón compilado una vez por texto, no por label
+        pattern = _compile_search_pattern(search_text)
+
+        # Recorrer solo los labels registrados (sin recorrer el árbol de hijos)
+        for label in self._highlightable_labels:
+            self._highlight_label(label, pattern, search_lower)
 
     def clear_highlight(self):
         """
@@ -336,35 +349,38 @@ class BaseItemWidget(QFrame):
 
         Restaura el texto original sin HTML de resaltado.
         """
-        # Recorrer todos los QLabel hijos y limpiar HTML
-        for child in self.findChildren(QLabel):
-            self._clear_label_highlight(child)
+        # Recorrer los QLabel registrados y limpiar HTML
+        for label in self._highlightable_labels:
+            self._clear_label_highlight(label)
 
-    def _highlight_label(self, label: QLabel, search_text: str):
+    def _highlight_label(self, label: QLabel, pattern: re.Pattern, search_lower: str):
         """
         Resaltar texto en un QLabel específico
 
         Args:
             label: QLabel a modificar
-            search_text: Texto a resaltar
+            pattern: Patrón compilado del texto a resaltar
+            search_lower: Texto a resaltar en minúsculas
         """
-        original_text = label.text()
-
-        # Si el texto ya tiene HTML (indicado por tags), extraer texto plano
-        if '<' in original_text and '>' in original_text:
-            # Intentar extraer texto sin HTML
-            import html
-            plain_text = re.sub(r'<[^>]+>', '', original_text)
-            plain_text = html.unescape(plain_text)
-        else:
-            plain_text = original_text
+        # Texto plano guardado en el primer resaltado (propiedad dinámica)
+        plain_text = label.property("original_text")
+        if not plain_text:
+            original_text = label.text()
+
+            # Si el texto ya tiene HTML (indicado por tags), extraer texto plano
+            if '<' in original_text and '>' in original_text:
+                # Intentar extraer texto sin HTML
+                import html
+                plain_text = re.sub(r'<[^>]+>', '', original_text)
+                plain_text = html.unescape(plain_text)
+            else:
+                plain_text = original_text
 
-        # Guardar texto original en una propiedad dinámica si no existe
-        if not label.property("original_text"):
             label.setProperty("original_text", plain_text)
 
-        # Crear patrón regex case-insensitive
-        pattern = re.compile(re.escape(search_text), re.IGNORECASE)
+        # Comprobación barata antes de la sustitución con regex
+        if search_lower not in plain_text.lower():
+            return
 
         # Función de reemplazo que preserva el caso original
         def replace_match(match):
@@ -405,30 +421,7 @@ class BaseItemWidget(QFrame):
         self.move_up_button = QPushButton("▲")
         self.move_up_button.setFixedSize(32, 24)
         self.move_up_button.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.move_up_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4d4d4d;
-                color: #ff5555;
-                border: 1px solid #555;
-                border-radius: 4px;
-                font-size: 12px;
-                font-weight: bold;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background-color: #5d5d5d;
-                border-color: #ff5555;
-                color: #ff7777;
-            }
-            QPushButton:pressed {
-                background-color: #3d3d3d;
-            }
-            QPushButton:disabled {
-                background-color: #2d2d2d;
-                color: #555;
-                border-color: #444;
-            }
-        """)
+        self.move_up_button.setObjectName("itemMoveButton")
         self.move_up_button.setToolTip("Mover item hacia arriba")
         self.move_up_button.clicked.connect(self._move_item_up)
         self.buttons_layout.addWidget(self.move_up_button)
@@ -437,30 +430,7 @@ class BaseItemWidget(QFrame):
         self.move_down_button = QPushButton("▼")
         self.move_down_button.setFixedSize(32, 24)
         self.move_down_button.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.move_down_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4d4d4d;
-                color: #ff5555;
-                border: 1px solid #555;
-                border-radius: 4px;
-                font-size: 12px;
-                font-weight: bold;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background-color: #5d5d5d;
-                border-color: #ff5555;
-                color: #ff7777;
-            }
-            QPushButton:pressed {
-                background-color: #3d3d3d;
-            }
-            QPushButton:disabled {
-                background-color: #2d2d2d;
-                color: #555;
-                border-color: #444;
-            }
-        """)
+        self.move_down_button.setObjectName("itemMoveButton")
         self.move_down_button.setToolTip("Mover item hacia abajo")
         self.move_down_button.clicked.connect(self._move_item_down)
         self.buttons_layout.addWidget(self.move_down_button)
@@ -469,23 +439,7 @@ class BaseItemWidget(QFrame):
         self.edit_button = QPushButton("🖊️")
         self.edit_button.setFixedSize(32, 24)
         self.edit_button.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.edit_button.setStyleSheet("""
-            QPushButton {
-                background-color: #FF9800;
-                color: #ffffff;
-                border: 1px solid #F57C00;
-                border-radius: 4px;
-                font-size: 14px;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background-color: #FB8C00;
-                border-color: #E65100;
-            }
-            QPushButton:pressed {
-                background-color: #E65100;
-            }
-        """)
+        self.edit_button.setObjectName("itemEditButton")
         self.edit_button.setToolTip("Editar item")
         self.edit_button.clicked.connect(self._edit_item)
         self.buttons_layout.addWidget(self.edit_button)
@@ -494,23 +448,7 @@ class BaseItemWidget(QFrame):
         self.copy_button = QPushButton("📋")
         self.copy_button.setFixedSize(32, 24)
         self.copy_button.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.copy_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: 1px solid #555;
-                border-radius: 4px;
-                font-size: 14px;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-                border-color: #666;
-            }
-            QPushButton:pressed {
-                background-color: #2d2d2d;
-            }
-        """)
+        self.copy_button.setObjectName("itemCopyButton")
         self.copy_button.setToolTip("Copiar contenido")
         self.copy_button.clicked.connect(self.copy_to_clipboard)
         self.buttons_layout.addWidget(self.copy_button)
@@ -525,23 +463,7 @@ class BaseItemWidget(QFrame):
         self.info_btn = QPushButton("ℹ️")
         self.info_btn.setFixedSize(32, 24)
         self.info_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.info_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: #ffffff;
-                border: 1px solid #1976D2;
-                border-radius: 4px;
-                font-size: 14px;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-                border-color: #0d47a1;
-            }
-            QPushButton:pressed {
-                background-color: #0d47a1;
-            }
-        """)
+        self.info_btn.setObjectName("itemInfoButton")
         self.info_btn.setToolTip("Ver detalles del item")
         self.info_btn.clicked.connect(self._show_details)
         self.buttons_layout.addWidget(self.info_btn)
@@ -550,23 +472,7 @@ class BaseItemWidget(QFrame):
         self.delete_btn = QPushButton("🗑️")
         self.delete_btn.setFixedSize(32, 24)
         self.delete_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #d32f2f;
-                color: #ffffff;
-                border: 1px solid #b71c1c;
-                border-radius: 4px;
-                font-size: 14px;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background-color: #c62828;
-                border-color: #8e0000;
-            }
-            QPushButton:pressed {
-                background-color: #b71c1c;
-            }
-        """)
+        self.delete_btn.setObjectName("itemDeleteButton")
         self.delete_btn.setToolTip("Eliminar item")
         self.delete_btn.clicked.connect(self._delete_item)
         self.buttons_layout.addWidget(self.delete_btn)
@@ -624,7 +530,8 @@ class BaseItemWidget(QFrame):
                     if subchild.widget():
                         subchild.widget().deleteLater()
 
-        # Volver a renderizar el contenido
+        # Volver a renderizar el contenido (registra los labels nuevos)
+        self._highlightable_labels = []
         self.render_content()
 
         # Ajustar altura según contenido actualizado
@@ -850,10 +757,11 @@ class BaseItemWidget(QFrame):
         Callback cuando se actualiza el item
 
         Args:
-            updated_item_data: Datos actualizados del item
+            updated_item_data: Campos modificados del item (id incluido)
         """
         # Actualizar datos locales
         self.item_data.update(updated_item_data)
+        self._update_search_haystack()
         logger.info(f"Item {self.item_data.get('id')} actualizado en widget")
 
         # Re-renderizar contenido con los nuevos datos
@@ -1135,57 +1043,25 @@ class BaseItemWidget(QFrame):
 
         Cambia el botón de copiar a verde por 1.5 segundos.
         """
-        # Guardar estilo original
-        original_style = """
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: 1px solid #555;
-                border-radius: 4px;
-                font-size: 14px;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-                border-color: #666;
-            }
-            QPushButton:pressed {
-                background-color: #2d2d2d;
-            }
-        """
-
-        # Estilo de éxito (verde)
-        success_style = """
-            QPushButton {
-                background-color: #4CAF50;
-                color: #ffffff;
-                border: 1px solid #45a049;
-                border-radius: 4px;
-                font-size: 14px;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-                border-color: #3d8b40;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """
-
-        # Cambiar a verde
-        self.copy_button.setStyleSheet(success_style)
+        # Cambiar a verde (regla [copied="true"] de la hoja del grupo)
+        self._set_copy_button_copied(True)
         self.copy_button.setText("✓")  # Cambiar icono temporalmente
 
         # Restaurar después de 1.5 segundos
-        QTimer.singleShot(1500, lambda: self._restore_copy_button_style(original_style))
+        QTimer.singleShot(1500, self._restore_copy_button_style)
+
+    def _restore_copy_button_style(self):
+        """Restaurar estilo original del botón de copiar"""
+        self._set_copy_button_copied(False)
+        self.copy_button.setText("📋")  # Restaurar icono original
 
-    def _restore_copy_button_style(self, original_style: str):
+    def _set_copy_button_copied(self, copied: bool):
         """
-        Restaurar estilo original del botón de copiar
+        Activar/desactivar el estado "copiado" del botón de copiar
 
         Args:
-            original_style: Estilo CSS original del botón
+            copied: True para mostrarlo en verde
         """
-        self.copy_button.setStyleSheet(original_style)
-        self.copy_button.setText("📋")  # Restaurar icono original
+        self.copy_button.setProperty("copied", copied)
+        self.copy_button.style().unpolish(self.copy_button)
+        self.copy_button.style().polish(self.copy_button)
@@ -12,7 +12,6 @@ from PyQt6.QtWidgets import QLabel, QPushButton, QSizePolicy
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QCursor
 from .base_item_widget import BaseItemWidget
-from ...styles.full_view_styles import FullViewStyles
 from ..common.copy_button import CopyButton
 import subprocess
 import platform
@@ -47,7 +46,6 @@ class CodeItemWidget(BaseItemWidget):
         self.content_label = None
         self.toggle_button = None
         super().__init__(item_data, parent)
-        self.apply_styles()
 
     def _create_action_buttons(self):
         """
@@ -213,6 +211,7 @@ class CodeItemWidget(BaseItemWidget):
         label = self.get_item_label()
         if label and label != 'Sin título':
             title_label = QLabel(f"$ {label}")
+            self._register_label(title_label)
             title_label.setWordWrap(True)
             title_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
             title_label.setStyleSheet("""
@@ -231,6 +230,7 @@ class CodeItemWidget(BaseItemWidget):
         if content:
             # Crear label para el código (sin límites, 100% responsive)
             self.content_label = QLabel()
+            self._register_label(self.content_label)
             self.content_label.setObjectName("code_content")
             self.content_label.setWordWrap(True)  # IMPORTANTE: ajustar al ancho
             self.content_label.setTextInteractionFlags(
@@ -297,7 +297,3 @@ class CodeItemWidget(BaseItemWidget):
             self.content_label.setText(content)
             self.toggle_button.setText("▲ Colapsar")
             self.is_expanded = True
-
-    def apply_styles(self):
-        """Aplicar estilos CSS"""
-        self.setStyleSheet(FullViewStyles.get_code_item_style())
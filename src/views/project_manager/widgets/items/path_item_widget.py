@@ -12,7 +12,6 @@ from PyQt6.QtWidgets import QLabel, QHBoxLayout, QPushButton, QSizePolicy
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QCursor
 from .base_item_widget import BaseItemWidget
-from ...styles.full_view_styles import FullViewStyles
 from ..common.copy_button import CopyButton
 import subprocess
 import os
@@ -49,7 +48,6 @@ class PathItemWidget(BaseItemWidget):
         self.content_label = None
         self.toggle_button = None
         super().__init__(item_data, parent)
-        self.apply_styles()
 
     def _create_action_buttons(self):
         """
@@ -215,6 +213,7 @@ class PathItemWidget(BaseItemWidget):
         label = self.get_item_label()
         if label and label != 'Sin título':
             title_label = QLabel(label)
+            self._register_label(title_label)
             title_label.setWordWrap(True)
             title_label.setMaximumWidth(680)  # Menor porque hay icono
             title_label.setStyleSheet("""
@@ -233,6 +232,7 @@ class PathItemWidget(BaseItemWidget):
         # Path clickeable
         if path_content:
             self.content_label = QLabel()
+            self._register_label(self.content_label)
             self.content_label.setObjectName("path_text")
             self.content_label.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
             self.content_label.setTextInteractionFlags(
@@ -289,6 +289,7 @@ class PathItemWidget(BaseItemWidget):
         description = self.get_item_description()
         if description:
             desc_label = QLabel(description)
+            self._register_label(desc_label)
             desc_label.setStyleSheet("""
                 color: #808080;
                 font-size: 12px;
@@ -331,7 +332,3 @@ class PathItemWidget(BaseItemWidget):
                 print(f"✗ Path no existe: {path}")
         except Exception as e:
             print(f"✗ Error al abrir path: {e}")
-
-    def apply_styles(self):
-        """Aplicar estilos CSS"""
-        self.setStyleSheet(FullViewStyles.get_path_item_style())
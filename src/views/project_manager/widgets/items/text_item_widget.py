@@ -11,7 +11,6 @@ Versión: 2.0
 from PyQt6.QtWidgets import QLabel, QPushButton, QSizePolicy
 from PyQt6.QtCore import Qt
 from .base_item_widget import BaseItemWidget
-from ...styles.full_view_styles import FullViewStyles
 
 
 class TextItemWidget(BaseItemWidget):
@@ -39,7 +38,6 @@ class TextItemWidget(BaseItemWidget):
         self.content_label = None
         self.toggle_button = None
         super().__init__(item_data, parent)
-        self.apply_styles()
 
     def render_content(self):
         """Renderizar contenido de texto sin límites ni scroll"""
@@ -47,6 +45,7 @@ class TextItemWidget(BaseItemWidget):
         label = self.get_item_label()
         if label and label != 'Sin título':
             title_label = QLabel(f"• {label}")
+            self._register_label(title_label)
             title_label.setWordWrap(True)
             title_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
             title_label.setStyleSheet("""
@@ -65,6 +64,7 @@ class TextItemWidget(BaseItemWidget):
         if content:
             # Crear label para el contenido (sin límites, 100% responsive)
             self.content_label = QLabel()
+            self._register_label(self.content_label)
             self.content_label.setObjectName("text_content")
             self.content_label.setWordWrap(True)  # IMPORTANTE: ajustar al ancho
             self.content_label.setTextInteractionFlags(
@@ -119,6 +119,7 @@ class TextItemWidget(BaseItemWidget):
         description = self.get_item_description()
         if description:
             desc_label = QLabel(description)
+            self._register_label(desc_label)
             desc_label.setStyleSheet("""
                 color: #808080;
                 font-size: 12px;
@@ -144,7 +145,3 @@ class TextItemWidget(BaseItemWidget):
             self.content_label.setText(content)
             self.toggle_button.setText("▲ Colapsar")
             self.is_expanded = True
-
-    def apply_styles(self):
-        """Aplicar estilos CSS"""
-        self.setStyleSheet(FullViewStyles.get_text_item_style())
@@ -12,7 +12,6 @@ from PyQt6.QtWidgets import QLabel, QHBoxLayout, QPushButton, QSizePolicy
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QCursor
 from .base_item_widget import BaseItemWidget
-from ...styles.full_view_styles import FullViewStyles
 from ..common.copy_button import CopyButton
 import webbrowser
 import logging
@@ -47,7 +46,6 @@ class URLItemWidget(BaseItemWidget):
         self.content_label = None
         self.toggle_button = None
         super().__init__(item_data, parent)
-        self.apply_styles()
 
     def _create_action_buttons(self):
         """
@@ -198,6 +196,7 @@ class URLItemWidget(BaseItemWidget):
         label = self.get_item_label()
         if label and label != 'Sin título':
             title_label = QLabel(label)
+            self._register_label(title_label)
             title_label.setWordWrap(True)
             title_label.setMaximumWidth(680)  # Menor porque hay icono
             title_label.setStyleSheet("""
@@ -217,6 +216,7 @@ class URLItemWidget(BaseItemWidget):
         content = self.get_item_content()
         if content:
             self.content_label = QLabel()
+            self._register_label(self.content_label)
             self.content_label.setObjectName("url_text")
             self.content_label.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
             self.content_label.setTextInteractionFlags(
@@ -274,6 +274,7 @@ class URLItemWidget(BaseItemWidget):
         description = self.get_item_description()
         if description:
             desc_label = QLabel(description)
+            self._register_label(desc_label)
             desc_label.setStyleSheet("""
                 color: #808080;
                 font-size: 12px;
@@ -312,7 +313,3 @@ class URLItemWidget(BaseItemWidget):
             print(f"✓ URL abierta: {url}")
         except Exception as e:
             print(f"✗ Error al abrir URL: {e}")
-
-    def apply_styles(self):
-        """Aplicar estilos CSS"""
-        self.setStyleSheet(FullViewStyles.get_url_item_style())
@@ -11,7 +11,6 @@ from PyQt6.QtWidgets import QLabel, QHBoxLayout, QPushButton, QSizePolicy
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QCursor
 from .base_item_widget import BaseItemWidget
-from ...styles.full_view_styles import FullViewStyles
 from ..common.copy_button import CopyButton
 import logging
 
@@ -37,7 +36,6 @@ class WebStaticItemWidget(BaseItemWidget):
             parent: Widget padre
         """
         super().__init__(item_data, parent)
-        self.apply_styles()
 
     def _create_action_buttons(self):
         """
@@ -132,6 +130,7 @@ class WebStaticItemWidget(BaseItemWidget):
         label = self.get_item_label()
         if label and label != 'Sin título':
             title_label = QLabel(label)
+            self._register_label(title_label)
             title_label.setWordWrap(True)
             title_label.setMaximumWidth(680)
             title_label.setStyleSheet("""
@@ -156,6 +155,7 @@ class WebStaticItemWidget(BaseItemWidget):
                 preview_text += '\n...'
 
             preview_label = QLabel(preview_text)
+            self._register_label(preview_label)
             preview_label.setStyleSheet("""
                 color: #90EE90;
                 font-family: 'Consolas', 'Courier New', monospace;
@@ -176,6 +176,7 @@ class WebStaticItemWidget(BaseItemWidget):
         description = self.get_item_description()
         if description:
             desc_label = QLabel(description)
+            self._register_label(desc_label)
             desc_label.setStyleSheet("""
                 color: #808080;
                 font-size: 12px;
@@ -185,7 +186,3 @@ class WebStaticItemWidget(BaseItemWidget):
             """)
             desc_label.setWordWrap(True)
             self.content_layout.addWidget(desc_label)
-
-    def apply_styles(self):
-        """Aplicar estilos CSS"""
-        self.setStyleSheet(FullViewStyles.get_web_static_item_style())
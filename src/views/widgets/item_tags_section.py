@@ -360,24 +360,30 @@ class ItemTagsSection(QWidget):
             logger.warning("No hay tag_manager configurado")
             return
 
-        # Limpiar selección actual
-        self.clear_selection()
-
-        # Cargar tags
-        for tag_name in tag_names:
-            tag = self.tag_manager.get_tag_by_name(tag_name)
-            if tag:
-                self.selected_tags.append(tag)
-                self._add_chip(tag)
-            else:
-                # Si el tag no existe, crearlo
-                logger.info(f"Tag '{tag_name}' no existe, creándolo...")
-                tag = self.tag_manager.create_tag(name=tag_name, color="#3498db")
+        # Agregar todos los chips con un único relayout/repintado al final
+        self.setUpdatesEnabled(False)
+        try:
+            # Limpiar selección actual
+            self.clear_selection()
+
+            # Cargar tags
+            for tag_name in tag_names:
+                tag = self.tag_manager.get_tag_by_name(tag_name)
                 if tag:
                     self.selected_tags.append(tag)
                     self._add_chip(tag)
+                else:
+                    # Si el tag no existe, crearlo
+                    logger.info(f"Tag '{tag_name}' no existe, creándolo...")
+                    tag = self.tag_manager.create_tag(name=tag_name, color="#3498db")
+                    if tag:
+                        self.selected_tags.append(tag)
+                        self._add_chip(tag)
+
+            self._update_empty_label()
+        finally:
+            self.setUpdatesEnabled(True)
 
-        self._update_empty_label()
         logger.info(f"Tags establecidos: {tag_names}")
 
     def clear_selection(self):
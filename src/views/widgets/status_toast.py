@@ -0,0 +1,62 @@
+"""
+Status Toast Widget
+Mensaje breve superpuesto a una ventana que se oculta solo
+"""
+from PyQt6.QtWidgets import QLabel, QWidget
+from PyQt6.QtCore import Qt, QTimer
+
+# Estilo compartido por todos los toasts
+_STATUS_TOAST_QSS = """
+    QLabel {
+        background-color: rgba(30, 30, 30, 0.92);
+        color: #ffffff;
+        border: 1px solid #00ff88;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-size: 11px;
+    }
+"""
+
+
+class StatusToast(QLabel):
+    """
+    Etiqueta no bloqueante que se muestra sobre la parte inferior de su
+    ventana padre y se elimina sola tras unos segundos
+    """
+
+    DEFAULT_DURATION_MS = 2000
+    BOTTOM_MARGIN = 30
+
+    def __init__(self, text: str, parent: QWidget):
+        super().__init__(text, parent)
+        self.setStyleSheet(_STATUS_TOAST_QSS)
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.adjustSize()
+
+    @classmethod
+    def show_message(cls, parent: QWidget, text: str, duration_ms: int = DEFAULT_DURATION_MS):
+        """
+        Mostrar un toast sobre la ventana de parent
+
+        Args:
+            parent: Widget cuya ventana mostrará el toast (None = no se muestra)
+            text: Mensaje
+            duration_ms: Tiempo visible en milisegundos
+
+        Returns:
+            El toast creado, o None si no hay ventana donde mostrarlo
+        """
+        if parent is None:
+            return None
+
+        window = parent.window()
+        toast = cls(text, window)
+        toast.move(
+            (window.width() - toast.width()) // 2,
+            window.height() - toast.height() - cls.BOTTOM_MARGIN
+        )
+        toast.raise_()
+        toast.show()
+        QTimer.singleShot(duration_ms, toast.deleteLater)
+        return toast